@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .async_live_connection import AsyncLiveConnection, SpikeBatch
 from .ethernet_command_connection import EthernetCommandConnection
 from .ethernet_control_connection import EthernetControlConnection
 from .spif_live_spikes_connection import SPIFLiveSpikesConnection
@@ -21,9 +22,11 @@ from .spynnaker_poisson_control_connection import (
 )
 
 __all__ = [
+    "AsyncLiveConnection",
     "EthernetCommandConnection",
     "EthernetControlConnection",
     "SPIFLiveSpikesConnection",
+    "SpikeBatch",
     "SpynnakerLiveSpikesConnection",
     "SpynnakerPoissonControlConnection"
 ]
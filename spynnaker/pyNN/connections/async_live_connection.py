@@ -0,0 +1,229 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, Final, NamedTuple, TypeAlias
+
+import numpy
+from numpy import uint32
+from numpy.typing import NDArray
+
+from spinn_utilities.log import FormatAdapter
+
+from spinn_front_end_common.utilities.connections import LiveEventConnection
+
+from .spif_live_spikes_connection import SPIFLiveSpikesConnection
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The default maximum number of received batches waiting to be read
+DEFAULT_MAX_QUEUED_BATCHES = 1024
+
+
+class SpikeBatch(NamedTuple):
+    """
+    A batch of spikes received from a vertex in one go.
+    """
+    #: The label of the vertex that sent the spikes
+    label: str
+    #: The time step of the spikes, or `None` if not known (e.g. from SPIF)
+    time: int | None
+    #: The atom IDs or keys of the spikes
+    ids: NDArray[uint32]
+
+
+#: A coroutine function called on start or resume, or on pause or stop
+Hook: Final['TypeAlias'] = Callable[
+    [str, 'AsyncLiveConnection'], Awaitable[None]]
+
+
+class SpikeBatchIterator(AsyncIterator[SpikeBatch]):
+    """
+    An asynchronous iterator of the batches of spikes received from a vertex.
+    Iteration ends when the connection is closed.
+    """
+    __slots__ = (
+        "__closed",
+        "__loop",
+        "__max_queued_batches",
+        "__n_batches_dropped",
+        "__queue")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop,
+                 max_queued_batches: int):
+        """
+        :param loop: The event loop that the batches will be read on
+        :param max_queued_batches:
+            The most batches that can be waiting to be read; batches received
+            beyond this are dropped
+        """
+        self.__closed = False
+        self.__loop = loop
+        self.__max_queued_batches = max_queued_batches
+        self.__n_batches_dropped = 0
+        self.__queue: asyncio.Queue[SpikeBatch | None] = asyncio.Queue()
+
+    @property
+    def n_batches_dropped(self) -> int:
+        """
+        The number of batches dropped because too many were waiting.
+        """
+        return self.__n_batches_dropped
+
+    def put_threadsafe(self, batch: SpikeBatch | None) -> None:
+        """
+        Add a batch from any thread.
+
+        :param batch: The batch to add, or `None` to end the iteration
+        """
+        self.__loop.call_soon_threadsafe(self.__put, batch)
+
+    def __put(self, batch: SpikeBatch | None) -> None:
+        if self.__closed:
+            return
+        if batch is None:
+            self.__closed = True
+        elif self.__queue.qsize() >= self.__max_queued_batches:
+            self.__n_batches_dropped += 1
+            return
+        self.__queue.put_nowait(batch)
+
+    def __aiter__(self) -> "SpikeBatchIterator":
+        return self
+
+    async def __anext__(self) -> SpikeBatch:
+        batch = await self.__queue.get()
+        if batch is None:
+            # Leave the end marker for anyone else waiting
+            self.__queue.put_nowait(None)
+            raise StopAsyncIteration
+        return batch
+
+
+class AsyncLiveConnection:
+    """
+    An asyncio interface to a live connection.  Received spikes are read
+    as batches from asynchronous iterators, and start and pause hooks are
+    coroutines run on the event loop, rather than callbacks run on the
+    threads of the connection.
+
+    Spikes and rates can be sent with the awaitable
+    :py:meth:`~.SpynnakerLiveSpikesConnection.send_spikes_async` and
+    :py:meth:`~.SpynnakerPoissonControlConnection.set_rates_async` of the
+    wrapped connection.
+
+    .. note::
+        This must be created while the event loop is running.
+    """
+    __slots__ = (
+        "__connection",
+        "__iterators",
+        "__loop")
+
+    def __init__(
+            self, connection: LiveEventConnection | SPIFLiveSpikesConnection):
+        """
+        :param connection: The connection to wrap
+        :raises RuntimeError: If there is no running event loop
+        """
+        self.__connection = connection
+        self.__iterators: list[SpikeBatchIterator] = []
+        self.__loop = asyncio.get_running_loop()
+
+    @property
+    def connection(self) -> LiveEventConnection | SPIFLiveSpikesConnection:
+        """
+        The wrapped connection.
+        """
+        return self.__connection
+
+    def receive(
+            self, label: str, translate_key: bool = True,
+            max_queued_batches: int = DEFAULT_MAX_QUEUED_BATCHES
+            ) -> SpikeBatchIterator:
+        """
+        Get the batches of spikes received from a vertex.  Spikes are
+        collected from when this is called, not from when iteration starts.
+
+        :param label: The label of the vertex to receive from.
+            Must be one of the receive labels of the connection
+        :param translate_key:
+            True if the keys are to be converted to atom IDs, False if the
+            keys should stay keys
+        :param max_queued_batches:
+            The most batches that can be waiting to be read; batches received
+            beyond this are dropped
+        :return: An asynchronous iterator of the batches
+        """
+        iterator = SpikeBatchIterator(self.__loop, max_queued_batches)
+        self.__iterators.append(iterator)
+
+        if isinstance(self.__connection, SPIFLiveSpikesConnection):
+            def spif_callback(label: str, ids: NDArray[uint32]) -> None:
+                iterator.put_threadsafe(SpikeBatch(label, None, ids))
+            self.__connection.add_receive_callback(
+                label, spif_callback, translate_key, as_array=True)
+        else:
+            def callback(label: str, time: int, ids: list[int]) -> None:
+                iterator.put_threadsafe(
+                    SpikeBatch(label, time, numpy.array(ids, dtype=uint32)))
+            self.__connection.add_receive_callback(
+                label, callback, translate_key)
+        return iterator
+
+    def add_start_resume_hook(self, label: str, hook: Hook) -> None:
+        """
+        Add a coroutine function to run on the event loop when the
+        simulation starts or resumes.
+
+        :param label: The label of the vertex the hook is about
+        :param hook: The coroutine function, which will be called with the
+            label and this connection
+        """
+        self.__connection.add_start_resume_callback(
+            label, self.__hook_callback(hook))
+
+    def add_pause_stop_hook(self, label: str, hook: Hook) -> None:
+        """
+        Add a coroutine function to run on the event loop when the
+        simulation pauses or stops.
+
+        :param label: The label of the vertex the hook is about
+        :param hook: The coroutine function, which will be called with the
+            label and this connection
+        """
+        self.__connection.add_pause_stop_callback(
+            label, self.__hook_callback(hook))
+
+    def __hook_callback(self, hook: Hook) -> Callable[[str, Any], None]:
+        # The connection calls this in a thread of its own, so waiting for
+        # the coroutine to finish doesn't hold anything else up
+        def callback(label: str, _connection: Any) -> None:
+            # pylint: disable=broad-except
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    hook(label, self), self.__loop).result()
+            except Exception:
+                logger.warning("problem running hook {}", hook, exc_info=True)
+        return callback
+
+    def close(self) -> None:
+        """
+        Close the wrapped connection and end iteration of received batches.
+        """
+        self.__connection.close()
+        for iterator in self.__iterators:
+            iterator.put_threadsafe(None)
@@ -0,0 +1,302 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from queue import SimpleQueue
+from threading import Lock, Thread
+
+import numpy
+from numpy import integer, uint32
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.overrides import overrides
+
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import (
+    EIEIODataHeader,
+    EIEIODataMessage,
+)
+
+from spinn_front_end_common.utilities.connections import LiveEventConnection
+from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The maximum number of events of each type that will fit in a packet
+_MAX_EVENTS_PER_PACKET = {
+    EIEIOType.KEY_16_BIT: 127,
+    EIEIOType.KEY_32_BIT: 63,
+    EIEIOType.KEY_PAYLOAD_16_BIT: 63,
+    EIEIOType.KEY_PAYLOAD_32_BIT: 31,
+}
+
+#: The default maximum number of events waiting to be sent
+DEFAULT_MAX_QUEUED_EVENTS = 1 << 20
+
+# The maximum number of packets to send before pausing when pacing
+_MAX_SEND_BEFORE_PAUSE = 6
+
+# The time to pause for when pacing in seconds
+_PAUSE_SECONDS = 0.1
+
+
+class PackedEIEIODataMessage(EIEIODataMessage):
+    """
+    An EIEIO data message whose keys (and payloads) are already packed.
+    """
+    __slots__ = ()
+
+    def __init__(self, eieio_type: EIEIOType, n_events: int, elements: bytes):
+        """
+        :param eieio_type: The type of the message
+        :param n_events: The number of events in the message
+        :param elements: The packed keys, or keys and payloads, of the events
+        """
+        super().__init__(EIEIODataHeader(eieio_type, count=n_events))
+        self._elements = elements
+
+
+def pack_events(
+        eieio_type: EIEIOType, keys: NDArray[integer],
+        payloads: NDArray[integer] | None = None
+        ) -> list[PackedEIEIODataMessage]:
+    """
+    Pack events into as few EIEIO data messages as possible.
+
+    :param eieio_type: The type of messages to create
+    :param keys: The key of each event
+    :param payloads:
+        The payload of each event if the type of message has payloads
+    :return: The messages holding all the events in order
+    :raises \
+        ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+        If a key or payload doesn't fit in the type of message
+    """
+    dtype = numpy.dtype("<u2" if eieio_type.key_bytes == 2 else "<u4")
+    if payloads is None:
+        words = numpy.asarray(keys)
+    else:
+        words = numpy.column_stack((keys, payloads)).ravel()
+    if len(words) and (words.min() < 0 or words.max() > eieio_type.max_value):
+        raise ConfigurationException(
+            f"Keys and payloads of {eieio_type} must be between 0 and "
+            f"{eieio_type.max_value}")
+    data = words.astype(dtype).tobytes()
+
+    n_events = len(keys)
+    max_events = _MAX_EVENTS_PER_PACKET[eieio_type]
+    event_bytes = eieio_type.key_bytes + eieio_type.payload_bytes
+    return [
+        PackedEIEIODataMessage(
+            eieio_type, min(max_events, n_events - start),
+            data[start * event_bytes:(start + max_events) * event_bytes])
+        for start in range(0, n_events, max_events)]
+
+
+class BatchedLiveEventConnection(LiveEventConnection):
+    """
+    A live event connection which can send numpy arrays of events, packed
+    into full packets, either straight away or through a bounded queue that
+    is emptied by a background thread.
+    """
+    __slots__ = (
+        "__key_lookups",
+        "__max_queued_events",
+        "__n_events_dropped",
+        "__n_events_queued",
+        "__n_events_sent",
+        "__send_lock",
+        "__send_queue",
+        "__send_thread")
+
+    def __init__(self, live_packet_gather_label: str | None,
+                 receive_labels: Iterable[str] | None = None,
+                 send_labels: Iterable[str] | None = None,
+                 local_host: str | None = None,
+                 local_port: int | None = NOTIFY_PORT,
+                 max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS):
+        """
+        :param live_packet_gather_label:
+            The label of the vertex to which received events are being sent.
+            If `None`, no receive labels may be specified.
+        :param receive_labels:
+            Labels of vertices from which live events will be received.
+        :param send_labels:
+            Labels of vertices to which live events will be sent
+        :param local_host:
+            Optional specification of the local hostname or IP address of the
+            interface to listen on
+        :param local_port:
+            Optional specification of the local port to listen on. Must match
+            the port that the toolchain will send the notification on (19999
+            by default)
+        :param max_queued_events:
+            The most events that can be waiting in the send queue; events
+            queued beyond this are dropped
+        """
+        super().__init__(
+            live_packet_gather_label, receive_labels, send_labels,
+            local_host, local_port)
+        self.__key_lookups: dict[str, tuple[
+            dict[int, int], NDArray[uint32], NDArray[numpy.bool_]]] = {}
+        self.__max_queued_events = max_queued_events
+        self.__n_events_dropped = 0
+        self.__n_events_queued = 0
+        self.__n_events_sent = 0
+        self.__send_lock = Lock()
+        self.__send_queue: SimpleQueue[
+            tuple[str, PackedEIEIODataMessage] | None] = SimpleQueue()
+        self.__send_thread: Thread | None = None
+
+    @property
+    def n_events_sent(self) -> int:
+        """
+        The number of events sent from the send queue.
+        """
+        return self.__n_events_sent
+
+    @property
+    def n_events_dropped(self) -> int:
+        """
+        The number of events dropped because the send queue was full, or
+        because they could not be sent.
+        """
+        return self.__n_events_dropped
+
+    @property
+    def n_events_queued(self) -> int:
+        """
+        The number of events currently waiting in the send queue.
+        """
+        return self.__n_events_queued
+
+    def _atom_ids_to_keys(
+            self, label: str, atom_ids: ArrayLike) -> NDArray[uint32]:
+        """
+        Get the keys of atoms of a vertex.
+
+        :param label: The label of the vertex
+        :param atom_ids: The IDs of the atoms
+        :return: The key of each atom
+        :raises KeyError: If an atom does not have a key
+        """
+        mapping = self._atom_id_to_key[label]
+        cached = self.__key_lookups.get(label)
+        if cached is None or cached[0] is not mapping:
+            ids = numpy.fromiter(mapping.keys(), dtype=numpy.int64)
+            size = int(ids.max(initial=-1)) + 1
+            lookup = numpy.zeros(size, dtype=uint32)
+            lookup[ids] = numpy.fromiter(mapping.values(), dtype=uint32)
+            has_key = numpy.zeros(size, dtype=numpy.bool_)
+            has_key[ids] = True
+            cached = (mapping, lookup, has_key)
+            self.__key_lookups[label] = cached
+        _, lookup, has_key = cached
+        ids = numpy.asarray(atom_ids, dtype=numpy.int64)
+        valid = (ids >= 0) & (ids < len(lookup))
+        valid[valid] = has_key[ids[valid]]
+        if not valid.all():
+            raise KeyError(int(ids[~valid].flat[0]))
+        return lookup[ids]
+
+    def _send_packed(
+            self, label: str,
+            messages: Iterable[PackedEIEIODataMessage]) -> None:
+        """
+        Send messages straight away.
+
+        :param label: The label of the vertex to send to
+        :param messages: The messages to send
+        """
+        for message in messages:
+            self.send_eieio_message(message, label)
+
+    async def _send_packed_async(
+            self, label: str,
+            messages: Iterable[PackedEIEIODataMessage]) -> None:
+        """
+        Send messages, pausing without blocking the event loop every few
+        packets, as the list-based send methods do.
+
+        :param label: The label of the vertex to send to
+        :param messages: The messages to send
+        """
+        for n_sent, message in enumerate(messages):
+            if n_sent and n_sent % _MAX_SEND_BEFORE_PAUSE == 0:
+                await asyncio.sleep(_PAUSE_SECONDS)
+            self.send_eieio_message(message, label)
+
+    def _queue_packed(
+            self, label: str,
+            messages: Iterable[PackedEIEIODataMessage]) -> int:
+        """
+        Add messages to the send queue, dropping any that don't fit.
+
+        :param label: The label of the vertex to send to
+        :param messages: The messages to send
+        :return: The number of events queued
+        """
+        n_queued = 0
+        with self.__send_lock:
+            if self.__send_thread is None:
+                self.__send_thread = Thread(
+                    target=self.__run_send_queue, daemon=True, name=(
+                        "send queue thread for live_event_connection "
+                        f"{self._local_port}:{self._local_ip_address}"))
+                self.__send_thread.start()
+            for message in messages:
+                n_events = message.eieio_header.count
+                if (self.__n_events_queued + n_events >
+                        self.__max_queued_events):
+                    self.__n_events_dropped += n_events
+                    continue
+                self.__n_events_queued += n_events
+                n_queued += n_events
+                self.__send_queue.put((label, message))
+        return n_queued
+
+    def __run_send_queue(self) -> None:
+        # pylint: disable=broad-except
+        while True:
+            item = self.__send_queue.get()
+            if item is None:
+                return
+            label, message = item
+            n_events = message.eieio_header.count
+            try:
+                self.send_eieio_message(message, label)
+                sent = True
+            except Exception:
+                logger.warning("problem sending queued events", exc_info=True)
+                sent = False
+            with self.__send_lock:
+                self.__n_events_queued -= n_events
+                if sent:
+                    self.__n_events_sent += n_events
+                else:
+                    self.__n_events_dropped += n_events
+
+    @overrides(LiveEventConnection.close)
+    def close(self) -> None:
+        with self.__send_lock:
+            send_thread = self.__send_thread
+            self.__send_thread = None
+        if send_thread is not None:
+            self.__send_queue.put(None)
+            send_thread.join()
+        super().close()
@@ -16,7 +16,11 @@ import logging
 import struct
 from collections.abc import Callable, Iterable
 from threading import Thread
-from typing import Final, TypeAlias
+from typing import Any, Final, TypeAlias
+
+import numpy
+from numpy import bool_, int64, uint32
+from numpy.typing import NDArray
 
 from spinn_utilities.log import FormatAdapter
 
@@ -30,6 +34,7 @@ from spinn_front_end_common.utilities.database import (
 )
 
 Event: Final['TypeAlias'] = Callable[[str, list[int]], None]
+ArrayEvent: Final['TypeAlias'] = Callable[[str, NDArray[uint32]], None]
 Init: Final['TypeAlias'] = Callable[[str, int, float, float], None]
 StartStop: Final['TypeAlias'] = Callable[
     [str, 'SPIFLiveSpikesConnection'], None]
@@ -62,6 +67,75 @@ _SPIF_OUTPUT_SET_TICK = 0x5ec20000
 # SPIF message to set packet size (size is added to this in bytes)
 _SPIF_OUTPUT_SET_LEN = 0x5ec40000
 
+# The most entries per known key that a direct-index lookup table may have
+_MAX_DENSE_ENTRIES_PER_KEY = 4
+
+
+class _KeyLookup:
+    """
+    Maps received keys to atom IDs and label IDs a whole packet at a time.
+
+    If the known keys are dense enough, a table indexed directly by key is
+    used; otherwise the keys are found by binary search in a sorted array.
+    """
+    __slots__ = (
+        "__atom_ids",
+        "__base_key",
+        "__index",
+        "__label_ids",
+        "__sorted_keys")
+
+    def __init__(self, keys: NDArray[uint32], atom_ids: NDArray[uint32],
+                 label_ids: NDArray[uint32]):
+        """
+        :param keys: The known keys, which must be unique
+        :param atom_ids: The atom ID of each key
+        :param label_ids: The label ID of each key
+        """
+        order = numpy.argsort(keys, kind="stable")
+        self.__sorted_keys = keys[order]
+        self.__atom_ids = atom_ids[order]
+        self.__label_ids = label_ids[order]
+        self.__base_key = 0
+        self.__index: NDArray[int64] | None = None
+        n_keys = len(self.__sorted_keys)
+        if n_keys:
+            self.__base_key = int(self.__sorted_keys[0])
+            span = int(self.__sorted_keys[-1]) - self.__base_key + 1
+            if span <= n_keys * _MAX_DENSE_ENTRIES_PER_KEY:
+                self.__index = numpy.full(span, -1, dtype=int64)
+                self.__index[self.__sorted_keys - self.__base_key] = (
+                    numpy.arange(n_keys))
+
+    def lookup(self, keys: NDArray[uint32]) -> tuple[
+            NDArray[bool_], NDArray[uint32], NDArray[uint32]]:
+        """
+        Look up some received keys.
+
+        :param keys: The keys to look up
+        :return:
+            Which of the keys are known, and the atom ID and label ID of each
+            of the known keys
+        """
+        if self.__index is not None:
+            offsets = keys.astype(int64) - self.__base_key
+            in_range = (offsets >= 0) & (offsets < len(self.__index))
+            indices = numpy.full(len(keys), -1, dtype=int64)
+            indices[in_range] = self.__index[offsets[in_range]]
+            found = indices >= 0
+            indices = indices[found]
+        else:
+            n_keys = len(self.__sorted_keys)
+            if not n_keys:
+                return (numpy.zeros(len(keys), dtype=bool_),
+                        numpy.zeros(0, dtype=uint32),
+                        numpy.zeros(0, dtype=uint32))
+            indices = numpy.minimum(
+                numpy.searchsorted(self.__sorted_keys, keys), n_keys - 1)
+            found = self.__sorted_keys[indices] == keys
+            indices = indices[found]
+        return found, self.__atom_ids[indices], self.__label_ids[indices]
+
 
 class SPIFLiveSpikesConnection(DatabaseConnection):
     """
@@ -71,7 +145,7 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
     __slots__ = (
         "__error_keys",
         "__init_callbacks",
-        "__key_to_atom_id_and_label",
+        "__key_lookup",
         "__live_event_callbacks",
         "__pause_stop_callbacks",
         "__receive_labels",
@@ -124,8 +198,11 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         self.__spif_port = spif_port
         self.__spif_packet_size = events_per_packet * BYTES_PER_WORD
         self.__spif_packet_time_us = time_per_packet
-        self.__key_to_atom_id_and_label: dict[int, tuple[int, int]] = {}
-        self.__live_event_callbacks: list[list[tuple[Event, bool]]] = []
+        self.__key_lookup = _KeyLookup(
+            numpy.zeros(0, dtype=uint32), numpy.zeros(0, dtype=uint32),
+            numpy.zeros(0, dtype=uint32))
+        self.__live_event_callbacks: list[list[
+            tuple[Callable[[str, Any], None], bool, bool]]] = []
         self.__start_resume_callbacks: dict[str, list[StartStop]] = {}
         self.__pause_stop_callbacks: dict[str, list[StartStop]] = {}
         self.__init_callbacks: dict[str, list[Init]] = {}
@@ -169,8 +246,8 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         self.__init_callbacks[label].append(init_callback)
 
     def add_receive_callback(
-            self, label: str, live_event_callback: Event,
-            translate_key: bool = True) -> None:
+            self, label: str, live_event_callback: Event | ArrayEvent,
+            translate_key: bool = True, as_array: bool = False) -> None:
         """
         Add a callback for the reception of live events from a vertex.
 
@@ -182,13 +259,16 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         :param translate_key:
             True if the key is to be converted to an atom ID, False if the
             key should stay a key
+        :param as_array:
+            True if the atom IDs or keys should be passed to the callback as
+            a numpy array rather than a list
         """
         label_id = self.__receive_labels.index(label)
         logger.info(
             "Receive callback {} registered to label {}",
             live_event_callback, label)
         self.__live_event_callbacks[label_id].append(
-            (live_event_callback, translate_key))
+            (live_event_callback, translate_key, as_array))
 
     def add_start_resume_callback(
             self, label: str, start_resume_callback: StartStop) -> None:
@@ -240,11 +320,21 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
         if self.__receiver_connection is None:
             self.__receiver_connection = UDPConnection(
                 remote_host=self.__spif_host, remote_port=self.__spif_port)
+        keys: list[NDArray[uint32]] = []
+        atom_ids: list[NDArray[uint32]] = []
+        label_ids: list[NDArray[uint32]] = []
         for label_id, label in enumerate(self.__receive_labels):
             key_to_atom_id = db.get_key_to_atom_id_mapping(label)
-            for key, atom_id in key_to_atom_id.items():
-                self.__key_to_atom_id_and_label[key] = (atom_id, label_id)
-            vertex_sizes[label] = len(key_to_atom_id)
+            n_keys = len(key_to_atom_id)
+            keys.append(numpy.fromiter(
+                key_to_atom_id.keys(), dtype=uint32, count=n_keys))
+            atom_ids.append(numpy.fromiter(
+                key_to_atom_id.values(), dtype=uint32, count=n_keys))
+            label_ids.append(numpy.full(n_keys, label_id, dtype=uint32))
+            vertex_sizes[label] = n_keys
+        self.__key_lookup = _KeyLookup(
+            numpy.concatenate(keys), numpy.concatenate(atom_ids),
+            numpy.concatenate(label_ids))
 
         # Last of all, set up the listener for packets
         # NOTE: Has to be done last as otherwise will receive SCP messages
@@ -301,28 +391,26 @@ class SPIFLiveSpikesConnection(DatabaseConnection):
             logger.warning("problem handling received packet", exc_info=True)
 
     def __handle_packet(self, packet: bytes) -> None:
-        key_labels: dict[int, list[int]] = {}
-        atoms_labels: dict[int, list[int]] = {}
         n_events = len(packet) // BYTES_PER_WORD
-        events = struct.unpack(f"<{n_events}I", packet)
-        for key in events:
-            if key in self.__key_to_atom_id_and_label:
-                atom_id, label_id = self.__key_to_atom_id_and_label[key]
-                if label_id not in key_labels:
-                    key_labels[label_id] = []
-                    atoms_labels[label_id] = []
-                key_labels[label_id].append(key)
-                atoms_labels[label_id].append(atom_id)
-            else:
-                self.__handle_unknown_key(key)
-
-        for label_id in key_labels:
+        events = numpy.frombuffer(packet, dtype="<u4", count=n_events)
+        found, atom_ids, label_ids = self.__key_lookup.lookup(events)
+        if not found.all():
+            for key in numpy.unique(events[~found]):
+                self.__handle_unknown_key(int(key))
+            events = events[found]
+
+        # Call back for each label in the order it first appears in the packet
+        unique_ids, first_seen = numpy.unique(label_ids, return_index=True)
+        for label_index in unique_ids[numpy.argsort(first_seen)]:
+            label_id = int(label_index)
+            is_label = label_ids == label_id
+            label_keys = events[is_label]
+            label_atoms = atom_ids[is_label]
             label = self.__receive_labels[label_id]
-            for c_back, use_atom in self.__live_event_callbacks[label_id]:
-                if use_atom:
-                    c_back(label, atoms_labels[label_id])
-                else:
-                    c_back(label, key_labels[label_id])
+            for c_back, use_atom, as_array in self.__live_event_callbacks[
+                    label_id]:
+                values = label_atoms if use_atom else label_keys
+                c_back(label, values if as_array else values.tolist())
 
     def __handle_unknown_key(self, key: int) -> None:
         if key not in self.__error_keys:
@@ -14,16 +14,27 @@
 
 from collections.abc import Iterable
 
-from spinn_front_end_common.utilities.connections import LiveEventConnection
+import numpy
+from numpy.typing import ArrayLike
+
+from spinnman.messages.eieio import EIEIOType
+
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
 
+from .batched_live_event_connection import (
+    DEFAULT_MAX_QUEUED_EVENTS,
+    BatchedLiveEventConnection,
+    PackedEIEIODataMessage,
+    pack_events,
+)
+
 # The maximum number of 32-bit keys that will fit in a packet
 _MAX_FULL_KEYS_PER_PACKET = 63
 # The maximum number of 16-bit keys that will fit in a packet
 _MAX_HALF_KEYS_PER_PACKET = 127
 
 
-class SpynnakerLiveSpikesConnection(LiveEventConnection):
+class SpynnakerLiveSpikesConnection(BatchedLiveEventConnection):
     """
     A connection for receiving and sending live spikes from and to
     SpiNNaker.
@@ -34,7 +45,8 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
                  send_labels: Iterable[str] | None = None,
                  local_host: str | None = None,
                  local_port: int | None = NOTIFY_PORT,
-                 live_packet_gather_label: str = "LiveSpikeReceiver"):
+                 live_packet_gather_label: str = "LiveSpikeReceiver",
+                 max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS):
         """
         :param receive_labels:
             Labels of population from which live spikes will be received.
@@ -47,10 +59,13 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             Optional specification of the local port to listen on. Must match
             the port that the toolchain will send the notification on (19999
             by default)
+        :param max_queued_events:
+            The most spikes that can be waiting to be sent by
+            :py:meth:`queue_spikes_array`
         """
         super().__init__(
             live_packet_gather_label, receive_labels, send_labels,
-            local_host, local_port)
+            local_host, local_port, max_queued_events)
 
     def send_spike(self, label: str, neuron_id: int,
                    send_full_keys: bool = False) -> None:
@@ -80,3 +95,69 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             whether to send 16-bit neuron IDs directly
         """
         self.send_events(label, neuron_ids, send_full_keys)
+
+    def send_spikes_array(
+            self, label: str, neuron_ids: ArrayLike,
+            send_full_keys: bool = False) -> None:
+        """
+        Send a numpy array of spikes, packed into as few packets as possible.
+
+        .. note::
+            Unlike :py:meth:`send_spikes`, this doesn't pause between packets,
+            so the caller must limit the rate of spikes sent.
+
+        :param label:
+            The label of the population from which the spikes will originate
+        :param neuron_ids: array-like of neuron IDs sending spikes
+        :param send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        """
+        self._send_packed(
+            label, self.__pack_spikes(label, neuron_ids, send_full_keys))
+
+    async def send_spikes_async(
+            self, label: str, neuron_ids: ArrayLike,
+            send_full_keys: bool = False) -> None:
+        """
+        Send a number of spikes from a coroutine.  Like
+        :py:meth:`send_spikes`, this pauses every few packets, but lets the
+        event loop run while it does.
+
+        :param label:
+            The label of the population from which the spikes will originate
+        :param neuron_ids: array-like of neuron IDs sending spikes
+        :param send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        """
+        await self._send_packed_async(
+            label, self.__pack_spikes(label, neuron_ids, send_full_keys))
+
+    def queue_spikes_array(
+            self, label: str, neuron_ids: ArrayLike,
+            send_full_keys: bool = False) -> int:
+        """
+        Queue a numpy array of spikes to be sent by a background thread,
+        packed into as few packets as possible.  Spikes that would take the
+        queue over its maximum size are dropped.
+
+        :param label:
+            The label of the population from which the spikes will originate
+        :param neuron_ids: array-like of neuron IDs sending spikes
+        :param send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        :return: The number of spikes queued
+        """
+        return self._queue_packed(
+            label, self.__pack_spikes(label, neuron_ids, send_full_keys))
+
+    def __pack_spikes(
+            self, label: str, neuron_ids: ArrayLike,
+            send_full_keys: bool) -> list[PackedEIEIODataMessage]:
+        if send_full_keys:
+            return pack_events(
+                EIEIOType.KEY_32_BIT,
+                self._atom_ids_to_keys(label, neuron_ids))
+        return pack_events(EIEIOType.KEY_16_BIT, numpy.asarray(neuron_ids))
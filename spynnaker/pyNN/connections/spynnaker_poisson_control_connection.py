@@ -15,8 +15,13 @@
 import functools
 from collections.abc import Iterable
 
+import numpy
+from numpy.typing import ArrayLike
+
 from spinn_utilities.overrides import overrides
 
+from spinnman.messages.eieio import EIEIOType
+
 from spinn_front_end_common.interface.ds import DataType
 from spinn_front_end_common.utilities.connections. \
     live_event_connection import (
@@ -29,8 +34,17 @@ from spinn_front_end_common.utilities.connections. \
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
+from spynnaker.pyNN.utilities.utility_calls import convert_to
+
+from .batched_live_event_connection import (
+    DEFAULT_MAX_QUEUED_EVENTS,
+    BatchedLiveEventConnection,
+    PackedEIEIODataMessage,
+    pack_events,
+)
 
-class SpynnakerPoissonControlConnection(LiveEventConnection):
+
+class SpynnakerPoissonControlConnection(BatchedLiveEventConnection):
     """
     A connection used to control a Poisson-distributed random event source's
     firing rate at runtime.
@@ -44,7 +58,8 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
             self, poisson_labels: Iterable[str] | None = None,
             local_host: str | None = None,
             local_port: int | None = NOTIFY_PORT,
-            control_label_extension: str = "_control"):
+            control_label_extension: str = "_control",
+            max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS):
         """
         :param poisson_labels:
             Labels of Poisson populations to be controlled
@@ -56,6 +71,9 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
             by default)
         :param control_label_extension:
             The extra name added to the label of each Poisson source
+        :param max_queued_events:
+            The most rate changes that can be waiting to be sent by
+            :py:meth:`queue_rates_array`
         """
         self.__control_label_extension = control_label_extension
 
@@ -76,7 +94,8 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
 
         super().__init__(
             live_packet_gather_label=None, send_labels=control_labels,
-            local_host=local_host, local_port=local_port)
+            local_host=local_host, local_port=local_port,
+            max_queued_events=max_queued_events)
 
     def add_poisson_label(self, label: str) -> None:
         """
@@ -174,7 +193,67 @@ class SpynnakerPoissonControlConnection(LiveEventConnection):
             A list of tuples of (neuron ID, rate) to be set
         """
         control = self.__control_label(label)
-        datatype = DataType.U1616
-        atom_ids_and_payloads = [(nid, datatype.encode_as_int(rate))
-                                 for nid, rate in neuron_id_rates]
-        self.send_events_with_payloads(control, atom_ids_and_payloads)
+        neuron_ids_and_rates = list(neuron_id_rates)
+        if not neuron_ids_and_rates:
+            return
+        neuron_ids, rates = zip(*neuron_ids_and_rates)
+        payloads = convert_to(numpy.array(rates, dtype=float), DataType.U1616)
+        self.send_events_with_payloads(
+            control, list(zip(neuron_ids, payloads.tolist())))
+
+    def set_rates_array(self, label: str, neuron_ids: ArrayLike,
+                        rates: ArrayLike) -> None:
+        """
+        Set the rates of multiple Poisson neurons within a Poisson source
+        from numpy arrays, packed into as few packets as possible.
+
+        .. note::
+            Unlike :py:meth:`set_rates`, this doesn't pause between packets,
+            so the caller must limit the rate of changes sent.
+
+        :param label: The label of the Population to set the rates of
+        :param neuron_ids: The neuron IDs to set the rates of
+        :param rates: The rate to set each neuron to in Hz
+        """
+        control = self.__control_label(label)
+        self._send_packed(
+            control, self.__pack_rates(control, neuron_ids, rates))
+
+    async def set_rates_async(self, label: str, neuron_ids: ArrayLike,
+                              rates: ArrayLike) -> None:
+        """
+        Set the rates of multiple Poisson neurons within a Poisson source
+        from a coroutine.  Like :py:meth:`set_rates`, this pauses every few
+        packets, but lets the event loop run while it does.
+
+        :param label: The label of the Population to set the rates of
+        :param neuron_ids: The neuron IDs to set the rates of
+        :param rates: The rate to set each neuron to in Hz
+        """
+        control = self.__control_label(label)
+        await self._send_packed_async(
+            control, self.__pack_rates(control, neuron_ids, rates))
+
+    def queue_rates_array(self, label: str, neuron_ids: ArrayLike,
+                          rates: ArrayLike) -> int:
+        """
+        Queue changes to the rates of multiple Poisson neurons to be sent by
+        a background thread, packed into as few packets as possible.  Changes
+        that would take the queue over its maximum size are dropped.
+
+        :param label: The label of the Population to set the rates of
+        :param neuron_ids: The neuron IDs to set the rates of
+        :param rates: The rate to set each neuron to in Hz
+        :return: The number of rate changes queued
+        """
+        control = self.__control_label(label)
+        return self._queue_packed(
+            control, self.__pack_rates(control, neuron_ids, rates))
+
+    def __pack_rates(
+            self, control: str, neuron_ids: ArrayLike,
+            rates: ArrayLike) -> list[PackedEIEIODataMessage]:
+        return pack_events(
+            EIEIOType.KEY_PAYLOAD_32_BIT,
+            self._atom_ids_to_keys(control, neuron_ids),
+            convert_to(numpy.asarray(rates, dtype=float), DataType.U1616))
@@ -24,6 +24,8 @@ from spinn_front_end_common.data import FecDataView
 from spynnaker import _version
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     from spynnaker.pyNN.models.populations import Population
     from spynnaker.pyNN.models.projection import Projection
 
@@ -50,6 +52,7 @@ class _SpynnakerDataModel:
 
     __slots__ = (
         # Data values cached
+        "_host_synapse_pool",
         "_id_counter",
         "_min_delay",
         "_populations",
@@ -67,6 +70,7 @@ class _SpynnakerDataModel:
         """
         Clears out all data.
         """
+        self._host_synapse_pool: ThreadPoolExecutor | None = None
         self._id_counter = 0
         self._min_delay: float | None = None
         # Using a dict to verify if later could be stored here only
@@ -230,6 +234,19 @@ class SpynnakerDataView(FecDataView):
         cls.__spy_data._populations.add(population)
         return first_id, cls.__spy_data._id_counter-1
 
+    @classmethod
+    def get_host_synapse_pool(cls) -> ThreadPoolExecutor | None:
+        """
+        The pool of threads shared by all cores to generate their on-host
+        synaptic matrices, if there is one.
+
+        There is only a pool while the data specifications are written and
+        only if more than one ``n_host_synapse_threads`` is configured.
+
+        :returns: The shared pool of threads or `None` if there is none
+        """
+        return cls.__spy_data._host_synapse_pool
+
     @classmethod
     def get_sim_name(cls) -> str:
         """
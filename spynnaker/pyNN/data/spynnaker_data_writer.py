@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
@@ -87,6 +88,17 @@ class SpynnakerDataWriter(FecDataWriter, SpynnakerDataView):
 
         self.__spy_data._min_delay = min_delay
 
+    def set_host_synapse_pool(self, pool: ThreadPoolExecutor | None) -> None:
+        """
+        Sets or clears the pool of threads shared by all cores to generate
+        their on-host synaptic matrices.
+
+        :param pool: The pool to share, or `None` to stop sharing one
+        """
+        if pool is not None and not isinstance(pool, ThreadPoolExecutor):
+            raise TypeError("pool should be a ThreadPoolExecutor")
+        self.__spy_data._host_synapse_pool = pool
+
     def _get_id_counter(self) -> int:
         """
         Testing method likely to change without notice!
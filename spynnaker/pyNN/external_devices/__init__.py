@@ -36,6 +36,7 @@ from spinn_front_end_common.utilities.utility_objs import (
 
 from spynnaker.pyNN import model_binaries, protocols
 from spynnaker.pyNN.connections import (
+    AsyncLiveConnection,
     EthernetCommandConnection,
     EthernetControlConnection,
     SPIFLiveSpikesConnection,
@@ -133,6 +134,7 @@ __all__ = [  # noqa: RUF022
     "PushBotSpiNNakerLinkSpeakerDevice", "PushBotSpiNNakerLinkRetinaDevice",
 
     # Connections
+    "AsyncLiveConnection",
     "SpynnakerLiveSpikesConnection",
     "SpynnakerPoissonControlConnection",
     "SPIFLiveSpikesConnection",
@@ -18,6 +18,7 @@ import numpy
 from numpy.typing import NDArray
 
 from spynnaker.pyNN.random_distribution import RandomDistribution
+from spynnaker.pyNN.utilities.ragged_spike_times import RaggedSpikeTimes
 
 #: Type of names of parameters and state variables.
 Names: TypeAlias = (  # pylint: disable=invalid-name
@@ -32,5 +33,7 @@ Spikes: TypeAlias = (
     # Can be floating point values (will round)
     Values |
     # Can be integer values, or lists of such
-    int | Sequence[int] | Sequence[Sequence[int]] | NDArray[numpy.integer]
+    int | Sequence[int] | Sequence[Sequence[int]] | NDArray[numpy.integer] |
+    # Can be the times of each neuron held in one flat array
+    RaggedSpikeTimes
     )
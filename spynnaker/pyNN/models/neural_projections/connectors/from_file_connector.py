@@ -17,6 +17,8 @@ import os
 from typing import Any
 
 import numpy
+from numpy.lib.format import MAGIC_PREFIX
+from numpy.lib.recfunctions import structured_to_unstructured
 from numpy.typing import NDArray
 from pyNN.recording.files import BaseFile, StandardTextFile
 
@@ -43,6 +45,9 @@ class FromFileConnector(FromListConnector):
             Either an open file object or the filename of a file containing a
             list of connections, in the format required by
             :py:class:`FromListConnector`.
+            The file can also be a binary file written by
+            :py:meth:`Projection.save` with ``format="npy"``, which is
+            memory-mapped rather than read.
             Column headers, if included in the file, must be specified using
             a list or tuple, e.g.::
 
@@ -73,17 +78,20 @@ class FromFileConnector(FromListConnector):
             CSV file
         """
         self._file = file
-        if isinstance(file, str):
-            real_file = self.get_reader(file)
-            try:
-                conn_list = self._read_conn_list(real_file, distributed)
-            finally:
-                real_file.close()
+        column_names: list[str] | None
+        if isinstance(file, str) and self.__is_binary(file):
+            conn_list, column_names = self._read_binary_conn_list(file)
         else:
-            conn_list = self._read_conn_list(file, distributed)
-
-        column_names = self.get_reader(self._file).get_metadata().get(
-            'columns')
+            if isinstance(file, str):
+                real_file = self.get_reader(file)
+                try:
+                    conn_list = self._read_conn_list(real_file, distributed)
+                finally:
+                    real_file.close()
+            else:
+                conn_list = self._read_conn_list(file, distributed)
+            column_names = self.get_reader(self._file).get_metadata().get(
+                'columns')
         if column_names is not None:
             column_names = [column for column in column_names
                             if column not in ("i", "j")]
@@ -123,6 +131,34 @@ class FromFileConnector(FromListConnector):
                     file_reader.close()
         return numpy.concatenate(conns)
 
+    @staticmethod
+    def __is_binary(filename: str) -> bool:
+        """
+        :param filename:
+        :return: Whether the file is a numpy binary file
+        """
+        with open(filename, "rb") as f:
+            return f.read(len(MAGIC_PREFIX)) == MAGIC_PREFIX
+
+    def _read_binary_conn_list(
+            self, filename: str) -> tuple[NDArray, list[str] | None]:
+        """
+        Memory-map a binary connection list.
+
+        :param filename: The name of the file saved by Projection.save
+        :return: The connection list and the names of the columns
+        """
+        data = numpy.load(filename, mmap_mode="r")
+        if data.dtype.names is None:
+            return data, None
+        columns = list(data.dtype.names)
+
+        # Every field is a float, so view the records as rows of a 2D array
+        if all(data.dtype[name] == numpy.float64 for name in columns) and (
+                data.dtype.itemsize == len(columns) * 8):
+            return data.view(numpy.float64).reshape(-1, len(columns)), columns
+        return structured_to_unstructured(data, dtype=numpy.float64), columns
+
     def __repr__(self) -> str:
         return f"FromFileConnector({self._file})"
 
@@ -84,9 +84,10 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
         "__conn_list",
         "__delays",
         "__extra_params",
+        "__source_order",
         "__sources",
-        "__split_conn_list",
-        "__split_post_slices",
+        "__target_order",
+        "__target_starts",
         "__targets",
         "__weights",
     )
@@ -126,8 +127,10 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
         super().__init__(safe, callback, verbose)
 
         self.__column_names = column_names
-        self.__split_conn_list: dict[int, NDArray[integer]] = {}
-        self.__split_post_slices: list[Slice] | None = None
+        # Sort indices of the connection list; built on first use
+        self.__source_order: NDArray[integer] | None = None
+        self.__target_order: NDArray[integer] | None = None
+        self.__target_starts: NDArray[integer] | None = None
 
         self.__conn_list: NDArray
         # These are set by __setup_using_conn_list
@@ -139,6 +142,9 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
 
         if conn_list is None or len(conn_list) == 0:
             self.__conn_list = numpy.zeros((0, 2), dtype=uint32)
+        elif isinstance(conn_list, numpy.memmap):
+            # Keep a memory-mapped list in the file rather than copying it
+            self.__conn_list = conn_list
         else:
             self.__conn_list = numpy.array(conn_list)
         self.__setup_using_conn_list()
@@ -191,55 +197,49 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
             mapping[s.get_raster_ids()] = i
         return mapping
 
-    def _split_connections(
-            self, n_pre_atoms: int, n_post_atoms: int,
-            post_slices: Sequence[Slice]) -> \
-            tuple[NDArray[integer], NDArray[integer],
-                  NDArray[floating] | None,
-                  NDArray[floating] | None]:
-        input_filter = numpy.logical_and(
-            self.__targets < n_post_atoms, self.__sources < n_pre_atoms)
-        targets = self.__targets[input_filter]
-        sources = self.__sources[input_filter]
-        weights = (None if self.__weights is None else
-                   self.__weights[input_filter])
-        delays = (None if self.__delays is None else
-                  self.__delays[input_filter])
-
-        # If nothing has changed, use the cache
-        if self.__split_post_slices == post_slices:
-            return sources, targets, weights, delays
-
-        # If there are no connections, return
-        if len(self.__conn_list) == 0:
-            self.__split_conn_list = {}
-            return sources, targets, weights, delays
-
-        self.__split_post_slices = list(post_slices)
-        m_vertex_mapping = self.__id_to_m_vertex_index(
-            n_post_atoms, post_slices)
-
-        # Get which index of the from list is on which vertex
-        target_vertices = m_vertex_mapping[self.__targets[input_filter]]
-
-        # Get how many on each vertex there are
-        index_count = numpy.bincount(
-            target_vertices, minlength=len(post_slices))[:len(post_slices)]
-
-        # Get the sort order to put connections on each vertex
-        sort_indices = numpy.argsort(target_vertices)
-
-        # Split the sort order in to groups of connection indices
-        split_indices = numpy.array(numpy.split(
-            sort_indices, numpy.cumsum(index_count)), dtype=object)[:-1]
-
-        # Get the results indexed by hi_atom in the slices
-        self.__split_conn_list = {
-            post_slices[i].lo_atom: indices
-            for i, indices in enumerate(split_indices)
-            if len(indices) > 0
-        }
-        return sources, targets, weights, delays
+    def __get_target_index(self) -> tuple[
+            NDArray[integer], NDArray[integer]]:
+        """
+        Get the connection list indices sorted by target, along with the
+        position in that order at which the connections to each target start
+        (so the connections to target ``t`` are
+        ``order[starts[t]:starts[t + 1]]``).
+        """
+        if self.__target_order is None or self.__target_starts is None:
+            self.__target_order = numpy.argsort(self.__targets, kind="stable")
+            self.__target_starts = numpy.concatenate((
+                [0], numpy.cumsum(numpy.bincount(self.__targets))))
+        return self.__target_order, self.__target_starts
+
+    def __get_source_order(self) -> NDArray[integer]:
+        """
+        Get the connection list indices sorted by source and then by target.
+        """
+        if self.__source_order is None:
+            self.__source_order = numpy.lexsort(
+                (self.__targets, self.__sources))
+        return self.__source_order
+
+    def __get_connection_indices(
+            self, post_vertex_slice: Slice,
+            n_pre_atoms: int) -> NDArray[integer]:
+        """
+        Get the indices in the connection list of the connections which
+        target the given slice and come from a valid source.
+        """
+        order, starts = self.__get_target_index()
+        post_ids = post_vertex_slice.get_raster_ids()
+        post_ids = post_ids[post_ids < len(starts) - 1]
+        firsts = starts[post_ids]
+        counts = starts[post_ids + 1] - firsts
+        n_indices = int(counts.sum())
+
+        # Gather the runs of sorted indices for each of the target ids
+        positions = numpy.repeat(
+            firsts - (numpy.cumsum(counts) - counts), counts) + numpy.arange(
+                n_indices, dtype=int64)
+        indices = order[positions]
+        return indices[self.__sources[indices] < n_pre_atoms]
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
@@ -257,25 +257,22 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
                 delays = synapse_info.delays
                 mask = ((delays >= min_delay) & (delays <= max_delay))
                 delays_handled = True
-        if mask is None:
-            conns = self.__conn_list.copy()
-        else:
-            conns = self.__conn_list[mask].copy()
-        if conns.size == 0:
+        order = self.__get_source_order()
+        if mask is not None:
+            order = order[mask[order]]
+        if len(order) == 0:
             return 0
 
-        # Make targets be core indices
-        conns[:, _TARGET] //= n_post_atoms
-
-        # Split into sources
-        source_split_conns = self.__numpy_group(conns, _SOURCE)
-
-        # Split into groups by post_n_atoms
-        target_split_conns = [
-            self.__numpy_group(s, _TARGET) for s in source_split_conns]
+        # With the list sorted by source and then target, the connections
+        # from each source to each core are in consecutive runs
+        sources = self.__sources[order]
+        cores = self.__targets[order] // n_post_atoms
+        run_starts = numpy.flatnonzero(numpy.concatenate((
+            [True], (sources[1:] != sources[:-1]) |
+            (cores[1:] != cores[:-1]), [True])))
 
         # Find the biggest group
-        max_targets = max([len(t) for s in target_split_conns for t in s])
+        max_targets = int(numpy.max(numpy.diff(run_starts)))
 
         # If no delays just return max targets as this is for all delays
         # If there are delays in the list, this was also handled above
@@ -289,26 +286,13 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
             synapse_info.n_pre_neurons * synapse_info.n_post_neurons,
             max_targets, min_delay, max_delay, synapse_info)
 
-    @staticmethod
-    def __numpy_group(conns: NDArray, column: int) -> list[NDArray]:
-        # Sort by the column to group by
-        s = conns[conns[:, column].argsort()]
-
-        # Find split points by getting the first indices of the unique items
-        # and then removing the first (as that will be 0 and we don't want to
-        # split at 0)
-        split_points = numpy.unique(s[:, column], return_index=True)[1][1:]
-
-        # Perform the split
-        return numpy.array_split(conns, split_points)
-
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(
             self, synapse_info: SynapseInformation) -> int:
         if len(self.__targets) == 0:
             return 0
-        return int(numpy.max(numpy.bincount(
-            self.__targets.astype(int64, copy=False))))
+        _order, starts = self.__get_target_index()
+        return int(numpy.max(numpy.diff(starts)))
 
     @overrides(AbstractConnector.get_weight_mean)
     def get_weight_mean(self, weights: Weights,
@@ -346,20 +330,18 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
     def create_synaptic_block(
             self, post_slices: Sequence[Slice], post_vertex_slice: Slice,
             synapse_type: int, synapse_info: SynapseInformation) -> NDArray:
-        sources, targets, weights, delays = self._split_connections(
-            synapse_info.n_pre_neurons, synapse_info.n_post_neurons,
-            post_slices)
-        post_lo = post_vertex_slice.lo_atom
-        if post_lo not in self.__split_conn_list:
+        indices = self.__get_connection_indices(
+            post_vertex_slice, synapse_info.n_pre_neurons)
+        if len(indices) == 0:
             return numpy.zeros(0, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        else:
-            indices = self.__split_conn_list[post_lo]
+        weights = self.__weights
+        delays = self.__delays
 
         block = numpy.zeros(len(indices), dtype=self.NUMPY_SYNAPSES_DTYPE)
         block["source"] = synapse_info.pre_vertex.get_key_ordered_indices(
-            sources[indices])
+            self.__sources[indices])
         block["target"] = post_vertex_slice.get_relative_indices(
-            targets[indices])
+            self.__targets[indices])
         # check that conn_list has weights, if not then use the value passed in
         if weights is None:
             if _is_sequential(synapse_info.weights):
@@ -506,11 +488,11 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
             target_vertex: ApplicationVertex) -> Sequence[
                 tuple[MachineVertex, Sequence[AbstractVertex]]]:
         # Divide the targets into bins based on post slices
-        post_slices = [m.vertex_slice
-                       for m in target_vertex.splitter.get_in_coming_vertices(
-                           s_info.partition_id)]
-        pre_vertices = source_vertex.splitter.get_out_going_vertices(
-            s_info.partition_id)
+        post_vertices = list(target_vertex.splitter.get_in_coming_vertices(
+            s_info.partition_id))
+        post_slices = [m.vertex_slice for m in post_vertices]
+        pre_vertices = list(source_vertex.splitter.get_out_going_vertices(
+            s_info.partition_id))
         pre_slices = [m.vertex_slice for m in pre_vertices]
 
         post_mapping = self.__id_to_m_vertex_index(
@@ -525,32 +507,16 @@ class FromListConnector(AbstractConnector, AbstractGenerateConnectorOnHost):
         target_vertices = post_mapping[self.__targets[input_filter]]
         source_vertices = pre_mapping[self.__sources[input_filter]]
 
-        # Join the groups from both axes
+        # Count the connections between each pair of vertices
         n_bins = (len(pre_slices), len(post_slices))
         joined_indices = numpy.ravel_multi_index(
             (source_vertices, target_vertices), n_bins, mode="clip")
-
-        # Get a count of the indices in each bin
-        index_count = numpy.bincount(
-            joined_indices, minlength=numpy.prod(n_bins))
-
-        pre_post_lo = [(pre.lo_atom, post.lo_atom) for pre in pre_slices
-                       for post in post_slices]
-
-        # Put the counts into a dict by hi-atom
-        split_counts = {
-            pre_post: count
-            for pre_post, count in zip(pre_post_lo, index_count)
-            if count > 0
-        }
-
+        connected = numpy.bincount(
+            joined_indices, minlength=numpy.prod(n_bins)).reshape(n_bins) > 0
         return [
-            (m_vert, [s_vert for s_vert in pre_vertices
-                      if (s_vert.vertex_slice.lo_atom,
-                          m_vert.vertex_slice.lo_atom) in split_counts])
-            for m_vert in target_vertex.splitter.get_in_coming_vertices(
-                s_info.partition_id)
-        ]
+            (m_vert, [pre_vertices[i]
+                      for i in numpy.flatnonzero(connected[:, j])])
+            for j, m_vert in enumerate(post_vertices)]
 
     def _apply_parameters_to_synapse_type(
             self, synapse_type: AbstractSynapseDynamics) -> None:
@@ -283,7 +283,9 @@ class KernelConnector(AbstractGenerateConnectorOnMachine,
                 self.__map_to_pre_coords(post_r, post_c)
         return self._post_as_pre[post_vertex_slice]
 
-    def __pre_as_post(self, pre_r: int, pre_c: int) -> tuple[int, int]:
+    def __pre_as_post(
+            self, pre_r: NDArray[integer], pre_c: NDArray[integer]) -> tuple[
+                NDArray[integer], NDArray[integer]]:
         """
         Write pre-population coordinates as post-population coordinates.
         """
@@ -337,62 +339,42 @@ class KernelConnector(AbstractGenerateConnectorOnMachine,
         assert self._krn_delays is not None
 
         post_as_pre_r, post_as_pre_c = self.__post_as_pre(post_vertex_slice)
-        coords: dict[int, list[int]] = {}
-        hh, hw = self._hlf_k_h, self._hlf_k_w
-        all_pre_ids: list[int] = []
-        all_post_ids: list[int] = []
-        all_delays: list[NDArray[floating]] = []
-        all_weights: list[NDArray[floating]] = []
-        count = 0
-        post_lo = post_vertex_slice.lo_atom
-
-        # Loop over pre-vertices
-        for pre_idx in range(n_pre_neurons):
-            pre_r, pre_c = divmod(pre_idx, self._pre_w)
-            coords[pre_idx] = []
-
-            # Test whether the coordinates should be included based on the
-            # step function (in the pre) and skip if not
-            if not (((pre_r - self._pre_start_h) % self._pre_step_h == 0) and
-                    ((pre_c - self._pre_start_w) % self._pre_step_w == 0)):
-                continue
-
-            # Loop over post-vertices
-            for post_idx in range(
-                    post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1):
-                # convert to common coordinate system
-                pac_r = post_as_pre_r[post_idx - post_lo]
-                pac_c = post_as_pre_c[post_idx - post_lo]
-
-                # now convert common to pre coordinates
-                pap_r, pap_c = self.__pre_as_post(pac_r, pac_c)
-
-                # Obtain coordinates to test against kernel sizes
-                dr = pap_r - pre_r
-                kr = hh - dr
-                dc = pap_c - pre_c
-                kc = hw - dc
-
-                if 0 <= kr < self._kernel_h and 0 <= kc < self._kernel_w:
-                    if post_idx in coords[pre_idx]:
-                        continue
-                    coords[pre_idx].append(post_idx)
-
-                    # Store weights, delays and pre/post ids
-                    w = self._krn_weights[kr, kc]
-                    d = self._krn_delays[kr, kc]
-
-                    count += 1
-
-                    all_pre_ids.append(pre_idx)
-                    all_post_ids.append(post_idx)
-                    all_delays.append(d)
-                    all_weights.append(w)
-
-        # Now the loop is complete, return relevant data
-        return (count, numpy.array(all_post_ids, dtype=uint32),
-                numpy.array(all_pre_ids, dtype=uint32),
-                numpy.array(all_delays), numpy.array(all_weights))
+
+        # now convert common to pre coordinates, for every post-neuron at once
+        pap_r, pap_c = self.__pre_as_post(
+            post_as_pre_r.astype(numpy.int64),
+            post_as_pre_c.astype(numpy.int64))
+
+        # The pre-coordinates under each kernel row and column, as
+        # kr = hh - (pap_r - pre_r); shaped (post, kernel row, kernel column)
+        kr = numpy.arange(self._kernel_h)[None, :, None]
+        kc = numpy.arange(self._kernel_w)[None, None, :]
+        pre_r = pap_r[:, None, None] - self._hlf_k_h + kr
+        pre_c = pap_c[:, None, None] - self._hlf_k_w + kc
+        pre_idx = pre_r * self._pre_w + pre_c
+
+        # Keep the pre-neurons which exist and are included based on the
+        # step function (in the pre)
+        valid = ((pre_r >= 0) & (pre_c >= 0) & (pre_c < self._pre_w) &
+                 (pre_idx < n_pre_neurons) &
+                 ((pre_r - self._pre_start_h) % self._pre_step_h == 0) &
+                 ((pre_c - self._pre_start_w) % self._pre_step_w == 0))
+        post_idx = numpy.arange(
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1)
+        all_post_ids = numpy.broadcast_to(
+            post_idx[:, None, None], valid.shape)[valid]
+        all_pre_ids = pre_idx[valid]
+        valid_kr = numpy.broadcast_to(kr, valid.shape)[valid]
+        valid_kc = numpy.broadcast_to(kc, valid.shape)[valid]
+
+        # Order by pre- and then post-neuron
+        order = numpy.lexsort((all_post_ids, all_pre_ids))
+        valid_kr = valid_kr[order]
+        valid_kc = valid_kc[order]
+        return (len(order), all_post_ids[order].astype(uint32),
+                all_pre_ids[order].astype(uint32),
+                numpy.asarray(self._krn_delays)[valid_kr, valid_kc],
+                numpy.asarray(self._krn_weights)[valid_kr, valid_kc])
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, synapse_info: SynapseInformation) -> float:
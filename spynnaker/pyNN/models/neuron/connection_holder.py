@@ -20,8 +20,8 @@ from typing import (
 )
 
 import numpy
-from numpy.lib.recfunctions import merge_arrays
 from numpy.typing import NDArray
+from scipy.sparse import csr_array
 
 from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
     ConnectionsArray,
@@ -29,7 +29,14 @@ from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
 
 _ItemType: TypeAlias = numpy.floating
 _Items: TypeAlias = (tuple[NDArray[_ItemType], ...] | NDArray[_ItemType] |
-                     tuple[list[numpy.floating], ...])
+                     tuple[list[numpy.floating], ...] | csr_array |
+                     tuple[csr_array, ...])
+
+#: How the values of multiple synapses between the same source and target
+#: can be combined when returned as a matrix
+MULTIPLE_SYNAPSES = ("last", "first", "sum", "min", "max")
+
+_REDUCERS = {"sum": numpy.add, "min": numpy.minimum, "max": numpy.maximum}
 
 
 def _is_listable(value: Any) -> TypeGuard[Sequence[Any]]:
@@ -55,6 +62,10 @@ class ConnectionHolder:
         # A list of items of data that are to be present in each element
         "__data_items_to_return",
 
+        # How to combine multiple synapses with the same source and target
+        # when returning matrices
+        "__multiple_synapses",
+
         # Additional fixed values to be added to the data returned,
         # with the same values per synapse, as a list of tuples of
         # (field name, value)
@@ -67,7 +78,14 @@ class ConnectionHolder:
         "__n_pre_atoms",
 
         # A callback to call with the data when finished
-        "__notify"
+        "__notify",
+
+        # True if matrices should be returned as sparse matrices
+        "__sparse",
+
+        # True if a list should be returned as numpy arrays rather than
+        # Python lists
+        "__structured"
     )
 
     def __init__(
@@ -75,7 +93,9 @@ class ConnectionHolder:
             n_pre_atoms: int, n_post_atoms: int,
             connections: list[ConnectionsArray] | None = None,
             fixed_values: list[tuple[str, int]] | None = None,
-            notify: Callable[['ConnectionHolder'], None] | None = None):
+            notify: Callable[['ConnectionHolder'], None] | None = None,
+            sparse: bool = False, multiple_synapses: str = "last",
+            structured: bool = False):
         """
         :param data_items_to_return: A list of data fields to be returned
         :param as_list:
@@ -99,7 +119,25 @@ class ConnectionHolder:
             A callback to call when the connections have all been added.
             This should accept a single parameter, which will contain the
             data requested
+        :param sparse:
+            If not returning a list, True to return each matrix as a
+            :py:class:`scipy.sparse.csr_array` which holds only the
+            connections that exist, rather than a dense matrix filled
+            with NaN where there is no connection
+        :param multiple_synapses:
+            When not returning a list, how to combine the values of multiple
+            synapses with the same source and target; one of
+            ``"last"``, ``"first"``, ``"sum"``, ``"min"`` or ``"max"``
+        :param structured:
+            If returning a list, True to return the sorted connections as a
+            numpy structured array (or a single column of it if only one
+            item is to be returned) instead of converting each connection
+            to a Python list
         """
+        if multiple_synapses not in MULTIPLE_SYNAPSES:
+            raise ValueError(
+                f"Unknown multiple_synapses {multiple_synapses}; must be one "
+                f"of {MULTIPLE_SYNAPSES}")
         self.__data_items_to_return = data_items_to_return
         self.__as_list = as_list
         self.__n_pre_atoms = n_pre_atoms
@@ -108,6 +146,9 @@ class ConnectionHolder:
         self.__data_items: _Items | None = None
         self.__notify = notify
         self.__fixed_values = fixed_values
+        self.__sparse = sparse
+        self.__multiple_synapses = multiple_synapses
+        self.__structured = structured
 
     def add_connections(self, connections: ConnectionsArray) -> None:
         """
@@ -163,44 +204,30 @@ class ConnectionHolder:
         # sub-vertices of a population)
         connections: ConnectionsArray = numpy.concatenate(self.__connections)
 
-        # If there are additional fixed values, merge them in
-        if self.__fixed_values:
-            # Generate a numpy type for the fixed values
-            fixed_dtypes = [
-                (f'{field[0]}', None)
-                for field in self.__fixed_values]
-
-            # Get the actual data as a record array
-            fixed_data = numpy.asarray(
-                tuple([field[1] for field in self.__fixed_values]),
-                dtype=fixed_dtypes)
-
-            # Tile the array to be the correct size
-            fixed_values = numpy.tile(fixed_data, [len(connections), 1])
-
-            # Add the fixed values to the connections
-            connections = merge_arrays(
-                (connections, fixed_values), flatten=True)
-
         # If we are returning a list...
         if self.__as_list:
             # ...sort by source then target
             order = numpy.lexsort(
                 (connections["target"], connections["source"]))
+            connections = connections[order]
 
             # There are no specific items to return, so just get
             # all the data
-            if (self.__data_items_to_return is None or
-                    not self.__data_items_to_return):
-                data_items = connections[order]
+            names = self.__data_items_to_return
+            if not names:
+                names = list(connections.dtype.names or ())
+                names.extend(name for name, _ in self.__fixed_values or ())
             # There is more than one item to return, so let numpy do its magic
-            elif len(self.__data_items_to_return) > 1:
-                data_items = \
-                    connections[order][self.__data_items_to_return]
+            if len(names) > 1:
+                data_items = self.__select(connections, names)
             # There is 1 item to return, so make sure only one item exists
             else:
-                data_items = \
-                    connections[order][self.__data_items_to_return[0]]
+                data_items = self.__column(connections, names[0])
+
+            # Return the numpy data directly if asked
+            if self.__structured:
+                self.__data_items = data_items
+                return self.__data_items
 
             # Return in a format which can be understood by a FromListConnector
             items: list[list[numpy.floating]] = []
@@ -217,17 +244,23 @@ class ConnectionHolder:
                 return ()
 
             # Keep track of the matrices
-            merged: list[NDArray[_ItemType]] = []
-            for item in self.__data_items_to_return:
+            merged: list[NDArray[_ItemType] | csr_array] = []
+            sources, targets, values = self.__combine_multiple_synapses(
+                connections, self.__data_items_to_return)
+            for item_values in values:
+                if self.__sparse:
+                    # Build the matrix from only the values that exist
+                    merged.append(csr_array(
+                        (item_values, (sources, targets)),
+                        shape=(self.__n_pre_atoms, self.__n_post_atoms)))
+                    continue
+
                 # Build an empty matrix and fill it with NAN
                 matrix = numpy.empty((self.__n_pre_atoms, self.__n_post_atoms))
                 matrix.fill(numpy.nan)
 
                 # Fill in the values that have data
-                # TODO: Change this to sum the items with the same
-                #       (source, target) pairs
-                matrix[connections["source"], connections["target"]] = \
-                    connections[item]
+                matrix[sources, targets] = item_values
 
                 # Store the matrix generated
                 merged.append(matrix)
@@ -239,6 +272,102 @@ class ConnectionHolder:
 
         return self.__data_items
 
+    def __column(self, connections: NDArray, name: str) -> NDArray:
+        """
+        Get a named field of the connections, where fixed values are
+        broadcast rather than copied.  Fixed values are always float64, as
+        they were when they were merged into the connections as fields of
+        no given type.
+
+        :param connections: The connections to get the field of
+        :param name: The name of the field
+        :return: The values of the field for each connection
+        """
+        for fixed_name, value in self.__fixed_values or ():
+            if fixed_name == name:
+                return numpy.broadcast_to(
+                    numpy.float64(value), (len(connections), ))
+        return connections[name]
+
+    def __select(self, connections: NDArray, names: list[str]) -> NDArray:
+        """
+        Get a structured array of the named fields of the connections.
+        This is a view of the connections unless fixed values are included.
+
+        :param connections: The connections to get the fields of
+        :param names: The names of the fields
+        :return: The values of the fields for each connection
+        """
+        if all(name in (connections.dtype.names or ()) for name in names):
+            return connections[names]
+        columns = [self.__column(connections, name) for name in names]
+        selected = numpy.empty(len(connections), dtype=[
+            (name, column.dtype) for name, column in zip(names, columns)])
+        for name, column in zip(names, columns):
+            selected[name] = column
+        return selected
+
+    def __combine_multiple_synapses(
+            self, connections: NDArray, items: list[str]) -> tuple[
+                NDArray, NDArray, list[NDArray]]:
+        """
+        Combine connections with the same source and target.
+
+        :param connections: The connections to combine
+        :param items: The fields to get the combined values of
+        :return:
+            The source and target of each distinct pair, and the combined
+            values of each of the items for each pair
+        """
+        # Sort stably so that connections with the same source and target
+        # stay in the order they were added
+        order = numpy.lexsort((connections["target"], connections["source"]))
+        sources = connections["source"][order]
+        targets = connections["target"][order]
+        if len(order) == 0:
+            return sources, targets, [
+                self.__column(connections, item) for item in items]
+
+        # Find where each distinct pair starts and ends in the sorted order
+        firsts = numpy.flatnonzero(numpy.concatenate((
+            [True], (sources[1:] != sources[:-1]) |
+            (targets[1:] != targets[:-1]))))
+        sources = sources[firsts]
+        targets = targets[firsts]
+
+        reducer = _REDUCERS.get(self.__multiple_synapses)
+        if reducer is None:
+            if self.__multiple_synapses == "first":
+                chosen = order[firsts]
+            else:
+                chosen = order[numpy.append(firsts[1:] - 1, len(order) - 1)]
+            return sources, targets, [
+                self.__column(connections, item)[chosen] for item in items]
+
+        # The source and target are the same for the whole pair
+        values = []
+        for item in items:
+            if item == "source":
+                values.append(sources)
+            elif item == "target":
+                values.append(targets)
+            else:
+                values.append(reducer.reduceat(
+                    self.__column(connections, item)[order], firsts))
+        return sources, targets, values
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None
+                  ) -> NDArray:
+        data = self._get_data_items()
+        if copy is False and (
+                not isinstance(data, numpy.ndarray) or (
+                    dtype is not None and numpy.dtype(dtype) != data.dtype)):
+            raise ValueError(
+                "The connections can only be made into an array by copying")
+        if copy:
+            return numpy.array(data, dtype=dtype)
+        return numpy.asarray(data, dtype=dtype)
+
     def __getitem__(self, s: int) -> (
             numpy.floating | NDArray[numpy.floating] |
             list[numpy.floating]):
@@ -267,5 +396,9 @@ class ConnectionHolder:
 
         :raises AttributeError: If the data does not have this attribute.
         """
+        # Leave numpy to use __array__, as the array interfaces of the data
+        # lose the names of any structured fields
+        if name.startswith("__array_"):
+            raise AttributeError(name)
         data = self._get_data_items()
         return getattr(data, name)
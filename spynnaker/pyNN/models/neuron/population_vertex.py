@@ -228,6 +228,7 @@ class PopulationVertex(
         "__max_delay_ms",
         "__max_delay_slots_available",
         "__max_row_info",
+        "__max_weights",
         "__n_atoms",
         "__n_colour_bits",
         "__n_profile_samples",
@@ -396,6 +397,7 @@ class PopulationVertex(
             tuple[ProjectionApplicationEdge, SynapseInformation, int],
             MaxRowInfo] = {}
         self.__self_projection: Projection | None = None
+        self.__max_weights: NDArray[numpy.floating] | None = None
 
         # Keep track of the synapse dynamics for the vertex overall
         self.__synapse_dynamics: (
@@ -869,6 +871,7 @@ class PopulationVertex(
             AbstractLocalOnly, AbstractSDRAMSynapseDynamics)), \
             f"unhandled type of merged synapse dynamics: {type(merged)}"
         self.__synapse_dynamics = merged
+        self.reset_ring_buffer_shifts()
 
     def add_incoming_projection(self, projection: Projection) -> None:
         """
@@ -878,6 +881,7 @@ class PopulationVertex(
         """
         # Reset the ring buffer shifts as a projection has been added
         SpynnakerDataView.set_requires_mapping()
+        self.reset_ring_buffer_shifts()
         self.__max_row_info.clear()
         self.__max_delay_ms = None
         self.__max_delay_slots_available = None
@@ -1286,6 +1290,7 @@ class PopulationVertex(
     @ring_buffer_sigma.setter
     def ring_buffer_sigma(self, ring_buffer_sigma: float) -> None:
         self.__ring_buffer_sigma = ring_buffer_sigma
+        self.reset_ring_buffer_shifts()
 
     @property
     def spikes_per_second(self) -> float:
@@ -1299,6 +1304,7 @@ class PopulationVertex(
     @spikes_per_second.setter
     def spikes_per_second(self, spikes_per_second: float) -> None:
         self.__spikes_per_second = spikes_per_second
+        self.reset_ring_buffer_shifts()
 
     def set_synapse_dynamics(
             self, synapse_dynamics: AbstractSynapseDynamics) -> None:
@@ -1385,30 +1391,65 @@ class PopulationVertex(
             # generation
             self.__tell_neuron_vertices_to_regenerate()
 
-    def get_ring_buffer_shifts(self) -> list[int]:
+    def get_max_weights(self) -> NDArray[numpy.floating]:
         """
-        :returns: The shift of the ring buffers for transfer of values into
-            the input buffers for this model.
+        Get the expected maximum summed weight of each synapse type, as used
+        to work out the ring buffer shifts.
+
+        This is worked out from the incoming projections the first time it
+        is needed, and then kept until :py:meth:`reset_ring_buffer_shifts`
+        is called.
+
+        :returns: The maximum weight of each synapse type, scaled by the
+            global weight scale
+        """
+        if self.__max_weights is None:
+            self.__max_weights = self.__compute_max_weights()
+        return numpy.array(self.__max_weights)
+
+    def reset_ring_buffer_shifts(self) -> None:
+        """
+        Forget the maximum weights, so the ring buffer shifts are worked out
+        again the next time they are needed.
+
+        This is done automatically when a projection is added, the synapse
+        dynamics change or the ring buffer sigma or spikes per second are
+        set.
+        """
+        self.__max_weights = None
+
+    def __compute_max_weights(self) -> NDArray[numpy.floating]:
+        """
+        :returns: The maximum weight of each synapse type.
         """
         n_synapse_types = self.__neuron_impl.get_n_synapse_types()
         max_weights = numpy.zeros(n_synapse_types)
         if self.__max_expected_summed_weight is not None:
             max_weights[:] = self.__max_expected_summed_weight
             max_weights *= self.__neuron_impl.get_global_weight_scale()
-        else:
-            stats = _Stats(self.__neuron_impl, self.__spikes_per_second,
-                           self.__ring_buffer_sigma)
+            return max_weights
 
-            for proj in self.incoming_projections:
-                # pylint: disable=protected-access
-                synapse_info = proj._synapse_information
-                # Skip if this is a synapse dynamics synapse type
-                if synapse_info.synapse_type_from_dynamics:
-                    continue
-                stats.add_projection(proj)
-
-            for synapse_type in range(n_synapse_types):
-                max_weights[synapse_type] = stats.get_max_weight(synapse_type)
+        stats = _Stats(self.__neuron_impl, self.__spikes_per_second,
+                       self.__ring_buffer_sigma)
+
+        for proj in self.incoming_projections:
+            # pylint: disable=protected-access
+            synapse_info = proj._synapse_information
+            # Skip if this is a synapse dynamics synapse type
+            if synapse_info.synapse_type_from_dynamics:
+                continue
+            stats.add_projection(proj)
+
+        for synapse_type in range(n_synapse_types):
+            max_weights[synapse_type] = stats.get_max_weight(synapse_type)
+        return max_weights
+
+    def get_ring_buffer_shifts(self) -> list[int]:
+        """
+        :returns: The shift of the ring buffers for transfer of values into
+            the input buffers for this model.
+        """
+        max_weights = self.get_max_weights()
 
         # Convert these to powers; we could use int.bit_length() for this if
         # they were integers, but they aren't...
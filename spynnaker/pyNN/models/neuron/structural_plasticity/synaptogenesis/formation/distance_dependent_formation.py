@@ -13,9 +13,10 @@
 # limitations under the License.
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 import numpy
-from numpy import floating, uint16
+from numpy import floating, integer, uint16
 from numpy.typing import ArrayLike, NDArray
 
 from spinn_utilities.overrides import overrides
@@ -32,6 +33,125 @@ from .abstract_formation import AbstractFormation
 #                 lat_prob_size)
 _PARAMS_SIZE_IN_BYTES = 6 * BYTES_PER_WORD
 
+# The number of pre-neuron positions to compare with all post-neuron
+# positions at once when the offsets can't be worked out per axis
+_POSITION_CHUNK_SIZE = 256
+
+# The number of probability LUTs to keep, shared between formation rules
+_LUT_CACHE_SIZE = 32
+
+
+def _grid_positions(
+        grid: NDArray[integer], n_positions: int) -> NDArray[integer]:
+    """
+    Get the distinct grid positions of a number of neurons.
+
+    :param grid: (x, y) dimensions of the grid
+    :param n_positions: The number of neurons
+    :return: The distinct (x, y) positions of the neurons
+    """
+    index = numpy.arange(n_positions)
+    if grid[0] > 1:
+        x = index // grid[0]
+    else:
+        x = numpy.zeros_like(index)
+    return numpy.unique(numpy.column_stack((x, index % grid[1])), axis=0)
+
+
+def _is_product(positions: NDArray[integer]) -> bool:
+    """
+    Determine if positions cover every combination of their x and y values.
+
+    :param positions: Distinct (x, y) positions
+    :return: Whether the positions are the product of their x and y values
+    """
+    return len(positions) == (
+        len(numpy.unique(positions[:, 0])) *
+        len(numpy.unique(positions[:, 1])))
+
+
+def _squared_axis_distances(
+        offsets: NDArray[integer], size: int) -> NDArray[integer]:
+    """
+    Get the squared distances along an axis with periodic boundary
+    conditions.
+
+    :param offsets: The differences in position along the axis
+    :param size: The size of the grid along the axis
+    :return: The squared distance for each offset
+    """
+    delta = numpy.abs(offsets)
+    if size > 0:
+        delta = numpy.where(delta > size * .5, delta - size, delta)
+    return delta ** 2
+
+
+def _squared_grid_distances(grid: NDArray[integer]) -> NDArray[integer]:
+    """
+    Get the distinct squared euclidian distances between neurons on a grid
+    using periodic boundary conditions.
+
+    :param grid: (x, y) dimensions of the grid
+    :return: The distinct squared distances
+    """
+    pre = _grid_positions(grid, grid[0] ** 2)
+    post = _grid_positions(grid, grid[1] ** 2)
+    if _is_product(pre) and _is_product(post):
+        # The offsets along each axis are independent
+        x_offsets = numpy.unique(numpy.subtract.outer(
+            numpy.unique(pre[:, 0]), numpy.unique(post[:, 0])))
+        y_offsets = numpy.unique(numpy.subtract.outer(
+            numpy.unique(pre[:, 1]), numpy.unique(post[:, 1])))
+        return numpy.unique(numpy.add.outer(
+            _squared_axis_distances(x_offsets, grid[0]),
+            _squared_axis_distances(y_offsets, grid[1])))
+    squared = numpy.zeros(0, dtype=pre.dtype)
+    for start in range(0, len(pre), _POSITION_CHUNK_SIZE):
+        offsets = (
+            pre[start:start + _POSITION_CHUNK_SIZE, numpy.newaxis] -
+            post[numpy.newaxis])
+        squared = numpy.union1d(squared, (
+            _squared_axis_distances(offsets[..., 0], grid[0]) +
+            _squared_axis_distances(offsets[..., 1], grid[1])))
+    return squared
+
+
+@lru_cache(maxsize=_LUT_CACHE_SIZE)
+def _distance_probabilities(
+        grid: tuple[int, ...], probability: float,
+        sigma: float) -> NDArray[uint16]:
+    """
+    Generate the exponentially decaying probability LUT of a grid.  The
+    LUT is read-only, as it is shared by the formation rules that use it.
+
+    :param grid: (x, y) dimensions of the grid
+    :param probability: peak probability
+    :param sigma: spread
+    :return: distance-dependent probabilities
+    """
+    # TODO Make distance metric "type" controllable
+    # The largest squared euclidian distance, going through the square
+    # root as the distance between each pair of neurons would
+    largest_squared_distance = numpy.max(
+        numpy.sqrt(_squared_grid_distances(numpy.asarray(grid))) ** 2)
+    squared_distances = numpy.arange(largest_squared_distance + 1)
+    raw_probabilities = probability * (
+        numpy.exp(-squared_distances / (2 * sigma ** 2)))
+    quantised_probabilities = raw_probabilities * ((2 ** 16) - 1)
+    # Quantize probabilities and cast as uint16 / short
+    unfiltered_probabilities = quantised_probabilities.astype(uint16)
+    # Only return probabilities which are non-zero
+    filtered_probabilities = unfiltered_probabilities[
+        unfiltered_probabilities > 0]
+    if filtered_probabilities.size % BYTES_PER_SHORT != 0:
+        filtered_probabilities = numpy.concatenate(
+            (filtered_probabilities,
+             numpy.zeros(filtered_probabilities.size % BYTES_PER_SHORT,
+                         dtype=uint16)))
+
+    filtered_probabilities.setflags(write=False)
+    return filtered_probabilities
+
 
 class DistanceDependentFormation(AbstractFormation):
     """
@@ -98,36 +218,8 @@ class DistanceDependentFormation(AbstractFormation):
         :param sigma: spread
         :return: distance-dependent probabilities
         """
-        euclidian_distances = numpy.ones(self.__grid ** 2) * numpy.nan
-        for row in range(euclidian_distances.shape[0]):
-            for column in range(euclidian_distances.shape[1]):
-                if self.__grid[0] > 1:
-                    pre = (row // self.__grid[0], row % self.__grid[1])
-                    post = (column // self.__grid[0], column % self.__grid[1])
-                else:
-                    pre = (0, row % self.__grid[1])
-                    post = (0, column % self.__grid[1])
-
-                # TODO Make distance metric "type" controllable
-                euclidian_distances[row, column] = self.distance(
-                    pre, post, metric='euclidian')
-        largest_squared_distance = numpy.max(euclidian_distances ** 2)
-        squared_distances = numpy.arange(largest_squared_distance + 1)
-        raw_probabilities = probability * (
-            numpy.exp(-squared_distances / (2 * sigma ** 2)))
-        quantised_probabilities = raw_probabilities * ((2 ** 16) - 1)
-        # Quantize probabilities and cast as uint16 / short
-        unfiltered_probabilities = quantised_probabilities.astype(uint16)
-        # Only return probabilities which are non-zero
-        filtered_probabilities = unfiltered_probabilities[
-            unfiltered_probabilities > 0]
-        if filtered_probabilities.size % BYTES_PER_SHORT != 0:
-            filtered_probabilities = numpy.concatenate(
-                (filtered_probabilities,
-                 numpy.zeros(filtered_probabilities.size % BYTES_PER_SHORT,
-                             dtype=uint16)))
-
-        return filtered_probabilities
+        return _distance_probabilities(
+            tuple(self.__grid.tolist()), probability, sigma)
 
     def distance(self, x0: ArrayLike, x1: ArrayLike,
                  metric: str) -> NDArray[floating]:
@@ -115,8 +115,8 @@ class AbstractPlasticSynapseDynamics(
     @abstractmethod
     def read_plastic_synaptic_data(
             self, n_synapse_types: int,
-            pp_size: NDArray[uint32], pp_data: list[NDArray[uint32]],
-            fp_size: NDArray[uint32], fp_data: list[NDArray[uint32]],
+            pp_size: NDArray[uint32], pp_data: NDArray[uint32],
+            fp_size: NDArray[uint32], fp_data: NDArray[uint32],
             max_atoms_per_core: int,
             ring_buffer_weight_scales: WeightScales) -> ConnectionsArray:
         """
@@ -125,9 +125,13 @@ class AbstractPlasticSynapseDynamics(
 
         :param n_synapse_types:
         :param pp_size: 1D
-        :param pp_data: 2D
+        :param pp_data:
+            2D, one row per synaptic row; only the start of each row is
+            valid, as given by the size
         :param fp_size: 1D
-        :param fp_data: 2D
+        :param fp_data:
+            2D, one row per synaptic row; only the start of each row is
+            valid, as given by the size
         :param max_atoms_per_core:
         :param ring_buffer_weight_scales:
         :return:
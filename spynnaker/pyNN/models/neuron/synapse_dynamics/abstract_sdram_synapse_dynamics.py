@@ -15,7 +15,7 @@
 import math
 
 import numpy
-from numpy import floating, integer, uint32
+from numpy import bool_, floating, integer, uint32
 from numpy.typing import NDArray
 
 from spinn_utilities.abstract_base import abstractmethod
@@ -136,3 +136,27 @@ class AbstractSDRAMSynapseDynamics(
             row, (0, (4 - (row.size % 4)) & 0x3), mode="constant",
             constant_values=0).view(uint32) for row in rows]
         return words
+
+    def get_row_mask(
+            self, sizes: NDArray[integer], n_items: int) -> NDArray[bool_]:
+        """
+        Get a mask of the valid items of row data read back from the
+        machine as a 2D array of one row per synaptic row.  Selecting with
+        the mask gives the valid items of all the rows in row order.
+
+        :param sizes: The number of valid items in each row
+        :param n_items: The number of items in each row of the 2D array
+        :returns: A mask of the same shape as the 2D array
+        """
+        return numpy.arange(n_items) < numpy.reshape(sizes, (-1, 1))
+
+    def get_row_sources(self, sizes: NDArray[integer]) -> NDArray[uint32]:
+        """
+        Get the row index of each item of the valid items of row data read
+        back from the machine.
+
+        :param sizes: The number of valid items in each row
+        :returns: The row index of each valid item, in row order
+        """
+        return numpy.repeat(
+            numpy.arange(len(sizes), dtype=uint32), numpy.ravel(sizes))
@@ -100,7 +100,7 @@ class AbstractStaticSynapseDynamics(
     @abstractmethod
     def read_static_synaptic_data(
             self, n_synapse_types: int,
-            ff_size: NDArray[integer], ff_data: list[NDArray[uint32]],
+            ff_size: NDArray[integer], ff_data: NDArray[uint32],
             max_atoms_per_core: int,
             ring_buffer_weight_scales: WeightScales) -> ConnectionsArray:
         """
@@ -109,6 +109,8 @@ class AbstractStaticSynapseDynamics(
         :param n_synapse_types:
         :param ff_size:
         :param ff_data:
+            2D, one row per synaptic row; only the start of each row is
+            valid, as given by the size
         :param max_atoms_per_core:
         :param ring_buffer_weight_scales:
         :return: the connections read with dtype
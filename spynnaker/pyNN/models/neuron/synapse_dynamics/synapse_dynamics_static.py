@@ -183,16 +183,15 @@ class SynapseDynamicsStatic(
     @overrides(AbstractStaticSynapseDynamics.read_static_synaptic_data)
     def read_static_synaptic_data(
             self, n_synapse_types: int, ff_size: NDArray[integer],
-            ff_data: list[NDArray[uint32]], max_atoms_per_core: int,
+            ff_data: NDArray[uint32], max_atoms_per_core: int,
             ring_buffer_weight_scales: WeightScales) -> ConnectionsArray:
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(max_atoms_per_core)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data = numpy.concatenate(ff_data)
+        data = ff_data[self.get_row_mask(ff_size, ff_data.shape[1])]
         connections = numpy.zeros(data.size, dtype=NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, ff_size[i]) for i in range(len(ff_size))])
+        connections["source"] = self.get_row_sources(ff_size)
         connections["target"] = data & neuron_id_mask
         connections["weight"] = (data >> 16) & 0xFFFF
         connections["delay"] = (data & 0xFFFF) >> (
@@ -496,35 +496,31 @@ class SynapseDynamicsSTDP(
     @overrides(AbstractPlasticSynapseDynamics.read_plastic_synaptic_data)
     def read_plastic_synaptic_data(
             self, n_synapse_types: int, pp_size: NDArray[uint32],
-            pp_data: list[NDArray[uint32]], fp_size: NDArray[uint32],
-            fp_data: list[NDArray[uint32]], max_atoms_per_core: int,
+            pp_data: NDArray[uint32], fp_size: NDArray[uint32],
+            fp_data: NDArray[uint32], max_atoms_per_core: int,
             ring_buffer_weight_scales: WeightScales) -> ConnectionsArray:
-        n_rows = len(fp_size)
-
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(max_atoms_per_core)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype=uint16)[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype=uint8)[self._n_header_bytes:] for row in pp_data]
+        # Each row has fp_size fixed half-words, and the same number of
+        # weights spaced out through the plastic data after the header
+        n_synapses = int(numpy.max(fp_size, initial=0))
+        mask = self.get_row_mask(fp_size, n_synapses)
+        data_fixed = fp_data.view(dtype=uint16)[:, :n_synapses][mask]
         synapse_structure = self.__timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
         if self.__neuromodulation:
             n_half_words += 1
             half_word = 0
-        pp_half_words = numpy.concatenate([
-            pp[:size * n_half_words * BYTES_PER_SHORT].view(uint16)[
-                half_word::n_half_words]
-            for pp, size in zip(pp_without_headers, fp_size)])
+        pp_half_words = pp_data.view(dtype=uint8)[
+            :, self._n_header_bytes:].view(dtype=uint16)[
+            :, half_word::n_half_words][:, :n_synapses][mask]
 
         connections = numpy.zeros(
             data_fixed.size, dtype=NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = self.get_row_sources(fp_size)
         connections["target"] = data_fixed & neuron_id_mask
         connections["weight"] = pp_half_words
         connections["delay"] = data_fixed >> (
@@ -61,8 +61,11 @@ if TYPE_CHECKING:
 
     _PopIndexType: TypeAlias = dict[
         tuple[PopulationApplicationVertex, SynapseInformation], int]
-    _SubpopIndexType: TypeAlias = dict[
-        tuple[PopulationApplicationVertex, SynapseInformation, int], int]
+    # The low atoms of the out-going slices of each pre-vertex, in order,
+    # and the sub-population index of each of those slices
+    _SliceIndexType: TypeAlias = dict[
+        tuple[PopulationApplicationVertex, SynapseInformation],
+        tuple[NDArray[numpy.integer], NDArray[numpy.integer]]]
 
     #: :meta private:
     ConnectionsInfo: TypeAlias = dict[
@@ -80,6 +83,48 @@ DEFAULT_INITIAL_DELAY = 1.0
 DEFAULT_S_MAX = 32
 
 
+def _post_to_pre_table(
+        conn_data: NDArray[numpy.integer], targets: NDArray[numpy.integer],
+        n_atoms: int, s_max: int) -> NDArray[numpy.uint32]:
+    """
+    Make the post-to-pre table, which has a row of `s_max` entries for each
+    target atom, holding the connections to that atom in the order given,
+    padded at the start with 0xFFFF.
+
+    :param conn_data:
+        The population index, sub-population index and source atom of each
+        connection
+    :param targets: The target atom of each connection
+    :param n_atoms: The number of target atoms
+    :param s_max: The number of entries in each row
+    :return: The table, one word per entry
+    :raises ValueError: If an atom is the target of too many connections
+    """
+    # Break data into rows based on target by sorting on it, keeping the
+    # original order within each row
+    targets = numpy.asarray(targets).astype(numpy.int64)
+    in_slice = (targets >= 0) & (targets < n_atoms)
+    targets = targets[in_slice]
+    conn_data = conn_data[in_slice]
+    order = numpy.argsort(targets, kind="stable")
+    targets = targets[order]
+    row_lengths = numpy.bincount(targets, minlength=n_atoms)
+
+    if len(row_lengths) and row_lengths.max() > s_max:
+        raise ValueError(
+            "Too many initial connections per incoming neuron")
+
+    # Make each row the required length by padding the start with 0xFFFF
+    row_starts = numpy.cumsum(row_lengths) - row_lengths
+    positions = (
+        targets * s_max + (s_max - row_lengths[targets]) +
+        numpy.arange(len(targets)) - row_starts[targets])
+    table = numpy.full((n_atoms * s_max, 3), 0xFFFF, dtype=conn_data.dtype)
+    table[positions] = conn_data[order]
+    return numpy.rec.fromarrays(
+        table.T, formats="u1, u1, u2").view("u4")
+
+
 class SynapseDynamicsStructuralCommon(
         AbstractSynapseDynamicsStructural, metaclass=AbstractBase):
     """
@@ -147,15 +192,13 @@ class SynapseDynamicsStructuralCommon(
             spec, app_vertex, vertex_slice, len(structural_projections))
 
         # Write the pre-population info
-        pop_index, subpop_index, lo_atom_index = \
-            self.__write_prepopulation_info(
-                spec, app_vertex, structural_projections,
-                weight_scales, synaptic_matrices)
+        pop_index, slice_index = self.__write_prepopulation_info(
+            spec, app_vertex, structural_projections,
+            weight_scales, synaptic_matrices)
 
         # Write the post-to-pre table
         self.__write_post_to_pre_table(
-            spec, pop_index, subpop_index, lo_atom_index, app_vertex,
-            vertex_slice)
+            spec, pop_index, slice_index, app_vertex, vertex_slice)
 
         # Write the component parameters
         # pylint: disable=protected-access
@@ -245,7 +288,7 @@ class SynapseDynamicsStructuralCommon(
             structural_projections: Iterable[Projection],
             weight_scales: NDArray[numpy.floating],
             synaptic_matrices: SynapticMatrices) -> tuple[
-                _PopIndexType, _SubpopIndexType, _SubpopIndexType]:
+                _PopIndexType, _SliceIndexType]:
         """
         :param spec:
         :param app_vertex:
@@ -253,12 +296,14 @@ class SynapseDynamicsStructuralCommon(
         :param structural_projections: Projections that are structural
         :param weight_scales:
         :param synaptic_matrices:
+        :return:
+            The index of each pre-population, and the sorted low atoms and
+            sub-population indices of the slices of each pre-population
         """
         spec.comment("Writing pre-population info")
         pop_index: _PopIndexType = {}
         routing_info = SpynnakerDataView.get_routing_infos()
-        subpop_index: _SubpopIndexType = {}
-        lo_atom_index: _SubpopIndexType = {}
+        slice_index: _SliceIndexType = {}
         index = 0
         for proj in structural_projections:
             spec.comment(f"Writing pre-population info for {proj.label}")
@@ -298,7 +343,7 @@ class SynapseDynamicsStructuralCommon(
             # Total number of atoms in pre-vertex
             spec.write_value(app_edge.pre_vertex.n_atoms)
             # Machine edge information
-            for sub, m_vertex in enumerate(out_verts):
+            for m_vertex in out_verts:
                 r_info = routing_info.get_info_from(
                     m_vertex, synapse_info.partition_id)
                 vertex_slice = m_vertex.vertex_slice
@@ -311,21 +356,26 @@ class SynapseDynamicsStructuralCommon(
                 spec.write_value(vertex_slice.lo_atom)
                 spec.write_value(synaptic_matrices.get_index(
                     app_edge, synapse_info))
-                lo = vertex_slice.lo_atom
-                for i in range(lo, vertex_slice.hi_atom + 1):
-                    subpop_index[app_edge.pre_vertex, synapse_info, i] = sub
-                    lo_atom_index[app_edge.pre_vertex, synapse_info, i] = lo
-        return pop_index, subpop_index, lo_atom_index
+            lo_atoms = numpy.array(
+                [m_vertex.vertex_slice.lo_atom for m_vertex in out_verts],
+                dtype=numpy.int64)
+            order = numpy.argsort(lo_atoms, kind="stable")
+            slice_index[app_edge.pre_vertex, synapse_info] = (
+                lo_atoms[order], order)
+        return pop_index, slice_index
 
     def __write_post_to_pre_table(
             self, spec: DataSpecificationBase, pop_index: _PopIndexType,
-            subpop_index: _SubpopIndexType, lo_atom_index: _SubpopIndexType,
+            slice_index: _SliceIndexType,
             app_vertex: PopulationVertex, vertex_slice: Slice) -> None:
         """
         Post to pre table is basically the transpose of the synaptic matrix.
 
         :param spec:
         :param pop_index:
+        :param slice_index:
+            The sorted low atoms and sub-population indices of the slices of
+            each pre-population
         :param app_vertex: the vertex for which data specs are being prepared
         :param vertex_slice: The target slice
         """
@@ -342,36 +392,30 @@ class SynapseDynamicsStructuralCommon(
         pop_indices = numpy.repeat(
             [pop_index[a_edge.pre_vertex, s_info]
              for (_, a_edge, s_info) in slice_conns], conn_lens)
-        # Make a single large array of sub-population index
-        subpop_indices = numpy.array([
-            subpop_index[a_edge.pre_vertex, s_info, c["source"]]
-            for (conns, a_edge, s_info) in slice_conns for c in conns])
-        # Get the low atom for each source and subtract
-        lo_atoms = numpy.array([
-            lo_atom_index[a_edge.pre_vertex, s_info, c["source"]]
-            for (conns, a_edge, s_info) in slice_conns for c in conns])
+        # Find the slice of the pre-vertex that each source is in, and from
+        # that the sub-population index and the low atom to subtract
+        subpop_indices = numpy.empty(len(connections), dtype=numpy.int64)
+        lo_atoms = numpy.empty(len(connections), dtype=numpy.int64)
+        start = 0
+        for (conns, a_edge, s_info) in slice_conns:
+            end = start + len(conns)
+            slice_lo_atoms, slice_subpops = slice_index[
+                a_edge.pre_vertex, s_info]
+            sub = numpy.searchsorted(
+                slice_lo_atoms, conns["source"], side="right") - 1
+            subpop_indices[start:end] = slice_subpops[sub]
+            lo_atoms[start:end] = slice_lo_atoms[sub]
+            start = end
         connections["source"] = connections["source"] - lo_atoms
 
         # Make an array of all data required
         conn_data = numpy.dstack(
             (pop_indices, subpop_indices, connections["source"]))[0]
 
-        # Break data into rows based on target and strip target out
-        rows = [conn_data[connections["target"] == i]
-                for i in range(vertex_slice.n_atoms)]
-
-        if any(len(row) > self.s_max for row in rows):
-            raise ValueError(
-                "Too many initial connections per incoming neuron")
-
-        # Make each row the required length through padding with 0xFFFF
-        padded_rows = [numpy.pad(row, [(self.s_max - len(row), 0), (0, 0)],
-                                 "constant", constant_values=0xFFFF)
-                       for row in rows]
-
         # Finally make the table and write it out
-        post_to_pre = numpy.rec.fromarrays(
-            numpy.concatenate(padded_rows).T, formats="u1, u1, u2").view("u4")
+        post_to_pre = _post_to_pre_table(
+            conn_data, connections["target"], vertex_slice.n_atoms,
+            self.s_max)
         if len(post_to_pre) != vertex_slice.n_atoms * self.s_max:
             raise ValueError(
                 f"Wrong size of pre-to-pop tables: {len(post_to_pre)} "
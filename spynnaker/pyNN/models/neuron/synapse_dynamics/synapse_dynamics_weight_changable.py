@@ -247,8 +247,8 @@ class SynapseDynamicsWeightChangable(
     @overrides(AbstractPlasticSynapseDynamics.read_plastic_synaptic_data)
     def read_plastic_synaptic_data(
             self, n_synapse_types: int, pp_size: NDArray[uint32],
-            pp_data: list[NDArray[uint32]], fp_size: NDArray[uint32],
-            fp_data: list[NDArray[uint32]],
+            pp_data: NDArray[uint32], fp_size: NDArray[uint32],
+            fp_data: NDArray[uint32],
             max_atoms_per_core: int,
             ring_buffer_weight_scales: WeightScales) -> ConnectionsArray:
         logger.warning(
@@ -256,25 +256,19 @@ class SynapseDynamicsWeightChangable(
             " change-spike has been received, and so the weights might"
             " not be as expected")
 
-        n_rows = len(fp_size)
-
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(max_atoms_per_core)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype=uint16)[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype=uint8)[BYTES_PER_WORD:] for row in pp_data]
-        pp_half_words = numpy.concatenate(
-            [pp[:size * BYTES_PER_SHORT]
-             for pp, size in zip(pp_without_headers, fp_size)]).view(uint16)
+        n_synapses = int(numpy.max(fp_size, initial=0))
+        mask = self.get_row_mask(fp_size, n_synapses)
+        data_fixed = fp_data.view(dtype=uint16)[:, :n_synapses][mask]
+        pp_half_words = pp_data.view(dtype=uint8)[
+            :, BYTES_PER_WORD:].view(dtype=uint16)[:, :n_synapses][mask]
 
         connections = numpy.zeros(
             data_fixed.size, dtype=NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = self.get_row_sources(fp_size)
         connections["target"] = data_fixed & neuron_id_mask
         connections["weight"] = pp_half_words
         connections["delay"] = data_fixed >> (
@@ -210,18 +210,17 @@ class SynapseDynamicsWeightChanger(
     @overrides(AbstractPlasticSynapseDynamics.read_plastic_synaptic_data)
     def read_plastic_synaptic_data(
             self, n_synapse_types: int,
-            pp_size: NDArray[uint32], pp_data: list[NDArray[uint32]],
-            fp_size: NDArray[uint32], fp_data: list[NDArray[uint32]],
+            pp_size: NDArray[uint32], pp_data: NDArray[uint32],
+            fp_size: NDArray[uint32], fp_data: NDArray[uint32],
             max_atoms_per_core: int,
             ring_buffer_weight_scales: WeightScales) -> ConnectionsArray:
-        data = numpy.concatenate(fp_data)
+        data = fp_data[self.get_row_mask(fp_size, fp_data.shape[1])]
         weight = ((data >> 16) & 0xFFFF).astype(int16)
         n_synapse_type_bits = get_n_bits(n_synapse_types)
         n_neuron_id_bits = get_n_bits(max_atoms_per_core)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
         connections = numpy.zeros(data.size, dtype=NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = self.get_row_sources(fp_size)
         connections["target"] = data & neuron_id_mask
         connections["weight"] = weight
         connections["delay"] = 1
@@ -13,6 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -350,50 +351,106 @@ def _get_row_data(
     :param ring_buffer_weight_scales:
         The scaling of the weights for the ring buffers of each synapse type
     """
-    fp_data: NDArray[uint32] | list[NDArray[uint32]]
-    pp_data: NDArray[uint32] | list[NDArray[uint32]]
+    # Each row is laid out as:
+    #     pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding
+    # and every row is the same length, so the whole matrix is written
+    # into a single zero-filled block; the padding is then already there.
+    row_n_words = max_row_n_words + _N_HEADER_WORDS
+    block = numpy.zeros(n_rows * row_n_words, dtype=uint32)
+    row_starts = numpy.arange(n_rows, dtype=numpy.int64) * row_n_words
+
     if isinstance(synapse_dynamics, AbstractStaticSynapseDynamics):
-        # Get the static data
+        # Get the static data; there is no plastic data
         ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
             connections, row_indices, n_rows, n_synapse_types,
             max_row_n_synapses, max_atoms_per_core,
             ring_buffer_weight_scales)
+        ff_words = _get_row_n_words(ff_data)
+        _check_row_n_words(ff_words, max_row_n_words)
 
-        # Blank the plastic data
-        fp_data = numpy.zeros((n_rows, 0), dtype=uint32)
-        pp_data = numpy.zeros((n_rows, 0), dtype=uint32)
-        fp_size:  NDArray[uint32]
-        fp_size = numpy.zeros((n_rows, 1), dtype=uint32)
-        pp_size:  NDArray[uint32]
-        pp_size = numpy.zeros((n_rows, 1), dtype=uint32)
+        # pp_size and fp_size stay as 0
+        block[row_starts + 1] = numpy.ravel(ff_size)
+        _scatter_rows(block, ff_data, ff_words, row_starts + _N_HEADER_WORDS)
     else:
         assert isinstance(synapse_dynamics, AbstractPlasticSynapseDynamics)
-        # Blank the static data
-        ff_data = [numpy.zeros(0, dtype=uint32) for _ in range(n_rows)]
-        ff_size = numpy.zeros((n_rows, 1), dtype=uint32)
-
-        # Get the plastic data
+        # Get the plastic data; there is no static data
         fp_data, pp_data, fp_size, pp_size = \
             synapse_dynamics.get_plastic_synaptic_data(
                 connections, row_indices, n_rows, n_synapse_types,
                 max_row_n_synapses, max_atoms_per_core,
                 ring_buffer_weight_scales)
+        pp_words = _get_row_n_words(pp_data)
+        fp_words = _get_row_n_words(fp_data)
+        _check_row_n_words(pp_words + fp_words, max_row_n_words)
+
+        # ff_size stays as 0
+        block[row_starts] = numpy.ravel(pp_size)
+        block[row_starts + pp_words + 2] = numpy.ravel(fp_size)
+        _scatter_rows(block, pp_data, pp_words, row_starts + 1)
+        _scatter_rows(
+            block, fp_data, fp_words,
+            row_starts + pp_words + _N_HEADER_WORDS)
 
-    # Add some padding
-    row_lengths = [
-        pp_data[i].size + fp_data[i].size + ff_data[i].size
-        for i in range(n_rows)]
-    padding = [
-        numpy.zeros(max_row_n_words - row_length, dtype=uint32)
-        for row_length in row_lengths]
+    # Return the data
+    return block
 
-    # Join the bits into rows
-    rows = [numpy.concatenate(items) for items in zip(
-        pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding)]
-    row_data = numpy.concatenate(rows)
 
-    # Return the data
-    return row_data
+def _get_row_n_words(
+        rows: Sequence[NDArray[uint32]] | NDArray[uint32]
+        ) -> NDArray[numpy.int64]:
+    """
+    Get the number of words in each of a set of rows.
+
+    :param rows: The rows, either as a list or as a 2D array
+    :return: The number of words in each row
+    """
+    if isinstance(rows, numpy.ndarray):
+        return numpy.full(
+            rows.shape[0], numpy.prod(rows.shape[1:]), dtype=numpy.int64)
+    return numpy.fromiter(
+        (row.size for row in rows), dtype=numpy.int64, count=len(rows))
+
+
+def _check_row_n_words(
+        row_n_words: NDArray[numpy.int64], max_row_n_words: int) -> None:
+    """
+    Check that no row has more words than are available.
+
+    :param row_n_words: The number of words in each row
+    :param max_row_n_words: The maximum number of words in a row
+    :raises ValueError: If any row is too long
+    """
+    if row_n_words.size and row_n_words.max() > max_row_n_words:
+        raise ValueError(
+            f"A row of {row_n_words.max()} words will not fit in the "
+            f"maximum row length of {max_row_n_words} words")
+
+
+def _scatter_rows(
+        block: NDArray[uint32],
+        rows: Sequence[NDArray[uint32]] | NDArray[uint32],
+        row_n_words: NDArray[numpy.int64],
+        row_offsets: NDArray[numpy.int64]) -> None:
+    """
+    Write rows of varying length into a flat block of words.
+
+    :param block: The block to write into
+    :param rows: The rows to write, either as a list or as a 2D array
+    :param row_n_words: The number of words in each row
+    :param row_offsets: Where in the block the first word of each row goes
+    """
+    n_words = int(row_n_words.sum())
+    if not n_words:
+        return
+    if isinstance(rows, numpy.ndarray):
+        data = rows.reshape(-1)
+    else:
+        data = numpy.concatenate(rows)
+    # The index of each word within the concatenated data, shifted by how
+    # far each row has to move from its position in the concatenated data
+    # to its position in the block
+    row_shift = row_offsets - (numpy.cumsum(row_n_words) - row_n_words)
+    block[numpy.arange(n_words) + numpy.repeat(row_shift, row_n_words)] = data
 
 
 def convert_to_connections(
@@ -518,10 +575,35 @@ def read_all_synapses(
     return numpy.concatenate(connections)
 
 
+def _get_row_words(
+        row_data: _RowData, start: int | NDArray[integer],
+        n_words: NDArray[integer]) -> _RowData:
+    """
+    Get a section of each row of the raw row data as a 2D array, with one
+    row of the array per synaptic row.  Where rows have fewer words than
+    the longest row, the remaining words of that row are not meaningful.
+
+    :param row_data: The raw row data
+    :param start:
+        The word in each row at which the section starts; if the same for
+        all rows, the result is a view of the raw row data
+    :param n_words: The number of words in the section of each row
+    :return: The sections of the rows, as many words wide as the largest
+        section
+    """
+    width = int(numpy.max(n_words, initial=0))
+    if isinstance(start, (int, integer)):
+        return row_data[:, start:start + width]
+    columns = numpy.minimum(
+        numpy.reshape(start, (-1, 1)) + numpy.arange(width),
+        row_data.shape[1] - 1)
+    return numpy.take_along_axis(row_data, columns, axis=1)
+
+
 def _parse_static_data(
         row_data: _RowData,
         dynamics: AbstractStaticSynapseDynamics) -> tuple[
-            NDArray[numpy.integer], list[_RowData]]:
+            NDArray[numpy.integer], _RowData]:
     """
     Parse static synaptic data.
 
@@ -529,16 +611,11 @@ def _parse_static_data(
     :param dynamics:
         The synapse dynamics that can decode the rows
     :return: A tuple of the recorded length of each row and the row data
-        organised into rows
+        organised into rows, as a 2D array
     """
-    n_rows = row_data.shape[0]
     ff_size = row_data[:, 1]
     ff_words = dynamics.get_n_static_words_per_row(ff_size)
-    ff_start = _N_HEADER_WORDS
-    ff_end = ff_start + ff_words
-    return (
-        ff_size,
-        [row_data[row, ff_start:ff_end[row]] for row in range(n_rows)])
+    return ff_size, _get_row_words(row_data, _N_HEADER_WORDS, ff_words)
 
 
 def _read_static_data(
@@ -581,7 +658,7 @@ def _read_static_data(
 def _parse_plastic_data(
         row_data: _RowData,
         dynamics: AbstractPlasticSynapseDynamics) -> tuple[
-            NDArray[uint32], list[_RowData], NDArray[uint32], list[_RowData]]:
+            NDArray[uint32], _RowData, NDArray[uint32], _RowData]:
     """
     Parse plastic synapses from raw row data.
 
@@ -589,23 +666,19 @@ def _parse_plastic_data(
     :param dynamics:
         The dynamics that generated the data
     :return: A tuple of the recorded length of the plastic-plastic data in
-        each row; the plastic-plastic data organised into rows; the
-        recorded length of the static-plastic data in each row; and the
-        static-plastic data organised into rows
+        each row; the plastic-plastic data organised into rows as a 2D
+        array; the recorded length of the static-plastic data in each row;
+        and the static-plastic data organised into rows as a 2D array
     """
     n_rows = row_data.shape[0]
     pp_size = row_data[:, 0]
     pp_words = dynamics.get_n_plastic_plastic_words_per_row(pp_size)
     fp_size = row_data[numpy.arange(n_rows), pp_words + 2]
     fp_words = dynamics.get_n_fixed_plastic_words_per_row(fp_size)
-    fp_start = pp_size + _N_HEADER_WORDS
-    fp_end = fp_start + fp_words
-    row_ids = range(n_rows)
+    fp_start = pp_words + _N_HEADER_WORDS
     return (
-        pp_size,
-        [row_data[row, 1:pp_words[row] + 1] for row in row_ids],
-        fp_size,
-        [row_data[row, fp_start[row]:fp_end[row]] for row in row_ids])
+        pp_size, _get_row_words(row_data, 1, pp_words),
+        fp_size, _get_row_words(row_data, fp_start, fp_words))
 
 
 def _read_plastic_data(
@@ -665,23 +738,16 @@ def _convert_delayed_data(
     """
     # Work out the delay stage of each row; rows are the all the rows
     # from the first delay stage, then all from the second stage and so on
-    synapse_ids = range(len(n_synapses))
-    row_stage = numpy.array([
-        i // n_pre_atoms
-        for i in synapse_ids], dtype=uint32)
+    row_stage = (
+        numpy.arange(len(n_synapses), dtype=uint32) // uint32(n_pre_atoms))
     # Work out the delay for each stage
     row_min_delay = (row_stage + 1) * post_vertex_max_delay_ticks
     # Repeat the delay for all connections in the same row
-    connection_min_delay = numpy.concatenate([
-        numpy.repeat(row_min_delay[i], n_synapses[i])
-        for i in synapse_ids])
+    connection_min_delay = numpy.repeat(row_min_delay, n_synapses)
     # Repeat the "extra" source id for all connections in the same row;
     # this converts the row id back to a source neuron id
-    connection_source_extra = numpy.concatenate([
-        numpy.repeat(
-            row_stage[i] * uint32(n_pre_atoms),
-            n_synapses[i])
-        for i in synapse_ids])
+    connection_source_extra = numpy.repeat(
+        row_stage * uint32(n_pre_atoms), n_synapses)
     # Do the conversions
     delayed_connections["source"] -= connection_source_extra
     delayed_connections["delay"] += connection_min_delay
@@ -13,7 +13,10 @@
 # limitations under the License.
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -24,6 +27,9 @@ from typing import (
 import numpy
 from numpy import uint32
 from numpy.typing import NDArray
+from pyNN.random import RandomDistribution
+
+from spinn_utilities.config_holder import get_config_int
 
 from pacman.model.graphs.application import ApplicationVirtualVertex
 from pacman.model.graphs.common import Slice
@@ -36,6 +42,14 @@ from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.models.common import PopulationApplicationVertex
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllButMeConnector,
+    AllToAllConnector,
+    ArrayConnector,
+    FromListConnector,
+    OneToOneConnector,
+    OneToOneOffsetConnector,
+)
 from spynnaker.pyNN.models.neuron.master_pop_table import (
     MasterPopTableAsBinarySearch,
 )
@@ -51,7 +65,7 @@ from spynnaker.pyNN.utilities.bit_field_utilities import (
     write_bitfield_init_data,
 )
 
-from .synaptic_matrix_app import SynapticMatrixApp
+from .synaptic_matrix_app import RowData, SynapticMatrixApp
 
 if TYPE_CHECKING:
     from spynnaker.pyNN.models.neural_projections import (
@@ -81,6 +95,23 @@ DIRECT_MATRIX_HEADER_COST_BYTES = 1 * BYTES_PER_WORD
 # Value to use when there is no region
 INVALID_REGION_ID = 0xFFFFFFFF
 
+# Connectors which make no random numbers when weights and delays are not
+# random, so can be generated on host in any order
+_DETERMINISTIC_CONNECTORS = (
+    AllButMeConnector, AllToAllConnector, ArrayConnector, FromListConnector,
+    OneToOneConnector, OneToOneOffsetConnector)
+
+
+def _uses_random(synapse_info: SynapseInformation) -> bool:
+    """
+    :param synapse_info:
+    :return: Whether generating the synapses might draw random numbers
+    """
+    return (
+        not isinstance(synapse_info.connector, _DETERMINISTIC_CONNECTORS) or
+        isinstance(synapse_info.weights, RandomDistribution) or
+        isinstance(synapse_info.delays, RandomDistribution))
+
 
 class SynapseRegions(NamedTuple):
     """
@@ -373,9 +404,11 @@ class SynapticMatrices:
         # Get the on-host data to be written
         block_addr = 0
         data_to_write: list[NDArray[uint32]] = []
-        for matrix in self.__on_host_matrices:
+        for matrix, row_data in zip(
+                self.__on_host_matrices,
+                self.__generate_on_host_row_data(post_vertex_slice)):
             block_addr = matrix.append_matrix(
-                post_vertex_slice, data_to_write, block_addr)
+                post_vertex_slice, data_to_write, block_addr, row_data)
 
         # Write on-host data
         spec.reserve_memory_region(
@@ -393,6 +426,59 @@ class SynapticMatrices:
             spec, self.__regions.bitfield_filter, self.__bit_field_size,
             references.bitfield_filter)
 
+    def __generate_on_host_row_data(
+            self, post_vertex_slice: Slice) -> Sequence[RowData | None]:
+        """
+        Generate the row data of the on-host matrices in a pool of threads,
+        if configured to do so.
+
+        Matrices which share a connector, or which might use random numbers,
+        are generated in their original order in the same thread, so the
+        result is the same as generating one matrix after another.
+
+        :param post_vertex_slice:
+            The slice of the post-vertex the matrices are for
+        :return: The row data of each on-host matrix, or `None` for each
+            matrix to be generated as it is appended
+        """
+        n_matrices = len(self.__on_host_matrices)
+        n_threads = get_config_int("Simulation", "n_host_synapse_threads")
+        if n_threads is None or n_threads <= 1 or n_matrices <= 1:
+            return [None] * n_matrices
+
+        # Anything sharing a connector with a random matrix is random too
+        random_connectors = {
+            id(matrix.synapse_info.connector)
+            for matrix in self.__on_host_matrices
+            if _uses_random(matrix.synapse_info)}
+        groups: dict[int, list[SynapticMatrixApp]] = defaultdict(list)
+        for matrix in self.__on_host_matrices:
+            key = id(matrix.synapse_info.connector)
+            if key in random_connectors:
+                key = 0
+            groups[key].append(matrix)
+
+        def generate(
+                matrices: list[SynapticMatrixApp]) -> list[RowData]:
+            return [matrix.generate_row_data(post_vertex_slice)
+                    for matrix in matrices]
+
+        # Use the shared pool if there is one, or make one just for this core
+        pool: AbstractContextManager[ThreadPoolExecutor]
+        shared_pool = SpynnakerDataView.get_host_synapse_pool()
+        if shared_pool is not None:
+            pool = nullcontext(shared_pool)
+        else:
+            pool = ThreadPoolExecutor(max_workers=min(n_threads, len(groups)))
+        row_data: dict[int, RowData] = {}
+        with pool as executor:
+            futures = [(matrices, executor.submit(generate, matrices))
+                       for matrices in groups.values()]
+            for matrices, future in futures:
+                for matrix, data in zip(matrices, future.result()):
+                    row_data[id(matrix)] = data
+        return [row_data[id(matrix)] for matrix in self.__on_host_matrices]
+
     def __write_synapse_expander_data_spec(
             self, spec: DataSpecificationBase, post_vertex_slice: Slice,
             connection_builder_ref: int | None = None) -> None:
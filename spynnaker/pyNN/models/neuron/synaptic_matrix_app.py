@@ -13,7 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import numpy
 from numpy import uint32
@@ -50,6 +50,18 @@ if TYPE_CHECKING:
     from .master_pop_table import MasterPopTableAsBinarySearch
 
 
+class RowData(NamedTuple):
+    """
+    The host-generated data of a synaptic matrix for one post-vertex slice.
+    """
+    #: The connections, as made by the connector
+    connections: NDArray
+    #: The undelayed row data
+    row_data: NDArray[uint32]
+    #: The delayed row data
+    delayed_row_data: NDArray[uint32]
+
+
 class SynapticMatrixApp:
     """
     The synaptic matrix (and delay matrix if applicable) for an incoming
@@ -148,6 +160,13 @@ class SynapticMatrixApp:
         self.__download_index: int | None = None
         self.__download_delay_index: int | None = None
 
+    @property
+    def synapse_info(self) -> SynapseInformation:
+        """
+        The synapse information of the projection.
+        """
+        return self.__synapse_info
+
     @property
     def gen_size(self) -> int:
         """
@@ -267,7 +286,8 @@ class SynapticMatrixApp:
     def append_matrix(
             self, post_vertex_slice: Slice,
             data_to_write: list[NDArray[uint32]],
-            block_addr: int) -> int:
+            block_addr: int,
+            row_data: RowData | None = None) -> int:
         """
         Append a synaptic matrix from be written from host.
 
@@ -275,20 +295,32 @@ class SynapticMatrixApp:
             The slice of the post-vertex the matrix is for
         :param data_to_write: List to append the data to write to
         :param block_addr: The amount of data written so far
+        :param row_data:
+            The result of :py:meth:`generate_row_data` for this slice
+            if already generated, or `None` to generate it now
         :return: The amount of data written after this data has been written
         """
-        row_data, delay_row_data = self.__get_row_data(post_vertex_slice)
+        if row_data is None:
+            row_data = self.generate_row_data(post_vertex_slice)
+        connections, undelayed_data, delayed_data = row_data
+
+        # Set connections for structural plasticity
+        if isinstance(self.__synapse_info.synapse_dynamics,
+                      AbstractSynapseDynamicsStructural):
+            self.__synapse_info.synapse_dynamics.set_connections(
+                connections, post_vertex_slice, self.__app_edge,
+                self.__synapse_info)
         self.__update_connection_holders(
-            row_data, delay_row_data, post_vertex_slice)
+            undelayed_data, delayed_data, post_vertex_slice)
         if self.__syn_mat_offset is not None:
             block_addr = self.__get_padding(
                 data_to_write, self.__syn_mat_offset, block_addr)
-            data_to_write.append(row_data)
+            data_to_write.append(undelayed_data)
             block_addr += self.__matrix_size
         if self.__delay_syn_mat_offset is not None:
             block_addr = self.__get_padding(
                 data_to_write, self.__delay_syn_mat_offset, block_addr)
-            data_to_write.append(delay_row_data)
+            data_to_write.append(delayed_data)
             block_addr += self.__delay_matrix_size
         return block_addr
 
@@ -305,12 +337,17 @@ class SynapticMatrixApp:
             return block_addr + (padding * BYTES_PER_WORD)
         return block_addr
 
-    def __get_row_data(
-            self, post_vertex_slice: Slice) -> tuple[NDArray, NDArray]:
+    def generate_row_data(self, post_vertex_slice: Slice) -> RowData:
         """
         Generate the row data for a synaptic matrix from the description.
 
-        :return: The data and the delayed data
+        This only reads shared state, so it can be called for different
+        matrices at the same time, provided matrices that share a connector
+        or random number generator are generated in a fixed order.
+
+        :param post_vertex_slice:
+            The slice of the post-vertex the matrix is for
+        :return: The connections, the data and the delayed data
         """
         # Get the actual connections
         post_slices =\
@@ -330,18 +367,12 @@ class SynapticMatrixApp:
             self.__max_row_info, self.__app_key_info is not None,
             self.__delay_app_key_info is not None, self.__max_atoms_per_core)
 
-        # Set connections for structural plasticity
-        if isinstance(self.__synapse_info.synapse_dynamics,
-                      AbstractSynapseDynamicsStructural):
-            self.__synapse_info.synapse_dynamics.set_connections(
-                connections, post_vertex_slice, self.__app_edge,
-                self.__synapse_info)
         if self.__app_edge.delay_edge is None and len(delayed_row_data) != 0:
             raise ValueError(
                 "Found delayed source IDs but no delay "
                 f"edge for {self.__app_edge.label}")
 
-        return row_data, delayed_row_data
+        return RowData(connections, row_data, delayed_row_data)
 
     def __update_connection_holders(
             self, data: NDArray[uint32], delayed_data: NDArray[uint32],
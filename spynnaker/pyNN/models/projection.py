@@ -26,9 +26,11 @@ from typing import (
 
 import numpy
 from numpy import void
+from numpy.lib.recfunctions import structured_to_unstructured
 from numpy.typing import NDArray
 from pyNN.recording.files import BaseFile
 from pyNN.space import Space as PyNNSpace
+from scipy.sparse import save_npz
 from typing_extensions import Never
 
 from spinn_utilities.config_holder import get_config_bool
@@ -52,6 +54,7 @@ from spynnaker.pyNN.models.neural_projections.connectors import (
     FromListConnector,
 )
 from spynnaker.pyNN.models.neuron import ConnectionHolder, PopulationVertex
+from spynnaker.pyNN.models.neuron.connection_holder import MULTIPLE_SYNAPSES
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractHasParameterNames,
     SynapseDynamicsStatic,
@@ -246,7 +249,8 @@ class Projection:
     def get(self, attribute_names: str | Sequence[str],
             format: str,  # @ReservedAssignment
             gather: Literal[True] = True, with_address: bool = True,
-            multiple_synapses: Literal['last'] = 'last') -> ConnectionHolder:
+            multiple_synapses: str = 'last',
+            structured: bool = False) -> ConnectionHolder:
         """
         Get a parameter/attribute of the projection.
 
@@ -254,34 +258,57 @@ class Projection:
             SpiNNaker always gathers.
 
         :param attribute_names: list of attributes to gather
-        :param format: ``"list"`` or ``"array"``
+        :param format:
+            ``"list"``, ``"array"`` or ``"sparse"``.
+            ``"sparse"`` is like ``"array"`` but gives each attribute as a
+            :py:class:`scipy.sparse.csr_array` holding only the connections
+            that exist, which avoids a dense matrix for large projections
         :param gather: Ignored. Purely for PyNN compatibility
         :param with_address:
             True if the source and target are to be included
         :param multiple_synapses:
-            What to do with the data if format="array" and if the multiple
-            source-target pairs with the same values exist.  Currently only
-            "last" is supported
+            What to do with the data if format is ``"array"`` or
+            ``"sparse"`` and multiple source-target pairs with the same
+            values exist; one of ``"last"``, ``"first"``, ``"sum"``,
+            ``"min"`` or ``"max"``
+        :param structured:
+            If format is ``"list"``, True to get the connections, sorted by
+            source and then target, as a numpy structured array (or a single
+            array if only one attribute is requested) rather than as Python
+            lists; this is much faster and smaller for large projections
         :return: values selected
+        :raises \
+            ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+            If multiple_synapses is not recognised
         """
         if not gather:
             logger.warning("sPyNNaker always gathers from every core.")
-        if multiple_synapses != 'last':
+        if multiple_synapses not in MULTIPLE_SYNAPSES:
             raise ConfigurationException(
-                "sPyNNaker only recognises multiple_synapses == last")
+                f"sPyNNaker only recognises multiple_synapses in "
+                f"{MULTIPLE_SYNAPSES}")
         an = [attribute_names] if isinstance(attribute_names, str) else list(
             attribute_names)
 
-        return self.__get_data(an, format, with_address, notify=None)
+        return self.__get_data(
+            an, format, with_address, notify=None,
+            multiple_synapses=multiple_synapses, structured=structured)
 
     def save(
             self, attribute_names: str | Sequence[str],
             file: str | BaseFile,
             format: str = 'list',  # @ReservedAssignment
-            gather: Literal[True] = True, with_address: bool = True) -> None:
+            gather: Literal[True] = True, with_address: bool = True,
+            multiple_synapses: str = 'last') -> None:
         """
         Print synaptic attributes (weights, delays, etc.) to file. In the
         array format, zeros are printed for non-existent connections.
+        In the sparse format, a single attribute is saved as a
+        :py:func:`scipy.sparse.save_npz` file holding only the connections
+        that exist.
+        In the npy format, the list is saved as a binary :py:func:`numpy.save`
+        file, with a field per column, which :py:class:`FromFileConnector`
+        can memory-map back in without parsing any text.
         Values will be expressed in the standard PyNN units (i.e.,
         millivolts, nanoamps, milliseconds, microsiemens, nanofarads,
         event per second).
@@ -291,14 +318,26 @@ class Projection:
 
         :param attribute_names:
         :param file: filename or open handle (which will be closed)
-        :param format:
+        :param format: ``"list"``, ``"array"``, ``"sparse"`` or ``"npy"``
         :param gather: Ignored. Purely for PyNN compatibility
         :param with_address:
+        :param multiple_synapses:
+            What to do with the data if format is ``"array"`` or
+            ``"sparse"`` and multiple source-target pairs with the same
+            values exist; as for :py:meth:`get`
+        :raises \
+            ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+            If the sparse format is asked for with other than one attribute,
+            or if multiple_synapses is not recognised
         """
         if not gather:
             warn_once(
                 logger, "sPyNNaker only supports gather=True. We will run "
                 "as if gather was set to True.")
+        if multiple_synapses not in MULTIPLE_SYNAPSES:
+            raise ConfigurationException(
+                f"sPyNNaker only recognises multiple_synapses in "
+                f"{MULTIPLE_SYNAPSES}")
         if isinstance(attribute_names, str):
             attribute_names = [attribute_names]
         else:
@@ -310,26 +349,49 @@ class Projection:
                 attribute_names = list(sd.get_parameter_names())
             else:
                 attribute_names = []
+        if format == "sparse":
+            if len(attribute_names) != 1:
+                raise ConfigurationException(
+                    "Only a single attribute can be saved in sparse format")
+            self.__get_data(
+                attribute_names, format, with_address,
+                notify=functools.partial(self.__save_sparse_callback, file),
+                multiple_synapses=multiple_synapses)
+            return
         metadata = {"columns": attribute_names}
         if with_address:
             metadata["columns"] = ["i", "j"] + list(metadata["columns"])
+        if format == "npy":
+            self.__get_data(
+                attribute_names, "list", with_address,
+                notify=functools.partial(
+                    self.__save_npy_callback, file, metadata["columns"]),
+                structured=True)
+            return
         self.__get_data(
             attribute_names, format, with_address,
-            notify=functools.partial(self.__save_callback, file, metadata))
+            notify=functools.partial(self.__save_callback, file, metadata),
+            multiple_synapses=multiple_synapses, structured=True)
 
     def __get_data(
             self, attribute_names: list[str],
             format: str,  # @ReservedAssignment
             with_address: bool,
-            notify: Callable[[ConnectionHolder], None] | None
-            ) -> ConnectionHolder:
+            notify: Callable[[ConnectionHolder], None] | None,
+            multiple_synapses: str = "last",
+            structured: bool = False) -> ConnectionHolder:
         """
         Internal data getter to add notify option.
 
         :param attribute_names: list of attributes to gather
-        :param format: ``"list"`` or ``"array"``
+        :param format: ``"list"``, ``"array"`` or ``"sparse"``
         :param with_address:
         :param notify:
+        :param multiple_synapses:
+            How to combine multiple synapses between the same neurons if not
+            returning a list
+        :param structured:
+            Whether to return a list as numpy arrays rather than Python lists
         :return: values selected
         """
         # fix issue with 1 versus many
@@ -362,7 +424,9 @@ class Projection:
 
         # Return the connection data
         return self._get_synaptic_data(
-            format == "list", data_items, fixed_values, notify=notify)
+            format == "list", data_items, fixed_values, notify=notify,
+            sparse=format == "sparse", multiple_synapses=multiple_synapses,
+            structured=structured)
 
     @staticmethod
     def __save_callback(
@@ -374,10 +438,10 @@ class Projection:
         :param data:
         """
         # Convert structured array to normal numpy array
-        if hasattr(data, "dtype") and hasattr(data.dtype, "names"):
-            dtype = [(name, "<f8") for name in data.dtype.names]
-            data = data.astype(dtype)
-        npdata = numpy.nan_to_num(cast(NDArray, data))
+        npdata = numpy.asarray(data)
+        if npdata.dtype.names is not None:
+            npdata = structured_to_unstructured(npdata, dtype=numpy.float64)
+        npdata = numpy.nan_to_num(npdata)
         if isinstance(save_file, str):
             data_file = open(save_file, mode='wb')
         else:
@@ -393,6 +457,50 @@ class Projection:
         finally:
             data_file.close()
 
+    @staticmethod
+    def __save_sparse_callback(
+            save_file: str | BaseFile, data: ConnectionHolder) -> None:
+        """
+        :param save_file:
+        :param data:
+        """
+        with open(Projection.__binary_filename(save_file), mode='wb') as f:
+            save_npz(f, data.tocsr())
+
+    @staticmethod
+    def __save_npy_callback(
+            save_file: str | BaseFile, columns: list[str],
+            data: ConnectionHolder) -> None:
+        """
+        :param save_file:
+        :param columns:
+        :param data:
+        """
+        # Store every column as a float so the file can be read back as a
+        # two-dimensional array without a copy
+        npdata = numpy.asarray(data)
+        binary = numpy.empty(
+            len(npdata), dtype=[(column, "<f8") for column in columns])
+        if npdata.dtype.names is None:
+            binary[columns[0]] = npdata
+        else:
+            for column, name in zip(columns, npdata.dtype.names):
+                binary[column] = npdata[name]
+        with open(Projection.__binary_filename(save_file), mode='wb') as f:
+            numpy.save(f, binary)
+
+    @staticmethod
+    def __binary_filename(save_file: str | BaseFile) -> str:
+        """
+        :param save_file:
+        :return: The name of the file to write binary data to
+        """
+        if isinstance(save_file, str):
+            return save_file
+        # Reopen by name, as the file might not have been opened to write
+        save_file.close()
+        return save_file.name
+
     @property
     def pre(self) -> _Pop:
         """
@@ -458,8 +566,9 @@ class Projection:
     def _get_synaptic_data(
             self, as_list: bool, data_to_get: list[str],
             fixed_values: list[tuple[str, int]],
-            notify: Callable[[ConnectionHolder], None] | None
-            ) -> ConnectionHolder:
+            notify: Callable[[ConnectionHolder], None] | None,
+            sparse: bool = False, multiple_synapses: str = "last",
+            structured: bool = False) -> ConnectionHolder:
         post_vertex = self.__projection_edge.post_vertex
         pre_vertex = self.__projection_edge.pre_vertex
 
@@ -468,7 +577,8 @@ class Projection:
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
                 self.__virtual_connection_list, fixed_values=fixed_values,
-                notify=notify)
+                notify=notify, sparse=sparse,
+                multiple_synapses=multiple_synapses, structured=structured)
             connection_holder.finish()
             return connection_holder
 
@@ -476,7 +586,8 @@ class Projection:
         # possible later date
         connection_holder = ConnectionHolder(
             data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-            fixed_values=fixed_values, notify=notify)
+            fixed_values=fixed_values, notify=notify, sparse=sparse,
+            multiple_synapses=multiple_synapses, structured=structured)
 
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
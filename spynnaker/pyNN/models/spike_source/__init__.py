@@ -14,6 +14,7 @@
 
 from .spike_source_array import SpikeSourceArray
 from .spike_source_array_vertex import SpikeSourceArrayVertex
+from .spike_source_from_binary_file import SpikeSourceFromBinaryFile
 from .spike_source_from_file import SpikeSourceFromFile
 from .spike_source_poisson import SpikeSourcePoisson
 from .spike_source_poisson_machine_vertex import (
@@ -23,6 +24,7 @@ from .spike_source_poisson_variable import SpikeSourcePoissonVariable
 from .spike_source_poisson_vertex import SpikeSourcePoissonVertex
 
 __all__ = ["SpikeSourceArray", "SpikeSourceArrayVertex",
-           "SpikeSourceFromFile", "SpikeSourcePoisson",
+           "SpikeSourceFromBinaryFile", "SpikeSourceFromFile",
+           "SpikeSourcePoisson",
            "SpikeSourcePoissonMachineVertex", "SpikeSourcePoissonVariable",
            "SpikeSourcePoissonVertex"]
@@ -14,7 +14,9 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy
 
 from spinn_utilities.overrides import overrides
 
@@ -25,6 +27,8 @@ from spinn_front_end_common.utility_models import (
 )
 
 from spynnaker.pyNN.data.spynnaker_data_view import SpynnakerDataView
+from spynnaker.pyNN.utilities.ragged_spike_times import RaggedSpikeTimes
+from spynnaker.pyNN.utilities.utility_calls import most_common_time_step
 
 if TYPE_CHECKING:
     from .spike_source_array_vertex import SpikeSourceArrayVertex
@@ -46,6 +50,18 @@ class SpikeSourceArrayMachineVertex(ReverseIPTagMulticastSourceMachineVertex):
         n_colours = 2 ** self._pop_vertex.n_colour_bits
         return n_keys * n_colours
 
+    @staticmethod
+    @overrides(ReverseIPTagMulticastSourceMachineVertex.
+               _max_send_buffer_keys_per_timestep)
+    def _max_send_buffer_keys_per_timestep(
+            send_buffer_times: Any, n_keys: int) -> int:
+        if isinstance(send_buffer_times, RaggedSpikeTimes):
+            # Count without joining the times, which may be mapped from a file
+            _, count = most_common_time_step(send_buffer_times.times)
+            return count
+        return ReverseIPTagMulticastSourceMachineVertex.\
+            _max_send_buffer_keys_per_timestep(send_buffer_times, n_keys)
+
     @overrides(ReverseIPTagMulticastSourceMachineVertex._fill_send_buffer_1d)
     def _fill_send_buffer_1d(self, key_base: int) -> None:
         first_time_step = SpynnakerDataView.get_first_machine_time_step()
@@ -75,8 +91,39 @@ class SpikeSourceArrayMachineVertex(ReverseIPTagMulticastSourceMachineVertex):
         keys = get_keys(
             key_base, self.vertex_slice, self._pop_vertex.n_colour_bits)
         colour_mask = (2 ** self._pop_vertex.n_colour_bits) - 1
+        if isinstance(self._send_buffer_times, RaggedSpikeTimes):
+            self.__fill_send_buffer_ragged(
+                self._send_buffer_times, keys, colour_mask,
+                first_time_step, end_time_step)
+            return
         for atom in range(self.vertex_slice.n_atoms):
             for tick in sorted(self._send_buffer_times[atom]):
                 if first_time_step <= tick < end_time_step:
                     self._send_buffer.add_key(
                         tick, keys[atom] + (tick & colour_mask))
+
+    def __fill_send_buffer_ragged(
+            self, send_buffer_times: RaggedSpikeTimes, keys: numpy.ndarray,
+            colour_mask: int, first_time_step: int,
+            end_time_step: int) -> None:
+        """
+        Add the keys of the spikes in the time window, only reading the
+        times in the window if they are mapped from a file.
+
+        The times of each neuron are in order, so the window is found in
+        each with a binary search rather than by looking at every time.
+        """
+        assert self._send_buffer is not None
+        ticks = send_buffer_times.times
+        offsets = send_buffer_times.offsets.tolist()
+        first = numpy.int64(first_time_step)
+        end = numpy.int64(end_time_step)
+        for atom in range(len(send_buffer_times)):
+            atom_ticks = ticks[offsets[atom]:offsets[atom + 1]]
+            window_ticks = atom_ticks[
+                numpy.searchsorted(atom_ticks, first, "left"):
+                numpy.searchsorted(atom_ticks, end, "left")].astype(
+                    numpy.int64)
+            window_keys = keys[atom] + (window_ticks & colour_mask)
+            for tick, key in zip(window_ticks.tolist(), window_keys.tolist()):
+                self._send_buffer.add_key(tick, key)
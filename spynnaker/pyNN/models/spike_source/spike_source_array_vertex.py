@@ -14,13 +14,13 @@
 from __future__ import annotations
 
 import logging
-from collections import Counter
 from collections.abc import Collection, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
     TypeAlias,
     TypeGuard,
+    cast,
 )
 
 import numpy
@@ -32,10 +32,11 @@ from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ranged.abstract_sized import Selector
 
-from pacman.model.graphs.common import Slice
+from pacman.model.graphs.common import MDSlice, Slice
 from pacman.model.partitioner_splitters import AbstractSplitterCommon
 from pacman.model.resources import AbstractSDRAM
 
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utility_models import ReverseIpTagMultiCastSource
 
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -46,7 +47,9 @@ from spynnaker.pyNN.models.common import (
 )
 from spynnaker.pyNN.models.common.types import Names, Spikes
 from spynnaker.pyNN.utilities.buffer_data_type import BufferDataType
+from spynnaker.pyNN.utilities.ragged_spike_times import RaggedSpikeTimes
 from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
+from spynnaker.pyNN.utilities.utility_calls import most_common_time_step
 
 from .spike_source_array_machine_vertex import SpikeSourceArrayMachineVertex
 
@@ -63,8 +66,15 @@ _Number: TypeAlias = int | float
 _SingleList: TypeAlias = Sequence[_Number] | NDArray[numpy.integer]
 _DoubleList: TypeAlias = Sequence[Sequence[_Number]] | NDArray[numpy.integer]
 
+# The times as typed by the base class; ragged times are passed through it
+# too, as they are kept by _validate_send_buffer_times
+_BufferTimes: TypeAlias = NDArray | list[NDArray]
 
-def _is_double_list(value: Spikes) -> TypeGuard[_DoubleList]:
+
+def _is_double_list(
+        value: Spikes) -> TypeGuard[_DoubleList | RaggedSpikeTimes]:
+    if isinstance(value, RaggedSpikeTimes):
+        return bool(len(value))
     return not isinstance(value, (float, int)) and bool(len(value)) and \
         hasattr(value[0], "__len__")
 
@@ -84,12 +94,30 @@ def _as_numpy_ticks(
         numpy.floor(numpy.array(times) * 1000.0) / time_step).astype("int64")
 
 
+def _most_common(times: NDArray) -> tuple[_Number, int]:
+    """
+    Find the most common of some spike times.
+
+    :param times: The spike times
+    :return: The most common time and the number of times it appears
+    """
+    if not len(times):
+        return 0, 0
+    values, counts = numpy.unique(times, return_counts=True)
+    most = int(numpy.argmax(counts))
+    return values[most].item(), int(counts[most])
+
+
 def _send_buffer_times(
-        spike_times: Spikes, time_step: float
-        ) -> NDArray[numpy.int64] | list[NDArray[numpy.int64]]:
+        spike_times: Spikes, time_step: float) -> _BufferTimes:
     # Convert to ticks
     if _is_double_list(spike_times):
-        return [_as_numpy_ticks(times, time_step) for times in spike_times]
+        ragged = RaggedSpikeTimes.from_lists(spike_times)
+        ticks = _as_numpy_ticks(ragged.times, time_step)
+        # Put the ticks of each neuron in order, as the machine vertex
+        # searches them for those in each run
+        return cast(_BufferTimes, ragged.with_times(
+            ticks[numpy.lexsort((ticks, ragged.neuron_ids))]))
     elif _is_single_list(spike_times):
         return _as_numpy_ticks(spike_times, time_step)
     elif _is_singleton(spike_times):
@@ -108,6 +136,7 @@ class SpikeSourceArrayVertex(
         "__model",
         "__model_name",
         "__n_colour_bits",
+        "__spike_time_steps",
         "__structure",
         "_spike_times",
     )
@@ -120,7 +149,8 @@ class SpikeSourceArrayVertex(
             max_atoms_per_core: int | tuple[int, ...],
             model: SpikeSourceArray,
             splitter: AbstractSplitterCommon | None,
-            n_colour_bits: int | None):
+            n_colour_bits: int | None,
+            spike_time_steps: RaggedSpikeTimes | None = None):
         """
 
         :param n_neurons: The number of neurons in the population
@@ -130,26 +160,41 @@ class SpikeSourceArrayVertex(
         :param model:
         :param splitter:
         :param n_colour_bits:
+        :param spike_time_steps:
+            The simulation time steps on which each neuron spikes, in order
+            for each neuron, used as they are instead of `spike_times`, e.g.
+            when memory-mapped from a file
         """
         self.__model_name = "SpikeSourceArray"
         self.__model = model
         self.__structure: BaseStructure | None = None
+        self.__spike_time_steps = spike_time_steps
 
         if spike_times is None:
             spike_times = []
         self._spike_times = SpynnakerRangedList(
             n_neurons, spike_times,
             use_list_as_value=not _is_double_list(spike_times))
+        # Convert any lists only once for all the uses below
+        times: Spikes = (
+            RaggedSpikeTimes.from_lists(spike_times)
+            if _is_double_list(spike_times) else spike_times)
 
         time_step = SpynnakerDataView.get_simulation_time_step_us()
 
         super().__init__(
             n_keys=n_neurons, label=label,
             max_atoms_per_core=max_atoms_per_core,
-            send_buffer_times=_send_buffer_times(spike_times, time_step),
+            send_buffer_times=(
+                _send_buffer_times(times, time_step)
+                if spike_time_steps is None
+                else cast(_BufferTimes, spike_time_steps)),
             splitter=splitter)
 
-        self._check_spike_density(spike_times)
+        if spike_time_steps is None:
+            self._check_spike_density(times)
+        else:
+            self._check_density_time_steps(spike_time_steps)
         # Do colouring
         if n_colour_bits is None:
             self.__n_colour_bits = get_config_int(
@@ -157,6 +202,40 @@ class SpikeSourceArrayVertex(
         else:
             self.__n_colour_bits = n_colour_bits
 
+    @overrides(ReverseIpTagMultiCastSource._validate_send_buffer_times)
+    def _validate_send_buffer_times(self, send_buffer_times: Any) -> Any:
+        if isinstance(send_buffer_times, RaggedSpikeTimes):
+            # Keep the times ragged rather than as an array of arrays
+            if len(send_buffer_times) != self.n_atoms:
+                raise ConfigurationException(
+                    f"The spike times of {len(send_buffer_times)} neurons "
+                    f"do not match the {self.n_atoms} neurons of {self}")
+            return send_buffer_times
+        return super()._validate_send_buffer_times(send_buffer_times)
+
+    @overrides(ReverseIpTagMultiCastSource._filtered_send_buffer_times)
+    def _filtered_send_buffer_times(self, vertex_slice: Slice) -> Any:
+        send_buffer_times = self.send_buffer_times
+        if isinstance(send_buffer_times, RaggedSpikeTimes):
+            if isinstance(vertex_slice, MDSlice):
+                selected = send_buffer_times.select(
+                    vertex_slice.get_raster_ids())
+            else:
+                # A view of the times of the atoms, so nothing is copied
+                selected = send_buffer_times.select(slice(
+                    vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
+            if not len(selected.times):
+                return None
+            return selected
+        return super()._filtered_send_buffer_times(vertex_slice)
+
+    @overrides(ReverseIpTagMultiCastSource.get_sdram_used_by_atoms)
+    def get_sdram_used_by_atoms(self, vertex_slice: Slice) -> AbstractSDRAM:
+        return SpikeSourceArrayMachineVertex.get_sdram_usage(
+            self._filtered_send_buffer_times(vertex_slice),
+            self._is_recording, self._eieio_params.receive_rate,
+            vertex_slice.n_atoms)
+
     @overrides(ReverseIpTagMultiCastSource.create_machine_vertex)
     def create_machine_vertex(
             self, vertex_slice: Slice, sdram: AbstractSDRAM,
@@ -174,7 +253,8 @@ class SpikeSourceArrayVertex(
 
     def _check_spike_density(self, spike_times: Spikes) -> None:
         if _is_double_list(spike_times):
-            self._check_density_double_list(spike_times)
+            self._check_density_double_list(
+                RaggedSpikeTimes.from_lists(spike_times))
         elif _is_single_list(spike_times):
             self._check_density_single_list(spike_times)
         elif _is_singleton(spike_times):
@@ -183,9 +263,7 @@ class SpikeSourceArrayVertex(
             logger.warning("SpikeSourceArray has no spike times")
 
     def _check_density_single_list(self, spike_times: _SingleList) -> None:
-        counter = Counter(spike_times)
-        top = counter.most_common(1)
-        val, count = top[0]
+        val, count = _most_common(numpy.asarray(spike_times))
         if count * self.n_atoms > TOO_MANY_SPIKES:
             if self.n_atoms > 1:
                 logger.warning(
@@ -200,12 +278,9 @@ class SpikeSourceArrayVertex(
                     "For example at time {}, {} spikes will be sent",
                     val, count * self.n_atoms)
 
-    def _check_density_double_list(self, spike_times: _DoubleList) -> None:
-        counter: Counter = Counter()
-        for neuron_id in range(self.n_atoms):
-            counter.update(spike_times[neuron_id])
-        top = counter.most_common(1)
-        val, count = top[0]
+    def _check_density_double_list(
+            self, spike_times: RaggedSpikeTimes) -> None:
+        val, count = _most_common(spike_times.times)
         if count > TOO_MANY_SPIKES:
             logger.warning(
                 "Danger of SpikeSourceArray sending too many spikes "
@@ -213,6 +288,16 @@ class SpikeSourceArrayVertex(
                 "For example at time {}, {} spikes will be sent",
                 val, count)
 
+    def _check_density_time_steps(
+            self, spike_time_steps: RaggedSpikeTimes) -> None:
+        val, count = most_common_time_step(spike_time_steps.times)
+        if count > TOO_MANY_SPIKES:
+            logger.warning(
+                "Danger of SpikeSourceArray sending too many spikes "
+                "at the same time. "
+                "For example at time {}, {} spikes will be sent",
+                val * SpynnakerDataView.get_simulation_time_step_ms(), count)
+
     @overrides(SupportsStructure.set_structure)
     def set_structure(self, structure: BaseStructure) -> None:
         self.__structure = structure
@@ -233,16 +318,16 @@ class SpikeSourceArrayVertex(
         :param spike_times:
         """
         current_time = SpynnakerDataView.get_current_run_time_ms()
-        for spike_time in spike_times:
-            if spike_time < current_time:
-                logger.warning(
-                    "SpikeSourceArray {} has spike_times that are lower than "
-                    "the current time {} For example {} - "
-                    "these will be ignored.",
-                    self, current_time, float(spike_time))
-                return
+        early = numpy.flatnonzero(numpy.asarray(spike_times) < current_time)
+        if len(early):
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower than "
+                "the current time {} For example {} - "
+                "these will be ignored.",
+                self, current_time, float(spike_times[early[0]]))
 
-    def _check_spikes_double_list(self, spike_times: _DoubleList) -> None:
+    def _check_spikes_double_list(
+            self, spike_times: RaggedSpikeTimes) -> None:
         """
         Checks if there is one or more spike_times before the current time.
 
@@ -251,16 +336,13 @@ class SpikeSourceArrayVertex(
         :param spike_times:
         """
         current_time = SpynnakerDataView.get_current_run_time_ms()
-        for neuron_id in range(self.n_atoms):
-            id_times = spike_times[neuron_id]
-            for id_time in id_times:
-                if id_time < current_time:
-                    logger.warning(
-                        "SpikeSourceArray {} has spike_times that are lower "
-                        "than the current time {} For example {} - "
-                        "these will be ignored.",
-                        self, current_time, float(id_time))
-                    return
+        early = numpy.flatnonzero(spike_times.times < current_time)
+        if len(early):
+            logger.warning(
+                "SpikeSourceArray {} has spike_times that are lower "
+                "than the current time {} For example {} - "
+                "these will be ignored.",
+                self, current_time, float(spike_times.times[early[0]]))
 
     def __set_spike_buffer_times(self, spike_times: Spikes) -> None:
         """
@@ -268,8 +350,11 @@ class SpikeSourceArrayVertex(
         """
         time_step = SpynnakerDataView.get_simulation_time_step_us()
         # warn the user if they are asking for a spike time out of range
+        times: Spikes = spike_times
         if _is_double_list(spike_times):
-            self._check_spikes_double_list(spike_times)
+            ragged = RaggedSpikeTimes.from_lists(spike_times)
+            self._check_spikes_double_list(ragged)
+            times = ragged
         elif _is_single_list(spike_times):
             self._to_early_spikes_single_list(spike_times)
         elif _is_singleton(spike_times):
@@ -277,11 +362,17 @@ class SpikeSourceArrayVertex(
         else:
             # in case of empty list do not check
             pass
-        self.send_buffer_times = _send_buffer_times(spike_times, time_step)
-        self._check_spike_density(spike_times)
+        self.send_buffer_times = _send_buffer_times(times, time_step)
+        self._check_spike_density(times)
 
     def __read_parameter(self, name: str, selector: Selector) -> Sequence:
         _ = name
+        if self.__spike_time_steps is not None:
+            # Only convert the time steps of the neurons asked for
+            time_step_ms = SpynnakerDataView.get_simulation_time_step_ms()
+            return [
+                self.__spike_time_steps[neuron_id] * time_step_ms
+                for neuron_id in self._spike_times.selector_to_ids(selector)]
         return self._spike_times.get_values(selector)
 
     @overrides(PopulationApplicationVertex.get_parameter_values)
@@ -294,6 +385,7 @@ class SpikeSourceArrayVertex(
     def set_parameter_values(
             self, name: str, value: Spikes, selector: Selector = None) -> None:
         self._check_parameters(name, {"spike_times"})
+        self.__spike_time_steps = None
         self.__set_spike_buffer_times(value)
         self._spike_times.set_value_by_selector(
             selector, value, use_list_as_value=not _is_double_list(value))
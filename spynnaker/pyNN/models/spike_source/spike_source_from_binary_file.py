@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.overrides import overrides
+
+from pacman.model.partitioner_splitters import AbstractSplitterCommon
+
+from spynnaker.pyNN.utilities import utility_calls
+
+from .spike_source_array import SpikeSourceArray
+from .spike_source_array_vertex import SpikeSourceArrayVertex
+
+
+class SpikeSourceFromBinaryFile(SpikeSourceArray):
+    """
+    A spike source that plays back spikes memory-mapped from a binary file,
+    so that the spikes are only read from the file as each run needs them.
+
+    The file either holds pairs of neuron ID and simulation time step,
+    sorted by neuron ID and then time step, or, if an offsets file is given,
+    the time steps of each neuron in turn, in order, with the offsets file
+    holding the index of the first spike of each neuron followed by the
+    total number of spikes.  The files may be numpy ``.npy`` files or raw
+    files of little-endian 32-bit unsigned integers.
+    """
+
+    def __init__(self, spike_file: str, offsets_file: str | None = None):
+        """
+        :param spike_file: The file of spikes
+        :param offsets_file:
+            The file of offsets of each neuron if the spike file only holds
+            time steps
+        """
+        super().__init__([])
+        self.__spike_file = spike_file
+        self.__offsets_file = offsets_file
+
+    @overrides(SpikeSourceArray.create_vertex)
+    def create_vertex(
+            self, n_neurons: int, label: str, *,
+            splitter: AbstractSplitterCommon | None = None,
+            neurons_per_core: int | tuple[int, ...] | None = None,
+            n_colour_bits: int | None = None) -> SpikeSourceArrayVertex:
+        """
+        :param splitter:
+        :param n_colour_bits:
+        """
+        if neurons_per_core is None:
+            neurons_per_core = \
+                self.get_model_max_atoms_per_dimension_per_core()
+        spike_time_steps = utility_calls.map_spikes_from_binary_file(
+            self.__spike_file, n_neurons, self.__offsets_file)
+        return SpikeSourceArrayVertex(
+            n_neurons, [], label, neurons_per_core, self, splitter,
+            n_colour_bits, spike_time_steps=spike_time_steps)
@@ -13,20 +13,22 @@
 # limitations under the License.
 from __future__ import annotations
 
-import struct
-from collections.abc import Iterable, Sequence, Sized
+from collections.abc import Iterable, Mapping, Sequence, Sized
 from enum import IntEnum
 from typing import (
     TYPE_CHECKING,
+    Any,
     Final,
     TypeVar,
     cast,
 )
 
 import numpy
-from numpy import uint16, uint32
+from numpy import int64, integer, uint16, uint32
+from numpy.typing import NDArray
 
 from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged import RangedList
 
 from spinnman.model.enums import ExecutableType
 
@@ -197,8 +199,116 @@ SDRAM_EDGE_PARAMS_BYTES_PER_WEIGHT = BYTES_PER_SHORT
 # 3. offset to start writing, 4. Array of weights (not counted here)
 SDRAM_EDGE_PARAMS_BASE_BYTES = 3 * BYTES_PER_WORD
 
-_ONE_WORD = struct.Struct("<I")
-_FOUR_WORDS = struct.Struct("<4I")
+
+def _expander_rates(
+        rate_changed: bool,
+        ranges: Sequence[tuple[int, int, Mapping[str, Any]]]
+        ) -> NDArray[uint32]:
+    """
+    Get the words of the expander region.  Each range of atoms with the same
+    rates is written as a count of atoms, the number of rates and an index,
+    followed by the (rate, start, duration) of each rate.
+
+    :param rate_changed: Whether the rates have changed
+    :param ranges: The start, stop and parameters of each range of atoms
+    :return: The words to write
+    """
+    range_n_rates = numpy.array(
+        [numpy.size(item['rates']) for _, _, item in ranges], dtype=int64)
+    sizes = (EXPANDER_WORDS_PER_NEURON +
+             range_n_rates * PARAMS_WORDS_PER_RATE)
+    range_offsets = EXPANDER_HEADER_WORDS + numpy.cumsum(sizes) - sizes
+    data_to_write = numpy.zeros(
+        EXPANDER_HEADER_WORDS + int(sizes.sum()), dtype=uint32)
+    data_to_write[0] = int(rate_changed)
+    data_to_write[1] = len(ranges)
+    data_to_write[range_offsets] = [stop - start for start, stop, _ in ranges]
+    data_to_write[range_offsets + 1] = range_n_rates
+
+    # Convert all the rates at once as (rate, start, duration) triples
+    if ranges:
+        items = numpy.column_stack([
+            _u3232_to_uint64(numpy.concatenate([
+                numpy.ravel(item[name]) for _, _, item in ranges]))
+            for name in ('rates', 'starts', 'durations')])
+        n_words = range_n_rates * PARAMS_WORDS_PER_RATE
+        word_index = numpy.arange(
+            int(n_words.sum()), dtype=int64) - numpy.repeat(
+                numpy.cumsum(n_words) - n_words, n_words)
+        data_to_write[numpy.repeat(
+            range_offsets + EXPANDER_WORDS_PER_NEURON, n_words) +
+            word_index] = numpy.ravel(items).view(uint32)
+    return data_to_write
+
+
+def _read_rate_records(
+        words: NDArray[uint32], expected_n_rates: NDArray[integer]
+        ) -> tuple[NDArray[integer], NDArray[uint32]]:
+    """
+    Find the rates in the variable-length per-atom records of the rates
+    region.
+
+    :param words: The words of the rates region
+    :param expected_n_rates:
+        The number of rates each atom is expected to have; if the region
+        doesn't match this, the records are followed one by one
+    :return: The number of rates of each atom, and the first word of each rate
+    """
+    n_atoms = len(expected_n_rates)
+    n_rates = expected_n_rates.astype(int64)
+    sizes = PARAMS_WORDS_PER_NEURON + n_rates * PARAMS_WORDS_PER_RATE
+    offsets = numpy.cumsum(sizes) - sizes
+    if n_atoms and (offsets[-1] >= len(words) or not numpy.array_equal(
+            words[offsets], n_rates)):
+        offset = 0
+        for i in range(n_atoms):
+            offsets[i] = offset
+            n_rates[i] = words[offset]
+            offset += (PARAMS_WORDS_PER_NEURON +
+                       int(n_rates[i]) * PARAMS_WORDS_PER_RATE)
+
+    # Index the first word of each rate after the count and index of its atom
+    firsts = numpy.cumsum(n_rates) - n_rates
+    rate_index = numpy.arange(int(n_rates.sum()), dtype=int64) - numpy.repeat(
+        firsts, n_rates)
+    return n_rates, words[
+        numpy.repeat(offsets + PARAMS_WORDS_PER_NEURON, n_rates) +
+        rate_index * PARAMS_WORDS_PER_RATE]
+
+
+def _set_rates(
+        rates: RangedList, ids: NDArray[integer],
+        n_rates: NDArray[integer], values: NDArray[numpy.floating]) -> None:
+    """
+    Set the rates of atoms, one range at a time where consecutive atoms have
+    the same rates.
+
+    :param rates: The rates to update
+    :param ids: The ids of the atoms
+    :param n_rates: The number of rates of each atom
+    :param values: The rates of all the atoms, one after the other
+    """
+    n_atoms = len(ids)
+    firsts = numpy.cumsum(n_rates) - n_rates
+    atom_of_rate = numpy.repeat(numpy.arange(n_atoms), n_rates)
+
+    # An atom continues a range if it follows the previous atom and has the
+    # same number of rates with the same values
+    same = numpy.zeros(n_atoms, dtype=bool)
+    same[1:] = (ids[1:] == ids[:-1] + 1) & (n_rates[1:] == n_rates[:-1])
+    compare = numpy.flatnonzero(same[atom_of_rate])
+    differs = values[compare] != values[
+        compare - n_rates[atom_of_rate[compare]]]
+    same &= numpy.bincount(
+        atom_of_rate[compare[differs]], minlength=n_atoms) == 0
+
+    range_starts = numpy.flatnonzero(~same)
+    range_ends = numpy.append(range_starts[1:], n_atoms)
+    for start, end in zip(range_starts, range_ends):
+        rates.set_value_by_slice(
+            int(ids[start]), int(ids[end - 1]) + 1,
+            values[firsts[start]:firsts[start] + n_rates[start]],
+            use_list_as_value=True)
 
 
 class SpikeSourcePoissonMachineVertex(
@@ -492,26 +602,9 @@ class SpikeSourcePoissonMachineVertex(
             region=self._PoissonSpikeSourceRegions.RATES_REGION,
             size=get_rates_bytes(n_atoms, n_rates), label='PoissonRates')
 
-        # List starts with n_items, so start with 0.  Use arrays to allow
-        # numpy concatenation to work.
-        data_items: list[Sequence[int] | numpy.ndarray] = []
-        data_items.append([int(self.__rate_changed)])
-        data_items.append([0])
-        n_items = 0
-        data = self._pop_vertex.data
-        ids = self.vertex_slice.get_raster_ids()
-        for (start, stop, item) in data.iter_ranges_by_ids(ids):
-            count = stop - start
-            items = numpy.dstack(
-                (_u3232_to_uint64(item['rates']),
-                 _u3232_to_uint64(item['starts']),
-                 _u3232_to_uint64(item['durations']))
-                )[0]
-            data_items.extend([[count], [len(items)], [0],
-                               numpy.ravel(items).view(uint32)])
-            n_items += 1
-        data_items[1] = [n_items]
-        data_to_write = numpy.concatenate(data_items)
+        ranges = list(self._pop_vertex.data.iter_ranges_by_ids(
+            self.vertex_slice.get_raster_ids()))
+        data_to_write = _expander_rates(self.__rate_changed, ranges)
         spec.reserve_memory_region(
             region=self._PoissonSpikeSourceRegions.EXPANDER_REGION,
             size=get_expander_rates_bytes(n_atoms, n_rates), label='Expander')
@@ -627,19 +720,19 @@ class SpikeSourcePoissonMachineVertex(
                 placement.x, placement.y,
                 poisson_rate_region_sdram_address, size_of_region)
 
-            # For each atom, read the number of rates and the rate parameters
-            offset = 0
-            for i in self.vertex_slice.get_raster_ids():
-                n_rates, = _ONE_WORD.unpack_from(byte_array, offset)
-                # Skip the count and index
-                offset += PARAMS_WORDS_PER_NEURON * BYTES_PER_WORD
-                rates: list[float] = []
-                for _ in range(n_rates):
-                    rate_int = _ONE_WORD.unpack_from(byte_array, offset)[0]
-                    rates.append(rate_int / DataType.S1615.scale)
-                    # Skip the start and duration as they can't change
-                    offset += PARAMS_WORDS_PER_RATE * BYTES_PER_WORD
-                self._pop_vertex.rates.set_value_by_id(i, numpy.array(rates))
+            # Read the number of rates and the rate parameters of every atom,
+            # expecting the number of rates not to have changed
+            ids = self.vertex_slice.get_raster_ids()
+            rates = self._pop_vertex.rates
+            expected_n_rates = numpy.zeros(len(ids), dtype=int64)
+            index = 0
+            for start, stop, value in rates.iter_ranges_by_ids(ids):
+                expected_n_rates[index:index + stop - start] = len(value)
+                index += stop - start
+            atom_n_rates, rate_words = _read_rate_records(
+                numpy.frombuffer(byte_array, dtype=uint32), expected_n_rates)
+            _set_rates(rates, ids, atom_n_rates,
+                       rate_words / float(DataType.S1615.scale))
 
     def read_connections(
             self, synapse_info: SynapseInformation) -> ConnectionsArray:
@@ -15,6 +15,7 @@
 import logging
 import os
 from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal, cast
 
 from lazyarray import __version__ as lazyarray_version
@@ -24,7 +25,7 @@ from pyNN.common import control as pynn_control
 from quantities import __version__ as quantities_version
 from typing_extensions import Never
 
-from spinn_utilities.config_holder import get_config_bool
+from spinn_utilities.config_holder import get_config_bool, get_config_int
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
 
@@ -391,6 +392,21 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
         self._execute_synapse_expander()
         self._execute_finish_connection_holders()
 
+    @overrides(AbstractSpinnakerBase._execute_graph_data_specification_writer)
+    def _execute_graph_data_specification_writer(self) -> None:
+        # Share one pool of threads between all cores that generate their
+        # synaptic matrices on host
+        n_threads = get_config_int("Simulation", "n_host_synapse_threads")
+        if n_threads is None or n_threads <= 1:
+            super()._execute_graph_data_specification_writer()
+            return
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            self.__writer.set_host_synapse_pool(pool)
+            try:
+                super()._execute_graph_data_specification_writer()
+            finally:
+                self.__writer.set_host_synapse_pool(None)
+
     def _report_write_network_graph(self) -> None:
         with FecTimer("SpYNNakerNeuronGraphNetworkSpecificationReport",
                       TimerWork.REPORT) as timer:
@@ -460,3 +476,14 @@ class SpiNNaker(AbstractSpinnakerBase, pynn_control.BaseState):
         if not get_config_bool("Machine", "virtual_board"):
             with NeoBufferDatabase() as db:
                 db.write_t_stop()
+        self._execute_write_matrix_region_files()
+
+    def _execute_write_matrix_region_files(self) -> None:
+        with FecTimer("Write matrix region files", TimerWork.OTHER) as timer:
+            if timer.skip_if_cfg_false(
+                    "Recording", "write_matrix_region_files"):
+                return
+            if timer.skip_if_virtual_board():
+                return
+            with NeoBufferDatabase() as db:
+                db.write_matrix_region_files()
@@ -59,6 +59,8 @@ CREATE TABLE IF NOT EXISTS region_metadata(
     region_id INTEGER NOT NULL
 		REFERENCES recording_region(recording_region_id) ON DELETE RESTRICT,
     recording_neurons_st TEXT,
+    -- uint32 (start, stop) pairs; replaces recording_neurons_st
+    recording_neurons BLOB,
     vertex_slice TEXT,
     base_key INT);
 
@@ -19,11 +19,19 @@ import math
 import os
 import re
 import struct
-from collections.abc import Collection, Iterable, Sequence
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from datetime import datetime
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
 )
 
 import neo  # type: ignore[import]
@@ -34,7 +42,7 @@ from numpy.typing import NDArray
 
 from spinn_utilities.log import FormatAdapter
 
-from spinnman.messages.eieio.data_messages import EIEIODataHeader
+from spinnman.messages.eieio import EIEIOType
 
 from pacman.model.graphs.common import MDSlice, Slice
 from pacman.utilities.utility_calls import get_keys
@@ -58,6 +66,7 @@ from spynnaker.pyNN.types import ViewIndices
 from spynnaker.pyNN.utilities.buffer_data_type import BufferDataType
 from spynnaker.pyNN.utilities.constants import SPIKES
 from spynnaker.pyNN.utilities.neo_csv import NeoCsv
+from spynnaker.pyNN.utilities.neo_lazy import LazyAnalogSignal, LazySpikeTrain
 
 if TYPE_CHECKING:
     from _csv import Writer as CSVWriter
@@ -75,6 +84,195 @@ logger = FormatAdapter(logging.getLogger(__name__))
 
 segment_cache: dict[int, str] = {}
 
+# The length and time words written before each recorded EIEIO packet
+_ONE_WORD = struct.Struct("<I")
+_EIEIO_RECORD_HEADER_BYTES = 2 * BYTES_PER_WORD
+
+# The time and number of blocks written before each multi-spike record
+_TWO_WORDS = struct.Struct("<II")
+
+# The number of bits in a word, as an int so it can be used to index and
+# shift (the shared constant is a float)
+_BITS_PER_WORD = int(BITS_PER_WORD)
+
+#: Decodes the whole records at the start of some recorded spike data, giving
+#: the local ID (or key) and time step of each spike in them and the number of
+#: bytes of the records
+_DecodeSpikes = Callable[
+    [bytes], tuple[NDArray[integer], NDArray[uint32], int]]
+
+
+def _decode_eieio_spikes(
+        spike_data: bytes) -> tuple[NDArray[uint32], NDArray[uint32], int]:
+    """
+    Decode the keys of recorded EIEIO spike packets.
+
+    The packet lengths are walked once to find where each packet starts,
+    the packet headers are then decoded together, and the keys of all the
+    packets are gathered in one go.
+
+    :param spike_data:
+        The recorded packets, each preceded by its length and time step;
+        a packet cut short at the end is left undecoded
+    :return: The key and time step of each spike, in the order recorded,
+        and the number of bytes of whole packets decoded
+    :raises ValueError: If a packet is not made of keys without payloads
+    """
+    n_bytes = len(spike_data)
+    record_offsets: list[int] = []
+    offset = 0
+    while offset + _EIEIO_RECORD_HEADER_BYTES <= n_bytes:
+        end = (offset + _ONE_WORD.unpack_from(spike_data, offset)[0] +
+               _EIEIO_RECORD_HEADER_BYTES)
+        if end > n_bytes:
+            break
+        record_offsets.append(offset)
+        offset = end
+    if not record_offsets:
+        return (numpy.zeros(0, dtype=uint32), numpy.zeros(0, dtype=uint32),
+                offset)
+
+    data = numpy.frombuffer(spike_data, dtype=uint8)
+    offsets = numpy.array(record_offsets, dtype=numpy.int64)
+    time_steps = data[
+        offsets[:, None] + numpy.arange(BYTES_PER_WORD, 2 * BYTES_PER_WORD)
+        ].view("<u4").ravel()
+
+    # Decode the count and flags of all the EIEIO data headers
+    header_offsets = offsets + _EIEIO_RECORD_HEADER_BYTES
+    counts = data[header_offsets].astype(numpy.int64)
+    flags = data[header_offsets + 1]
+    has_prefix = (flags >> 7) & 1
+    has_payload_prefix = (flags >> 5) & 1
+    eieio_types = (flags >> 2) & 3
+    if numpy.any((has_prefix == 0) & ((flags >> 6) & 1 == 1)):
+        raise ValueError("Can only read spikes from data messages")
+    if numpy.any(
+            (eieio_types == EIEIOType.KEY_PAYLOAD_16_BIT.value) |
+            (eieio_types == EIEIOType.KEY_PAYLOAD_32_BIT.value)):
+        raise ValueError("Can only read spikes as keys")
+    key_bytes = numpy.where(
+        eieio_types == EIEIOType.KEY_32_BIT.value, 4, 2)
+    key_starts = (header_offsets + 2 + 2 * has_prefix +
+                  has_payload_prefix * key_bytes)
+
+    # Gather the keys a byte at a time, as they need not be word aligned
+    packets = numpy.repeat(numpy.arange(len(offsets)), counts)
+    first_keys = numpy.cumsum(counts) - counts
+    key_size = key_bytes[packets]
+    starts = key_starts[packets] + (
+        numpy.arange(len(packets)) - first_keys[packets]) * key_size
+    keys = data[starts].astype(uint32) | (
+        data[starts + 1].astype(uint32) << 8)
+    is_32 = key_size == 4
+    starts = starts[is_32]
+    keys[is_32] |= ((data[starts + 2].astype(uint32) << 16) |
+                    (data[starts + 3].astype(uint32) << 24))
+    return keys, time_steps[packets], offset
+
+
+def _decode_spike_rows(
+        spike_data: bytes, n_bits: int) -> tuple[
+            NDArray[integer], NDArray[uint32], int]:
+    """
+    Decode recorded rows of spike bits, each a time step followed by a bit
+    for each neuron recording.
+
+    :param spike_data: The recorded rows; a row cut short at the end is left
+        undecoded
+    :param n_bits: The number of neurons recording
+    :return: The local index and time step of each spike, ordered by time
+        step and then index, and the number of bytes of whole rows decoded
+    """
+    n_words = math.ceil(n_bits / _BITS_PER_WORD) + 1
+    n_rows = len(spike_data) // (n_words * BYTES_PER_WORD)
+    words = numpy.frombuffer(
+        spike_data, dtype="<u4", count=n_rows * n_words).reshape(
+            n_rows, n_words)
+    rows, indices = _find_set_bits(words[:, 1:], n_bits)
+    return indices, words[rows, 0], n_rows * n_words * BYTES_PER_WORD
+
+
+def _decode_multi_spikes(
+        spike_data: bytes, n_bits: int) -> tuple[
+            NDArray[integer], NDArray[uint32], int]:
+    """
+    Decode recorded multi-spike records, each a time step and a number of
+    blocks of a bit for each neuron recording.
+
+    :param spike_data: The recorded records; a record cut short at the end
+        is left undecoded
+    :param n_bits: The number of neurons recording
+    :return: The local index and time step of each spike, in the order
+        recorded, and the number of bytes of whole records decoded
+    """
+    n_words = math.ceil(n_bits / _BITS_PER_WORD)
+    n_bytes = len(spike_data)
+    indices: list[NDArray[integer]] = [numpy.zeros(0, dtype=numpy.int64)]
+    time_steps: list[NDArray[uint32]] = [numpy.zeros(0, dtype=uint32)]
+    offset = 0
+    while offset + _TWO_WORDS.size <= n_bytes:
+        time, n_blocks = _TWO_WORDS.unpack_from(spike_data, offset)
+        end = offset + _TWO_WORDS.size + n_blocks * n_words * BYTES_PER_WORD
+        if end > n_bytes:
+            break
+        words = numpy.frombuffer(
+            spike_data, dtype="<u4", count=n_blocks * n_words,
+            offset=offset + _TWO_WORDS.size).reshape(n_blocks, n_words)
+        _, local_indices = _find_set_bits(words, n_bits)
+        indices.append(local_indices)
+        time_steps.append(numpy.full(len(local_indices), time, dtype=uint32))
+        offset = end
+    return numpy.concatenate(indices), numpy.concatenate(time_steps), offset
+
+
+def _find_set_bits(
+        words: NDArray[uint32], n_bits: int) -> tuple[
+            NDArray[integer], NDArray[integer]]:
+    """
+    Finds the set bits in rows of little-endian words, where bit 0 of
+    the first word in a row is index 0 of that row.
+
+    Only the non-zero words are expanded into bits, so the cost depends
+    on how many words have spikes in them rather than on the size of
+    the rows.
+
+    :param words: 2D array of words, one row per timestep
+    :param n_bits: The number of meaningful bits in each row
+    :return: The row and the index in the row of each set bit, ordered
+        by row and then by index
+    """
+    rows, columns = numpy.nonzero(words)
+    bits = numpy.unpackbits(
+        words[rows, columns].astype("<u4").view(uint8).reshape(
+            -1, BYTES_PER_WORD), axis=1, bitorder="little")
+    set_words, set_bits = numpy.nonzero(bits)
+    indices = columns[set_words] * _BITS_PER_WORD + set_bits
+    in_range = indices < n_bits
+    return rows[set_words][in_range], indices[in_range]
+
+
+class _LazySpikes:
+    """
+    What has been read of the spikes of one population for its lazy spike
+    trains, shared between the trains so that the recording is read from
+    the database only once however many of the trains are loaded.
+    """
+    __slots__ = ("neuron_regions", "ids", "times")
+
+    def __init__(self) -> None:
+        #: For neuron spikes, the neurons recording, times in ms and spike
+        #: words of each region; the bits of a neuron are only decoded when
+        #: it is loaded
+        self.neuron_regions: list[tuple[
+            NDArray[integer], NDArray[floating], NDArray[uint32]]] | None = \
+            None
+        #: For other spikes, the IDs of all the spikes, in order
+        self.ids: NDArray[integer] | None = None
+        #: For other spikes, the times of all the spikes in ms, in order of
+        #: ID and then time
+        self.times: NDArray[floating] | None = None
+
 
 class NeoBufferDatabase(BufferDatabase, NeoCsv):
     """
@@ -84,7 +282,6 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
     extra tables and access methods added.
     """
     __N_BYTES_FOR_TIMESTAMP = BYTES_PER_WORD
-    __TWO_WORDS = struct.Struct("<II")
     __NEO_DDL_FILE = os.path.join(os.path.dirname(__file__), "db.sql")
     #: rewiring: shift values to decode recorded value
     __PRE_ID_SHIFT = 9
@@ -93,6 +290,20 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
     __FIRST_BIT = 1
     #: number of words per rewiring entry
     __REWIRING_N_WORDS = 2
+    #: maximum number of words of spike recording read and decoded at a time
+    __SPIKE_CHUNK_N_WORDS = 2 ** 20
+    #: maximum number of bytes copied into a region file at a time
+    __REGION_FILE_CHUNK_BYTES = 2 ** 24
+    #: Created only when region files are written, so that read-only
+    #: databases from before region files existed can still be read
+    __REGION_FILE_DDL = """
+        CREATE TABLE IF NOT EXISTS region_file(
+            region_id INTEGER PRIMARY KEY
+                REFERENCES recording_region(recording_region_id)
+                ON DELETE RESTRICT,
+            file_name TEXT NOT NULL,
+            n_bytes INTEGER NOT NULL)
+        """
 
     @staticmethod
     def _string(value: _SqliteTypes) -> str:
@@ -520,20 +731,25 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
         """
         index = 0
         # Need to put the rows in a list to get them to persist.
+        # SELECT * as databases written before recording_neurons was added
+        # only have recording_neurons_st
         for row in list(self.cursor().execute(
                 """
-                SELECT region_id, recording_neurons_st, vertex_slice, base_key
+                SELECT *
                 FROM region_metadata
                 WHERE rec_id = ?
-                ORDER BY region_id, recording_neurons_st, vertex_slice,
-                    base_key
+                ORDER BY region_id, vertex_slice, base_key
                 """, (rec_id,))):
             vertex_slice = MDSlice.from_string(
                 self._string(row["vertex_slice"]))
-            recording_neurons_st = row["recording_neurons_st"]
-            if recording_neurons_st:
+            neurons: NDArray[integer] | None = None
+            if "recording_neurons" in row.keys() and \
+                    row["recording_neurons"] is not None:
+                neurons = self.ranges_to_array(row["recording_neurons"])
+            elif row["recording_neurons_st"]:
                 neurons = numpy.array(
-                    self.string_to_array(recording_neurons_st))
+                    self.string_to_array(row["recording_neurons_st"]))
+            if neurons is not None:
                 yield (row["region_id"], neurons, vertex_slice,
                        len(neurons) != vertex_slice.n_atoms,
                        row["base_key"], index)
@@ -542,220 +758,112 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
                        row["base_key"], index)
             index += 1
 
-    def __get_spikes_by_region(
-            self, region_id: int, neurons: NDArray[integer],
-            simulation_time_step_ms: float, selective_recording: bool,
-            spike_times: list[float], spike_ids: list[int]) -> None:
+    def __read_spike_words(
+            self, region_id: int, n_neurons: int) -> NDArray[uint32]:
         """
-        Adds spike data for this region to the lists.
+        Reads the recorded spikes of a region without copying them.
 
         :param region_id: Region data came from
-        :param neurons: mapping of local ID to global ID
-        :param simulation_time_step_ms:
-        :param selective_recording: flag to say if
-        :param spike_times: List to add spike times to
-        :param spike_ids: List to add spike IDs to
-        """
-        neurons_recording = len(neurons)
-        if neurons_recording == 0:
-            return
-        n_words = math.ceil(neurons_recording / BITS_PER_WORD)
-        n_bytes = n_words * BYTES_PER_WORD
-        n_words_with_timestamp = n_words + 1
-
-        record_raw = self._read_recording(region_id)
-
-        if len(record_raw) == 0:
-            return
-
-        raw_data = (
-            numpy.asarray(record_raw, dtype=uint8).view(
-                dtype="<i4")).reshape([-1, n_words_with_timestamp])
-
-        record_time = (raw_data[:, 0] * simulation_time_step_ms)
-        spikes = raw_data[:, 1:].byteswap().view(uint8)
-        bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-            (-1, 32))).reshape((-1, n_bytes * 8))
-        time_indices, local_indices = numpy.where(bits == 1)
-        if selective_recording:
-            for time_indice, local in zip(time_indices, local_indices):
-                if local < neurons_recording:
-                    spike_ids.append(neurons[local])
-                    spike_times.append(record_time[time_indice])
-        else:
-            indices = neurons[local_indices]
-            times = record_time[time_indices].reshape((-1))
-            spike_ids.extend(indices)
-            spike_times.extend(times)
-
-    def __get_neuron_spikes(self, rec_id: int) -> tuple[
-            NDArray, list[int]]:
+        :param n_neurons: The number of neurons recording in the region
+        :return: One row per timestep of a timestamp then the spike bits
         """
-        Gets the spikes for this population/recording ID.
+        n_words_with_timestamp = math.ceil(n_neurons / _BITS_PER_WORD) + 1
+        return numpy.frombuffer(
+            self._read_recording(region_id), dtype="<u4").reshape(
+                -1, n_words_with_timestamp)
 
-        :param rec_id:
-        :return: numpy array of spike IDs and spike times, all IDs recording
+    def __iter_recording(
+            self, region_id: int, n_bytes: int) -> Iterator[bytes]:
         """
-        spike_times: list[float] = []
-        spike_ids: list[int] = []
-        simulation_time_step_ms = self.__get_simulation_time_step_ms()
-        indexes: list[int] = []
-        for region_id, neurons, _, selective_recording, _, _ in \
-                self.__get_region_metadata(rec_id):
-            if neurons is None or selective_recording is None:
-                continue
-            indexes.extend(neurons)
-            self.__get_spikes_by_region(
-                region_id, neurons, simulation_time_step_ms,
-                selective_recording, spike_times, spike_ids)
-
-        result = numpy.column_stack((spike_ids, spike_times))
-        return result[numpy.lexsort(result.T[::-1])], indexes
-
-    def __get_eieio_spike_by_region(
-            self, region_id: int,
-            simulation_time_step_ms: float, base_key: int,
-            vertex_slice: Slice, n_colour_bits: int,
-            results: list[NDArray]) -> NDArray[integer]:
-        """
-        Adds spike data for this region to the list.
+        Reads the recorded data of a region a piece at a time, reading no
+        more than `n_bytes` of each extraction of the region at once where
+        the sqlite3 module supports reading part of a BLOB.
 
         :param region_id: Region data came from
-        :param simulation_time_step_ms:
-        :param base_key:
-        :param vertex_slice:
-        :param n_colour_bits:
-        :param results: Where to add spike data to
-        :return: all recording indexes spikes or not
+        :param n_bytes: The most bytes to read at once
+        :return: The pieces of the data, in the order recorded
         """
-        spike_data = self._read_recording(region_id)
-
-        number_of_bytes_written = len(spike_data)
-        offset = 0
-        indices = {
-            key: index for index, key in enumerate(
-                get_keys(base_key, vertex_slice, n_colour_bits))}
-        slice_ids = vertex_slice.get_raster_ids()
-        colour_mask = (2 ** n_colour_bits) - 1
-        inv_colour_mask = ~colour_mask & 0xFFFFFFFF
-        while offset < number_of_bytes_written:
-            length, time = self.__TWO_WORDS.unpack_from(spike_data, offset)
-            time *= simulation_time_step_ms
-            data_offset = offset + 2 * BYTES_PER_WORD
-
-            eieio_header = EIEIODataHeader.from_bytestring(
-                spike_data, data_offset)
-            if eieio_header.eieio_type.payload_bytes > 0:
-                raise ValueError("Can only read spikes as keys")
-
-            data_offset += eieio_header.size
-            timestamps = numpy.repeat([time], eieio_header.count)
-            key_bytes = eieio_header.eieio_type.key_bytes
-            keys = numpy.frombuffer(
-                spike_data, dtype=f"<u{key_bytes}",
-                count=eieio_header.count, offset=data_offset).astype(uint32)
-            keys = numpy.bitwise_and(keys, inv_colour_mask)
-            local_ids = numpy.array([indices[key] for key in keys])
-            neuron_ids = slice_ids[local_ids]
-            offset += length + 2 * BYTES_PER_WORD
-            results.append(numpy.dstack((neuron_ids, timestamps))[0])
-
-        return slice_ids
-
-    def __get_eieio_spikes(
-            self, rec_id: int, n_colour_bits: int) -> tuple[
-                NDArray, list[int]]:
-        """
-        Gets the spikes for this population/recording ID.
-
-        :return: numpy array of spike IDs and spike times, all IDs recording
-        """
-        simulation_time_step_ms = self.__get_simulation_time_step_ms()
-        results: list[NDArray] = []
-        indexes: list[int] = []
-
-        for region_id, _, vertex_slice, selective_recording, base_key, _ in \
-                self.__get_region_metadata(rec_id):
-            if selective_recording:
-                raise NotImplementedError(
-                    "Unable to handle selective recording")
-            indexes.extend(self.__get_eieio_spike_by_region(
-                region_id, simulation_time_step_ms,
-                base_key, vertex_slice, n_colour_bits, results))
-
-        if not results:
-            return numpy.empty(shape=(0, 2)), indexes
-        result = numpy.vstack(results)
-        return result[numpy.lexsort((result[:, 1], result[:, 0]))], indexes
+        cursor = self.cursor()
+        blobopen = getattr(cursor.connection, "blobopen", None)
+        for data in list(cursor.execute(
+                """
+                SELECT recording_data_id
+                FROM recording_data
+                WHERE recording_region_id = ?
+                ORDER BY extraction_id ASC
+                """, (region_id,))):
+            if blobopen is None:
+                contents = [
+                    row["content"] for row in cursor.execute(
+                        """
+                        SELECT content
+                        FROM recording_data
+                        WHERE recording_data_id = ?
+                        """, (data["recording_data_id"],))]
+                for content in contents:
+                    for start in range(0, len(content), n_bytes):
+                        yield content[start:start + n_bytes]
+            else:
+                with blobopen("recording_data", "content",
+                              data["recording_data_id"],
+                              readonly=True) as blob:
+                    while chunk := blob.read(n_bytes):
+                        yield chunk
 
-    def __get_multi_spikes_by_region(
-            self, region_id: int, neurons: NDArray[integer],
-            simulation_time_step_ms: float,
-            spike_times: list[NDArray[floating]],
-            spike_ids: list[NDArray[integer]]) -> None:
+    def __iter_decoded_spikes(
+            self, region_id: int, n_bytes: int,
+            decode: _DecodeSpikes) -> Iterator[
+                tuple[NDArray[integer], NDArray[uint32]]]:
         """
-        Adds spike data for this region to the lists.
+        Decodes the recorded spikes of a region as it is read, a bounded
+        number of bytes at a time.  A record cut short at the end of what
+        has been read is decoded with the bytes read next.
 
         :param region_id: Region data came from
-        :param neurons:
-        :param simulation_time_step_ms:
-        :param spike_times: List to add spike times to
-        :param spike_ids: List to add spike IDs to
-        """
-        raw_data = self._read_recording(region_id)
-
-        n_words = math.ceil(len(neurons) / BITS_PER_WORD)
-        n_bytes_per_block = n_words * BYTES_PER_WORD
-        offset = 0
-        while offset < len(raw_data):
-            time, n_blocks = self.__TWO_WORDS.unpack_from(raw_data, offset)
-            offset += self.__TWO_WORDS.size
-            spike_data = numpy.frombuffer(
-                raw_data, dtype=uint8,
-                count=n_bytes_per_block * n_blocks, offset=offset)
-            offset += n_bytes_per_block * n_blocks
-
-            spikes = spike_data.view("<i4").byteswap().view(uint8)
-            bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                (-1, 32))).reshape((-1, n_bytes_per_block * 8))
-            local_indices = numpy.nonzero(bits)[1]
-            indices = neurons[local_indices]
-            times = numpy.repeat(
-                [time * simulation_time_step_ms],
-                len(indices))
-            spike_ids.append(indices)
-            spike_times.append(times)
+        :param n_bytes: The most bytes to read at once
+        :param decode: Decodes the whole records at the start of some data
+        :return: The local IDs (or keys) and time steps of the spikes read
+            each time
+        """
+        pending = b""
+        for chunk in self.__iter_recording(region_id, n_bytes):
+            data = pending + chunk if pending else chunk
+            ids, time_steps, n_decoded = decode(data)
+            pending = data[n_decoded:]
+            if len(ids):
+                yield ids, time_steps
+        if pending:
+            logger.warning(
+                "Ignoring the last {} bytes of the spikes recorded in "
+                "region {}, as they are not a whole record",
+                len(pending), region_id)
 
-    def __get_multi_spikes(self, rec_id: int) -> tuple[
-            NDArray, list[int]]:
+    @staticmethod
+    def __eieio_spike_ids(
+            keys: NDArray[integer], slice_ids: NDArray[integer],
+            base_key: int, vertex_slice: Slice,
+            n_colour_bits: int) -> NDArray[integer]:
         """
-        Gets the spikes for this population/recording ID.
+        Finds the atom sending each of some recorded EIEIO spike keys.
 
-        :param rec_id:
-        :return: numpy array of spike IDs and spike times, all IDs recording
+        :param keys: The recorded keys
+        :param slice_ids: The IDs of the atoms of the vertex slice
+        :param base_key:
+        :param vertex_slice:
+        :param n_colour_bits:
+        :return: The ID of the atom of each key
+        :raises KeyError: If a key is not one of the keys of the slice
         """
-        spike_times_l: list[NDArray[floating]] = []
-        spike_ids_l: list[NDArray[integer]] = []
-        indexes: list[int] = []
-        simulation_time_step_ms = self.__get_simulation_time_step_ms()
-        for region_id, neurons, _, selective_recording, _, _ in \
-                self.__get_region_metadata(rec_id):
-            if selective_recording:
-                raise NotImplementedError(
-                    "Unable to handle selective recording")
-            assert neurons is not None
-            indexes.extend(neurons)
-            self.__get_multi_spikes_by_region(
-                region_id, neurons, simulation_time_step_ms,
-                spike_times_l, spike_ids_l)
-
-        if not spike_ids_l:
-            return numpy.zeros((0, 2)), indexes
-
-        spike_ids_a = numpy.hstack(spike_ids_l)
-        spike_times_a = numpy.hstack(spike_times_l)
-        result = numpy.dstack((spike_ids_a, spike_times_a))[0]
-        return result[numpy.lexsort((spike_times_a, spike_ids_a))], indexes
+        # Strip the colour and find the atom of each key in the slice
+        colour_mask = (2 ** n_colour_bits) - 1
+        keys = keys & (~colour_mask & 0xFFFFFFFF)
+        local_ids = (keys.astype(numpy.int64) - base_key) >> n_colour_bits
+        unknown = ((local_ids < 0) | (local_ids >= len(slice_ids)) |
+                   (get_keys(base_key, vertex_slice, n_colour_bits)[
+                       numpy.clip(local_ids, 0, len(slice_ids) - 1)] != keys))
+        if numpy.any(unknown):
+            raise KeyError(int(keys[numpy.argmax(unknown)]))
+        return slice_ids[local_ids]
 
     @staticmethod
     def __combine_indexes(
@@ -768,16 +876,42 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
         :param variable:
         :return: indices
         """
+        view_a = numpy.asarray(view_indexes, dtype=numpy.int64)
         # keep just the view indexes in the data
-        data_set = set(data_indexes)
-        indexes = [i for i in view_indexes if i in data_set]
+        in_data = numpy.isin(view_a, data_indexes)
         # check for missing and report
-        view_set: set[int] = set(view_indexes)
-        missing = view_set.difference(data_indexes)
-        if missing:
+        if not in_data.all():
+            missing = numpy.unique(view_a[~in_data])
             logger.warning("No {} available for neurons {}",
-                           variable, sorted(missing))
-        return numpy.array(indexes)
+                           variable, missing.tolist())
+        return view_a[in_data]
+
+    @staticmethod
+    def __is_all_data(
+            view_indexes: Sequence[int] | NDArray[integer],
+            data_indexes: NDArray[integer]) -> bool:
+        """
+        :param view_indexes:
+        :param data_indexes:
+        :return: True if the view is exactly the data in the same order
+        """
+        return numpy.array_equal(
+            numpy.asarray(view_indexes, dtype=numpy.int64), data_indexes)
+
+    @staticmethod
+    def __find_columns(
+            indexes: NDArray[integer],
+            data_indexes: NDArray[integer]) -> NDArray[numpy.int64]:
+        """
+        Finds the column of each index in the data.
+
+        :param indexes: Indexes all of which are in data_indexes
+        :param data_indexes: The neuron index of each column of the data
+        :return: column for each of the indexes
+        """
+        order = numpy.argsort(data_indexes, kind="stable")
+        return order[numpy.searchsorted(
+            data_indexes, indexes, sorter=order)].astype(numpy.int64)
 
     def __get_spikes(
             self, rec_id: int, view_indexes: ViewIndices,
@@ -786,6 +920,9 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
         """
         Gets the data as a Numpy array for one population and variable.
 
+        The spikes are read a block at a time, keeping only those in the
+        view, so the whole of the recording is never held at once.
+
         :param rec_id:
         :param view_indexes:
         :param buffer_type:
@@ -795,60 +932,338 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
             ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
             If the recording metadata not setup correctly
         """
-        if buffer_type == BufferDataType.NEURON_SPIKES:
-            spikes, data_indexes = self.__get_neuron_spikes(rec_id)
-        elif buffer_type == BufferDataType.EIEIO_SPIKES:
-            spikes, data_indexes = self.__get_eieio_spikes(
-                rec_id, n_colour_bits)
-        elif buffer_type == BufferDataType.MULTI_SPIKES:
-            spikes, data_indexes = self.__get_multi_spikes(rec_id)
-        else:
-            raise NotImplementedError(buffer_type)
+        view = None if view_indexes is None else numpy.asarray(
+            view_indexes, dtype=numpy.int64)
+        data_indexes: list[int] = []
+        spike_ids: list[NDArray[integer]] = [
+            numpy.zeros(0, dtype=numpy.int64)]
+        spike_times: list[NDArray[floating]] = [numpy.zeros(0, dtype=float64)]
+        for ids, times in self.__iter_spikes(
+                rec_id, buffer_type, n_colour_bits, data_indexes):
+            if view is not None:
+                in_view = numpy.isin(ids, view)
+                ids = ids[in_view]
+                times = times[in_view]
+            spike_ids.append(ids)
+            spike_times.append(times)
 
-        if view_indexes is None or list(view_indexes) == list(data_indexes):
+        if view is None or self.__is_all_data(
+                view, numpy.asarray(data_indexes)):
             indexes = numpy.array(data_indexes)
         else:
             # keep just the view indexes in the data
-            indexes = self.__combine_indexes(
-                view_indexes, data_indexes, variable)
-            # keep just data columns in the view
-            spikes = spikes[numpy.isin(spikes[:, 0], indexes)]
+            indexes = self.__combine_indexes(view, data_indexes, variable)
+
+        all_ids = numpy.concatenate(spike_ids)
+        all_times = numpy.concatenate(spike_times)
+        order = numpy.lexsort((all_times, all_ids))
+        return numpy.column_stack((all_ids[order], all_times[order])), indexes
+
+    def __iter_spikes(
+            self, rec_id: int, buffer_type: BufferDataType,
+            n_colour_bits: int, indexes: list[int]) -> Iterator[
+                tuple[NDArray[integer], NDArray[floating]]]:
+        """
+        Iterates over the spikes for one population a block at a time,
+        reading a bounded number of bytes of each region at a time.
+
+        :param rec_id:
+        :param buffer_type:
+        :param n_colour_bits:
+        :param indexes: List to add all the IDs recording to
+        :return: spike IDs and spike times of each block
+        """
+        simulation_time_step_ms = self.__get_simulation_time_step_ms()
+        n_bytes = self.__SPIKE_CHUNK_N_WORDS * BYTES_PER_WORD
+        for region_id, neurons, vertex_slice, selective_recording, \
+                base_key, _ in self.__get_region_metadata(rec_id):
+            ids_of: Callable[[NDArray[integer]], NDArray[integer]]
+            if buffer_type == BufferDataType.NEURON_SPIKES:
+                if neurons is None or selective_recording is None:
+                    continue
+                recording = neurons
+                # Read whole rows of timesteps where possible
+                n_row_words = math.ceil(len(neurons) / _BITS_PER_WORD) + 1
+                region_n_bytes = max(
+                    1, self.__SPIKE_CHUNK_N_WORDS // n_row_words
+                    ) * n_row_words * BYTES_PER_WORD
+                decode: _DecodeSpikes = partial(
+                    _decode_spike_rows, n_bits=len(neurons))
+                ids_of = partial(numpy.take, neurons)
+            elif selective_recording:
+                raise NotImplementedError(
+                    "Unable to handle selective recording")
+            elif buffer_type == BufferDataType.EIEIO_SPIKES:
+                recording = vertex_slice.get_raster_ids()
+                region_n_bytes = n_bytes
+                decode = _decode_eieio_spikes
+                ids_of = partial(
+                    self.__eieio_spike_ids, slice_ids=recording,
+                    base_key=base_key, vertex_slice=vertex_slice,
+                    n_colour_bits=n_colour_bits)
+            elif buffer_type == BufferDataType.MULTI_SPIKES:
+                assert neurons is not None
+                recording = neurons
+                region_n_bytes = n_bytes
+                decode = partial(_decode_multi_spikes, n_bits=len(neurons))
+                ids_of = partial(numpy.take, neurons)
+            else:
+                raise NotImplementedError(buffer_type)
+            indexes.extend(recording)
+            if not len(recording):
+                continue
+            for ids, time_steps in self.__iter_decoded_spikes(
+                    region_id, region_n_bytes, decode):
+                yield ids_of(ids), time_steps * simulation_time_step_ms
+
+    def iter_spikes(
+            self, pop_label: str, view_indexes: ViewIndices = None
+            ) -> Iterator[tuple[NDArray[integer], NDArray[floating]]]:
+        """
+        Iterates over the recorded spikes of a population a block at a time,
+        reading a bounded number of bytes of each recorded region at a time,
+        so that neither the recording nor the decoded spikes of the whole
+        population are ever held at once.
 
-        return spikes, indexes
+        Spikes are not in any overall order; within each block they are
+        ordered by time.
+
+        :param pop_label: The label for the population of interest
+
+            .. note::
+                This is actually the label of the Application Vertex.
+                Typically the Population label, corrected for `None` or
+                duplicate values
+
+        :param view_indexes: The indexes for which data should be returned.
+            If ``None``, all data
+        :return: The neuron IDs and times in milliseconds of each block of
+            spikes
+        :raises \
+            ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+            If the population did not record spikes
+        """
+        # called to trigger the virtual data warning if applicable
+        self.__get_segment_info()
+        metadata = self.__get_recording_metadata(pop_label, SPIKES)
+        if metadata is None:
+            raise ConfigurationException(
+                f"{pop_label} did not record spikes")
+        (rec_id, _, buffered_type, _, _, _, _, n_colour_bits) = metadata
+        view = None if view_indexes is None else numpy.array(view_indexes)
+        indexes: list[int] = []
+        for ids, times in self.__iter_spikes(
+                rec_id, buffered_type, n_colour_bits, indexes):
+            if view is not None:
+                in_view = numpy.isin(ids, view)
+                ids = ids[in_view]
+                times = times[in_view]
+            yield ids, times
+
+    def __region_file_directory(self) -> str:
+        """
+        :return: The directory holding the region files of this database
+        """
+        return f"{os.path.splitext(self._database_file)[0]}_regions"
+
+    def __has_region_files(self) -> bool:
+        """
+        :return: Whether any region files have been written for this database
+        """
+        for _ in self.cursor().execute(
+                """
+                SELECT name FROM sqlite_master
+                WHERE type = 'table' AND name = 'region_file'
+                """):
+            return True
+        return False
+
+    def __get_region_file(self, region_id: int) -> str | None:
+        """
+        Gets the flat file holding the data of a region, if there is one and
+        it is still up to date.
+
+        :param region_id: Region data came from
+        :return: The path of the file or `None` if the data must be read from
+            the database
+        """
+        if not self.__has_region_files():
+            return None
+        for row in self.cursor().execute(
+                """
+                SELECT file_name, n_bytes, (
+                    SELECT SUM(content_len) FROM recording_data
+                    WHERE recording_region_id = region_file.region_id
+                    ) AS content_len
+                FROM region_file
+                WHERE region_id = ?
+                LIMIT 1
+                """, (region_id,)):
+            path = os.path.join(
+                self.__region_file_directory(),
+                self._string(row["file_name"]))
+            if (row["n_bytes"] == row["content_len"] and
+                    os.path.isfile(path) and
+                    os.path.getsize(path) == row["n_bytes"]):
+                return path
+        return None
+
+    def write_matrix_region_files(self) -> None:
+        """
+        Writes the data of each recorded matrix region (such as `v`) to a
+        flat file of its own, next to the database.
+
+        Reading the data back then memory-maps the file, so only the values
+        asked for are ever loaded into memory.  The data is copied a chunk
+        at a time, so it is never all held in memory while writing, but it
+        is then on disk twice, in the database and in the file.
+
+        .. note::
+            The database must be writable for this to work!
+        """
+        directory = self.__region_file_directory()
+        os.makedirs(directory, exist_ok=True)
+        self.cursor().execute(self.__REGION_FILE_DDL)
+        for row in list(self.cursor().execute(
+                """
+                SELECT region_id
+                FROM region_metadata NATURAL JOIN recording_view
+                WHERE buffered_type = ?
+                """, (str(BufferDataType.MATRIX),))):
+            region_id = row["region_id"]
+            file_name = f"region_{region_id}.dat"
+            with open(os.path.join(directory, file_name), "wb") as f:
+                n_bytes = self.__copy_recording(region_id, f)
+            self.cursor().execute(
+                """
+                INSERT OR REPLACE INTO region_file(
+                    region_id, file_name, n_bytes)
+                VALUES (?, ?, ?)
+                """, (region_id, file_name, n_bytes))
+
+    def __copy_recording(self, region_id: int, f: BinaryIO) -> int:
+        """
+        Copies the recorded data of a region into a file, reading each
+        extraction of the region a chunk at a time where the sqlite3 module
+        supports reading part of a BLOB.
+
+        :param region_id: Region data came from
+        :param f: The file to write to
+        :return: The number of bytes written
+        """
+        n_bytes = 0
+        for chunk in self.__iter_recording(
+                region_id, self.__REGION_FILE_CHUNK_BYTES):
+            f.write(chunk)
+            n_bytes += len(chunk)
+        return n_bytes
+
+    def __remove_region_file(self, region_id: int) -> None:
+        """
+        Removes the flat file of a region, if there is one.
+
+        :param region_id: Region data came from
+        """
+        if not self.__has_region_files():
+            return
+        for row in list(self.cursor().execute(
+                """
+                SELECT file_name FROM region_file
+                WHERE region_id = ?
+                """, (region_id,))):
+            path = os.path.join(
+                self.__region_file_directory(),
+                self._string(row["file_name"]))
+            if os.path.isfile(path):
+                os.remove(path)
+        self.cursor().execute(
+            """
+            DELETE FROM region_file
+            WHERE region_id = ?
+            """, (region_id,))
 
     def __get_matrix_data_by_region(
-            self, region_id: int, neurons: NDArray[integer],
-            data_type: DataType) -> tuple[
-                NDArray[floating], NDArray[floating]]:
+            self, region_id: int, n_neurons: int,
+            data_type: DataType) -> tuple[NDArray[integer], NDArray]:
         """
-        Extracts data for this region.
+        Gets views of the data of this region, without decoding or copying
+        it.  If the region has been written to a flat file, the file is
+        memory-mapped.
 
         :param region_id: Region data came from
-        :param neurons: mapping of local ID to global ID
+        :param n_neurons: The number of neurons recording in the region
         :param data_type: type of data to extract
-        :return: times, data
+        :return: times, and one row of the still encoded bytes per time
         """
-        # for buffering output info is taken form the buffer manager
-        record_raw = self._read_recording(region_id)
-        record_length = len(record_raw)
-
         # There is one column for time and one for each neuron recording
-        data_row_length = len(neurons) * data_type.size
-        full_row_length = data_row_length + self.__N_BYTES_FOR_TIMESTAMP
-        n_rows = record_length // full_row_length
-        row_data = numpy.asarray(record_raw, dtype=uint8).reshape(
-            n_rows, full_row_length)
-
-        time_bytes = (
-            row_data[:, 0: self.__N_BYTES_FOR_TIMESTAMP].reshape(
-                n_rows * self.__N_BYTES_FOR_TIMESTAMP))
-        times = time_bytes.view("<i4").reshape(n_rows, 1)
-        var_data = (row_data[:, self.__N_BYTES_FOR_TIMESTAMP:].reshape(
-            n_rows * data_row_length))
-        placement_data = data_type.decode_array(var_data).reshape(
-            n_rows, len(neurons))
-
-        return times, placement_data
+        row_type = numpy.dtype([
+            ("time", "<i4"), ("data", uint8, (n_neurons * data_type.size, ))])
+        path = self.__get_region_file(region_id)
+        rows: NDArray
+        if path is None:
+            record_raw = self._read_recording(region_id)
+            rows = numpy.frombuffer(
+                record_raw, dtype=row_type,
+                count=len(record_raw) // row_type.itemsize)
+        else:
+            n_rows = os.path.getsize(path) // row_type.itemsize
+            if n_rows == 0:
+                rows = numpy.zeros(0, dtype=row_type)
+            else:
+                rows = numpy.memmap(
+                    path, dtype=row_type, mode="r", shape=(n_rows, ))
+        return rows["time"], rows["data"]
+
+    def __read_matrix_columns(
+            self, regions: list[tuple[int, NDArray[integer]]],
+            data_type: DataType,
+            columns: NDArray[integer] | None,
+            rows: slice = slice(None)) -> NDArray:
+        """
+        Decodes selected columns of the matrix data of several regions, as
+        if the regions were joined side by side.  Only the values in the
+        selected rows and columns are decoded.
+
+        :param regions: The region and neurons recording of each region
+        :param data_type: type of data to extract
+        :param columns: The columns to decode, or `None` for all
+        :param rows: The rows to decode
+        :return: The decoded data, one column per selected column
+        :raises NotImplementedError: If the regions have different times
+        """
+        region_ends = numpy.cumsum([len(neurons) for _, neurons in regions])
+        if columns is None:
+            columns = numpy.arange(region_ends[-1] if len(regions) else 0)
+        column_regions = numpy.searchsorted(region_ends, columns, "right")
+        signal_array: NDArray | None = None
+        pop_times: NDArray[integer] | None = None
+        start = 0
+        for index, (region_id, neurons) in enumerate(regions):
+            times, data = self.__get_matrix_data_by_region(
+                region_id, len(neurons), data_type)
+            times = times[rows]
+            data = data[rows]
+            if pop_times is None or signal_array is None:
+                pop_times = times
+                signal_array = numpy.empty(
+                    (len(times), len(columns)),
+                    dtype=data_type.decode_array(
+                        numpy.zeros(data_type.size, dtype=uint8)).dtype)
+            elif not numpy.array_equal(pop_times, times):
+                raise NotImplementedError("times differ")
+            selected = numpy.flatnonzero(column_regions == index)
+            if len(selected):
+                # The bytes of each of the selected columns of this region
+                column_bytes = (
+                    (columns[selected] - start)[:, None] * data_type.size +
+                    numpy.arange(data_type.size)).reshape(-1)
+                signal_array[:, selected] = data_type.decode_array(
+                    numpy.ascontiguousarray(data[:, column_bytes])).reshape(
+                        len(times), len(selected))
+            start += len(neurons)
+        if signal_array is None:
+            return numpy.zeros((0,), dtype=float64)
+        return signal_array
 
     def __get_matrix_data(
             self, rec_id: int, data_type: DataType,
@@ -865,52 +1280,64 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
         :param variable:
         :return: numpy array of the data, neurons
         """
-        signal_array: NDArray[floating] | None = None
-        pop_times: NDArray[floating] | None = None
-        pop_neurons: list[None] = []
+        regions, indexes, columns = self.__find_matrix_columns(
+            rec_id, view_indexes, pop_size, variable)
+        return (self.__read_matrix_columns(regions, data_type, columns),
+                indexes)
+
+    def __find_matrix_columns(
+            self, rec_id: int, view_indexes: ViewIndices, pop_size: int,
+            variable: str) -> tuple[
+                list[tuple[int, NDArray[integer]]], NDArray[integer],
+                NDArray[integer] | None]:
+        """
+        Works out where the matrix data of this population/recording ID
+        is, without reading any of it.
+
+        :param rec_id:
+        :param view_indexes:
+            The indexes for which data should be returned. Or `None` for all
+        :param pop_size:
+        :param variable:
+        :return: The region and neurons recording of each region, the
+            neurons to return data for, and the column of each of those
+            neurons or `None` for all columns
+        """
+        regions: list[tuple[int, NDArray[integer]]] = []
+        pop_neurons: list[NDArray[integer]] = []
         indexes: list[int] = []
 
         for region_id, neurons, _, _, _, index in \
                 self.__get_region_metadata(rec_id):
             if neurons is not None:
-                pop_neurons.extend(neurons)
+                pop_neurons.append(neurons)
             else:
                 indexes.append(index)
                 neurons = numpy.array([index], dtype=uint32)
-            times, data = self.__get_matrix_data_by_region(
-                region_id, neurons, data_type)
-            if signal_array is None or pop_times is None:
-                signal_array = data
-                pop_times = times
-            elif numpy.array_equal(pop_times, times):
-                signal_array = numpy.append(
-                    signal_array, data, axis=1)
-            else:
-                raise NotImplementedError("times differ")
-        if signal_array is None:
-            signal_array = numpy.zeros((0,), dtype=float64)
+            regions.append((region_id, neurons))
 
         if len(indexes) > 0:
             assert (len(pop_neurons) == 0)
             if view_indexes is not None:
                 raise SpynnakerException(
                     f"{variable} data can not be extracted using a view")
-            return signal_array, numpy.array(indexes)
+            return regions, numpy.array(indexes), None
 
-        data_indexes = numpy.array(pop_neurons)
+        data_indexes = (numpy.concatenate(pop_neurons) if pop_neurons
+                        else numpy.array([], dtype=numpy.int64))
         if view_indexes is None:
             view_indexes = range(pop_size)
-        if list(view_indexes) == list(data_indexes):
-            indexes_a = numpy.array(data_indexes)
+        if self.__is_all_data(view_indexes, data_indexes):
+            indexes_a = data_indexes
+            columns = None
         else:
             # keep just the view indexes in the data
             indexes_a = self.__combine_indexes(
                 view_indexes, data_indexes, variable)
             # keep just data columns in the view
-            map_indexes = [list(data_indexes).index(i) for i in indexes_a]
-            signal_array = signal_array[:, map_indexes]
+            columns = self.__find_columns(indexes_a, data_indexes)
 
-        return signal_array, indexes_a
+        return regions, indexes_a, columns
 
     def __get_rewires_by_region(
             self, region_id: int, vertex_slice: Slice,
@@ -1082,18 +1509,246 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
         if view_indexes is None:
             view_indexes = range(pop_size)
 
-        # get_spike will go boom if buffered_type not spikes
-        spikes = self.__get_spikes(
-            rec_id, view_indexes, buffered_type,
-            n_colour_bits, SPIKES)[0]
-        counts = numpy.bincount(spikes[:, 0].astype(dtype=numpy.int32),
-                                minlength=pop_size)
+        # Count a block at a time so the spikes are never all in memory
+        counts = numpy.zeros(pop_size, dtype=numpy.int64)
+        indexes: list[int] = []
+        for ids, _ in self.__iter_spikes(
+                rec_id, buffered_type, n_colour_bits, indexes):
+            counts += numpy.bincount(
+                ids.astype(numpy.int64), minlength=pop_size)
+        # report any neurons in the view that did not record
+        self.__combine_indexes(view_indexes, indexes, SPIKES)
         return {i: counts[i] for i in view_indexes}
 
+    def __count_matrix_rows(
+            self, regions: list[tuple[int, NDArray[integer]]],
+            data_type: DataType) -> int:
+        """
+        Counts the rows (times) of matrix data from the size of the data,
+        without reading any of it.
+
+        :param regions: The region and neurons recording of each region
+        :param data_type: type of data to extract
+        :return: The number of rows recorded
+        """
+        if not regions:
+            return 0
+        region_id, neurons = regions[0]
+        row_size = BYTES_PER_WORD + len(neurons) * data_type.size
+        path = self.__get_region_file(region_id)
+        if path is not None:
+            return os.path.getsize(path) // row_size
+        for row in self.cursor().execute(
+                """
+                SELECT SUM(content_len) AS n_bytes
+                FROM recording_data
+                WHERE recording_region_id = ?
+                """, (region_id,)):
+            return (row["n_bytes"] or 0) // row_size
+        return 0
+
+    @classmethod
+    def __load_matrix_rows(
+            cls, database_file: str,
+            regions: list[tuple[int, NDArray[integer]]], data_type: DataType,
+            columns: NDArray[integer] | None, rows: slice,
+            channels: NDArray[integer] | None) -> NDArray:
+        """
+        Reads some of the matrix data of a lazy signal.
+
+        :param database_file: The database holding the data
+        :param regions: The region and neurons recording of each region
+        :param data_type: type of data to extract
+        :param columns: The column of each channel, or `None` for all
+        :param rows: The rows to decode
+        :param channels: The channels to decode, or `None` for all
+        :return: The decoded data, one column per channel
+        """
+        if channels is not None and columns is not None:
+            columns = columns[channels]
+        elif channels is not None:
+            columns = channels
+        with cls(database_file) as db:
+            return db.__read_matrix_columns(regions, data_type, columns, rows)
+
+    def __get_spike_indexes(
+            self, rec_id: int, buffer_type: BufferDataType) -> list[int]:
+        """
+        Finds the IDs recording spikes without reading any spikes.
+
+        :param rec_id:
+        :param buffer_type:
+        :return: All IDs recording
+        """
+        indexes: list[int] = []
+        for _, neurons, vertex_slice, selective_recording, _, _ in \
+                self.__get_region_metadata(rec_id):
+            if buffer_type == BufferDataType.EIEIO_SPIKES:
+                indexes.extend(vertex_slice.get_raster_ids())
+            elif neurons is not None and (
+                    selective_recording is not None or
+                    buffer_type != BufferDataType.NEURON_SPIKES):
+                indexes.extend(neurons)
+        return indexes
+
+    def __read_neuron_spike_regions(self, rec_id: int) -> list[tuple[
+            NDArray[integer], NDArray[floating], NDArray[uint32]]]:
+        """
+        Reads the recorded neuron spikes of each region without decoding
+        them.
+
+        :param rec_id:
+        :return: The neurons recording, times in ms and spike words of each
+            region
+        """
+        simulation_time_step_ms = self.__get_simulation_time_step_ms()
+        regions: list[tuple[
+            NDArray[integer], NDArray[floating], NDArray[uint32]]] = []
+        for region_id, neurons, _, selective_recording, _, _ in \
+                self.__get_region_metadata(rec_id):
+            if neurons is None or selective_recording is None:
+                continue
+            raw_data = self.__read_spike_words(region_id, len(neurons))
+            regions.append((
+                neurons, raw_data[:, 0] * simulation_time_step_ms,
+                raw_data[:, 1:]))
+        return regions
+
+    @staticmethod
+    def __neuron_spike_times(
+            regions: list[tuple[
+                NDArray[integer], NDArray[floating], NDArray[uint32]]],
+            index: int, t_from: float | None,
+            t_to: float | None) -> NDArray[floating]:
+        """
+        Decodes the spike times of one neuron, looking only at the word
+        holding its bit in the timesteps in the time range.
+
+        :param regions: The regions as from __read_neuron_spike_regions
+        :param index: The index of the neuron
+        :param t_from: The time to read from in ms, or `None` for no limit
+        :param t_to: The time to read up to in ms, or `None` for no limit
+        :return: The spike times in ms, in order
+        """
+        for neurons, times, words in regions:
+            local_indices = numpy.flatnonzero(neurons == index)
+            if not len(local_indices):
+                continue
+            first = 0 if t_from is None else int(
+                numpy.searchsorted(times, t_from, "left"))
+            end = len(times) if t_to is None else int(
+                numpy.searchsorted(times, t_to, "right"))
+            word, bit = divmod(int(local_indices[0]), _BITS_PER_WORD)
+            spiked = (words[first:end, word] >> uint32(bit)) & 1
+            return times[first:end][spiked != 0].astype(float64)
+        return numpy.zeros(0, dtype=float64)
+
+    @classmethod
+    def __load_spike_times(
+            cls, database_file: str, rec_id: int, buffer_type: BufferDataType,
+            n_colour_bits: int, spikes: _LazySpikes, index: int,
+            t_from: float | None, t_to: float | None) -> NDArray[floating]:
+        """
+        Reads the spike times of a lazy spike train.
+
+        The recording is read from the database by the first train of the
+        population to be loaded, and kept in `spikes` for the others.
+
+        :param database_file: The database holding the data
+        :param rec_id:
+        :param buffer_type:
+        :param n_colour_bits:
+        :param spikes: What has been read of the spikes of the population
+        :param index: The index of the neuron
+        :param t_from: The time to read from in ms, or `None` for no limit
+        :param t_to: The time to read up to in ms, or `None` for no limit
+        :return: The spike times in ms, in order
+        """
+        if buffer_type == BufferDataType.NEURON_SPIKES:
+            if spikes.neuron_regions is None:
+                with cls(database_file) as db:
+                    spikes.neuron_regions = cls.__read_neuron_spike_regions(
+                        db, rec_id)
+            return cls.__neuron_spike_times(
+                spikes.neuron_regions, index, t_from, t_to)
+
+        if spikes.ids is None or spikes.times is None:
+            spike_ids: list[NDArray[integer]] = []
+            spike_times: list[NDArray[floating]] = []
+            with cls(database_file) as db:
+                for ids, times in db.__iter_spikes(
+                        rec_id, buffer_type, n_colour_bits, []):
+                    spike_ids.append(ids.astype(numpy.int64))
+                    spike_times.append(times.astype(float64))
+            all_ids = numpy.concatenate(
+                [numpy.zeros(0, dtype=numpy.int64)] + spike_ids)
+            all_times = numpy.concatenate(
+                [numpy.zeros(0, dtype=float64)] + spike_times)
+            order = numpy.lexsort((all_times, all_ids))
+            spikes.ids = all_ids[order]
+            spikes.times = all_times[order]
+
+        times = spikes.times[
+            numpy.searchsorted(spikes.ids, index, "left"):
+            numpy.searchsorted(spikes.ids, index, "right")]
+        first = 0 if t_from is None else int(
+            numpy.searchsorted(times, t_from, "left"))
+        end = len(times) if t_to is None else int(
+            numpy.searchsorted(times, t_to, "right"))
+        return times[first:end]
+
+    def __add_lazy_data(
+            self, variable: str, segment: neo.Segment,
+            view_indexes: ViewIndices, t_stop: float,
+            metadata: tuple[int, DataType | None, BufferDataType, float,
+                            float, int, str | None, int]) -> None:
+        """
+        Adds lazy stand-ins for the data of one population and variable,
+        which read the data from this database only when loaded.
+
+        :param variable:
+        :param segment: Segment to add data to
+        :param view_indexes:
+        :param t_stop:
+        :param metadata: The recording metadata of the variable
+        """
+        (rec_id, data_type, buffer_type, t_start, sampling_interval_ms,
+         pop_size, units, n_colour_bits) = metadata
+        block = segment.block
+        first_id: int = block.annotations[self._FIRST_ID]
+        sampling_rate = 1000 / sampling_interval_ms * quantities.Hz
+        if buffer_type == BufferDataType.MATRIX:
+            assert data_type is not None
+            regions, indexes, columns = self.__find_matrix_columns(
+                rec_id, view_indexes, pop_size, variable)
+            segment.analogsignals.append(LazyAnalogSignal(
+                partial(self.__load_matrix_rows, self._database_file,
+                        regions, data_type, columns),
+                self.__count_matrix_rows(regions, data_type),
+                t_start * quantities.ms, sampling_rate,
+                units or "dimensionless", variable, block.name, indexes,
+                list(indexes + first_id)))
+            return
+
+        if view_indexes is None:
+            view_indexes = range(pop_size)
+        # report any neurons in the view that did not record
+        self.__combine_indexes(
+            view_indexes, self.__get_spike_indexes(rec_id, buffer_type),
+            variable)
+        spikes = _LazySpikes()
+        segment.spiketrains.extend([
+            LazySpikeTrain(
+                partial(self.__load_spike_times, self._database_file,
+                        rec_id, buffer_type, n_colour_bits, spikes, index),
+                t_start, t_stop, sampling_rate, block.name,
+                index + first_id, index)
+            for index in view_indexes])
+
     def __add_data(
             self, pop_label: str, variable: str,
             segment: neo.Segment, view_indexes: ViewIndices, t_stop: float,
-            allow_missing: bool) -> None:
+            allow_missing: bool, lazy: bool) -> None:
         """
         Gets the data as a Numpy array for one population and variable.
 
@@ -1108,6 +1763,7 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
         :param segment: Segment to add data to
         :param t_stop:
         :param allow_missing: If True silently skips is variable not recorded
+        :param lazy: If True add stand-ins that only read the data when loaded
         :raises \
             ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
             If the recording metadata not setup correctly
@@ -1120,6 +1776,11 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
                 raise ConfigurationException(
                     f"No data for {pop_label=} {variable=}")
 
+        if lazy and metadata[2] != BufferDataType.REWIRES:
+            self.__add_lazy_data(
+                variable, segment, view_indexes, t_stop, metadata)
+            return
+
         (rec_id, data_type, buffer_type, t_start, sampling_interval_ms,
          pop_size, units, n_colour_bits) = metadata
 
@@ -1236,11 +1897,16 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
 
     def get_full_block(
             self, pop_label: str, variables: Names, view_indexes: ViewIndices,
-            annotations: Annotations) -> neo.Block:
+            annotations: Annotations, lazy: bool = False) -> neo.Block:
         """
         Creates a block with metadata and data for this segment.
         Any previous segments will be empty.
 
+        If lazy, the signals and spike trains of the segment are stand-ins
+        (like the proxy objects of neo's IO modules) which read only the
+        data asked for from this database when their ``load`` method is
+        called.  Rewires are always read straight away.
+
         :param pop_label: The label for the population of interest
 
             .. note::
@@ -1252,11 +1918,12 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
             One or more variable names or `None` for all available
         :param view_indexes: List of neurons IDs to include or `None` for all
         :param annotations: annotations to put on the neo block
+        :param lazy: If True, read the data only when it is loaded
         :return: The Neo block
         """
         block = self.get_empty_block(pop_label, annotations)
         self.add_segment(block, pop_label, variables, view_indexes,
-                         allow_missing=False)
+                         allow_missing=False, lazy=lazy)
         return block
 
     def csv_segment(
@@ -1349,7 +2016,8 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
 
     def add_segment(
             self, block: neo.Block, pop_label: str, variables: Names,
-            view_indexes: ViewIndices, allow_missing: bool) -> None:
+            view_indexes: ViewIndices, allow_missing: bool,
+            lazy: bool = False) -> None:
         """
         Adds a segment to the block.
 
@@ -1365,6 +2033,7 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
             One or more variable names or `None` for all available
         :param view_indexes: List of neurons IDs to include or `None` for all
         :param allow_missing: If True silently skips any variables not recorded
+        :param lazy: If True, read the data only when it is loaded
         :raises \
             ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
             If the recording metadata not setup correctly
@@ -1376,7 +2045,7 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
 
         for variable in self.__clean_variables(variables, pop_label):
             self.__add_data(pop_label, variable, segment, view_indexes,
-                            t_stop, allow_missing)
+                            t_stop, allow_missing, lazy)
 
     def clear_data(self, pop_label: str, variables: Names) -> None:
         """
@@ -1418,6 +2087,7 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
 
         for region_id in region_ids:
             self._clear_recording_region(region_id)
+            self.__remove_region_file(region_id)
 
     def write_metadata(self) -> None:
         """
@@ -1462,11 +2132,11 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
             neurons = app_vertex.get_neurons_recording(
                 variable, vertex_slice)
             if neurons is None:
-                recording_neurons_st = None
+                recording_neurons = None
             elif len(neurons) == 0:
                 continue
             else:
-                recording_neurons_st = self.array_to_string(neurons)
+                recording_neurons = self.array_to_ranges(neurons)
             if buffered_data_type == BufferDataType.EIEIO_SPIKES:
                 # Sneaky! An undeclared interface...
                 assert isinstance(
@@ -1477,11 +2147,11 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
             self.cursor().execute(
                 """
                 INSERT INTO region_metadata(
-                    rec_id, region_id, recording_neurons_st,
+                    rec_id, region_id, recording_neurons,
                     base_key, vertex_slice)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (rec_id, region_id, recording_neurons_st,
+                (rec_id, region_id, recording_neurons,
                  base_key, str(vertex.vertex_slice)))
 
     @staticmethod
@@ -1522,6 +2192,42 @@ class NeoBufferDatabase(BufferDatabase, NeoCsv):
             results += str(previous)
         return results
 
+    @staticmethod
+    def array_to_ranges(indexes: Collection[int]) -> bytes:
+        """
+        Converts a list of non-negative integers into a compact binary form.
+        Works best if the list is sorted.
+
+        Each run of sequential IDs is stored as a little-endian uint32
+        start (inclusive) and stop (exclusive) pair.
+
+        :param indexes: Collection (ideally sorted of int Values)
+        :returns: bytes representation to be used in the database
+        """
+        ids = numpy.asarray(indexes, dtype=numpy.int64).reshape(-1)
+        if len(ids) == 0:
+            return b""
+        breaks = numpy.flatnonzero(numpy.diff(ids) != 1) + 1
+        starts = ids[numpy.concatenate(([0], breaks))]
+        stops = ids[numpy.concatenate((breaks, [len(ids)])) - 1] + 1
+        return numpy.column_stack((starts, stops)).astype("<u4").tobytes()
+
+    @staticmethod
+    def ranges_to_array(data: bytes) -> NDArray[integer]:
+        """
+        Converts bytes into an array of integers.
+        Assumes the bytes were created by :py:meth:`array_to_ranges`
+
+        :param data: in format used by array_to_ranges
+        :returns: Array of integers
+        """
+        runs = numpy.frombuffer(data, dtype="<u4").reshape(-1, 2).astype(
+            numpy.int64)
+        lengths = runs[:, 1] - runs[:, 0]
+        # Offset of each run start from its position in the output
+        offsets = runs[:, 0] - (numpy.cumsum(lengths) - lengths)
+        return numpy.repeat(offsets, lengths) + numpy.arange(lengths.sum())
+
     @classmethod
     def string_to_array(cls, string: str) -> list[int]:
         """
@@ -15,7 +15,6 @@ from __future__ import annotations
 
 import csv
 import logging
-from collections import defaultdict
 from collections.abc import Iterable
 from datetime import datetime
 from typing import (
@@ -198,13 +197,23 @@ class NeoCsv:
         """
         block = segment.block
         first_id = block.annotations[self._FIRST_ID]
-        times = defaultdict(list)
-        for neuron_id, time in spikes:
-            times[int(neuron_id)].append(time)
 
-        for index in view_indexes:
-            spiketrain = SpikeTrain(
-                times=times[index],
+        # Sort the spikes by neuron, keeping the order of each neuron's
+        # spikes, so that each SpikeTrain can be a view of the sorted times
+        spikes = numpy.reshape(spikes, (-1, 2))
+        neuron_ids = spikes[:, 0].astype(numpy.int64)
+        order = numpy.argsort(neuron_ids, kind="stable")
+        neuron_ids = neuron_ids[order]
+        times = spikes[order, 1].astype(float64)
+        indexes = numpy.fromiter(view_indexes, dtype=numpy.int64)
+        starts = numpy.searchsorted(neuron_ids, indexes, side="left")
+        ends = numpy.searchsorted(neuron_ids, indexes, side="right")
+
+        # Add all the SpikeTrains at once, as adding them one at a time
+        # checks each against all those already added
+        segment.spiketrains.extend([
+            SpikeTrain(
+                times=times[start:end],
                 t_start=t_start,
                 t_stop=t_stop,
                 units=ms,
@@ -213,7 +222,8 @@ class NeoCsv:
                 source_population=block.name,
                 source_id=index + first_id,
                 source_index=index)
-            segment.spiketrains.append(spiketrain)
+            for index, start, end in zip(
+                indexes.tolist(), starts.tolist(), ends.tolist())])
 
     def _csv_spike_data(self, csv_writer: CSVWriter, spikes: NDArray,
                         indexes: NDArray[integer]) -> None:
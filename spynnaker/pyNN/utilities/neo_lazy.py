@@ -0,0 +1,258 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Stand-ins for neo data objects which only read their data from the
+recording database when it is asked for, in the style of the proxy objects
+of :py:mod:`neo.io.proxyobjects`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+import numpy
+from neo import AnalogSignal, SpikeTrain
+from neo.core.baseneo import BaseNeo
+from numpy import float64, floating, integer
+from numpy.typing import ArrayLike, NDArray
+from quantities import Quantity, ms
+
+#: Reads the given rows of the given channels (or all if `None`) of a signal
+LoadRows = Callable[[slice, NDArray[integer] | None], NDArray]
+
+#: Reads the spike times (in ms) of a neuron from the first time up to and
+#: including the second time; `None` means no limit
+LoadTimes = Callable[[float | None, float | None], NDArray[floating]]
+
+#: A start and stop time, in milliseconds if without units, or `None` for no
+#: limit
+TimeSlice = tuple[Quantity | float | None, Quantity | float | None]
+
+
+def _quantity_to_ms(time: Quantity) -> float:
+    """
+    Convert a time with units to milliseconds.
+
+    :param time: A time with units
+    :return: The time in milliseconds
+    """
+    return float(time.rescale(ms).magnitude)
+
+
+def _to_ms(time: Quantity | float | None) -> float | None:
+    """
+    Convert a time to milliseconds.
+
+    :param time: A time, in milliseconds if it has no units
+    :return: The time in milliseconds, or `None` if no time
+    """
+    if time is None:
+        return None
+    if isinstance(time, Quantity):
+        return _quantity_to_ms(time)
+    return float(time)
+
+
+class LazyAnalogSignal(BaseNeo):
+    """
+    Stands in for an :py:class:`~neo.core.AnalogSignal` in a segment,
+    decoding only the rows and channels that are loaded.
+    """
+
+    _parent_objects = ("Segment",)
+    _necessary_attrs = (
+        ("sampling_rate", Quantity, 0), ("t_start", Quantity, 0))
+    proxy_for = AnalogSignal
+
+    def __init__(
+            self, load_rows: LoadRows, n_rows: int, t_start: Quantity,
+            sampling_rate: Quantity, units: Quantity | str, name: str,
+            source_population: str, channel_names: NDArray[integer],
+            source_ids: Sequence[int]):
+        """
+        :param load_rows: Reads the data
+        :param n_rows: The number of rows (times) recorded
+        :param t_start: The time of the first row
+        :param sampling_rate: The rate at which rows were recorded
+        :param units: The units of the data
+        :param name: The name of the variable recorded
+        :param source_population: The label of the population
+        :param channel_names: The index of the neuron of each channel
+        :param source_ids: The ID of the neuron of each channel
+        """
+        super().__init__(
+            name=name, source_population=source_population,
+            source_ids=list(source_ids), channel_names=channel_names)
+        self.__load_rows = load_rows
+        self.shape = (n_rows, len(channel_names))
+        self.t_start = t_start
+        self.sampling_rate = sampling_rate
+        self.units = units
+
+    @property
+    def sampling_period(self) -> Quantity:
+        """
+        The time between rows.
+        """
+        return 1 / self.sampling_rate
+
+    @property
+    def duration(self) -> Quantity:
+        """
+        The time covered by the rows.
+        """
+        return self.shape[0] / self.sampling_rate
+
+    @property
+    def t_stop(self) -> Quantity:
+        """
+        The time after the last row.
+        """
+        return self.t_start + self.duration
+
+    def __row_index(self, time: Quantity | float | None, default: int) -> int:
+        """
+        Get the index of the row nearest to a time.
+
+        :param time: The time, in milliseconds if it has no units
+        :param default: The index to use if there is no time
+        :return: The row index, limited to the rows recorded
+        """
+        time_ms = _to_ms(time)
+        if time_ms is None:
+            return default
+        rate_per_ms = float(self.sampling_rate.rescale(1 / ms).magnitude)
+        index = int(numpy.rint(
+            (time_ms - _quantity_to_ms(self.t_start)) * rate_per_ms))
+        return min(max(index, 0), self.shape[0])
+
+    def load(self, time_slice: TimeSlice | None = None,
+             channel_indexes: ArrayLike | None = None) -> AnalogSignal:
+        """
+        Read the signal, or part of it.
+
+        :param time_slice:
+            The start and stop times to read from and up to, in milliseconds
+            if they have no units; either may be `None` to mean no limit
+        :param channel_indexes:
+            The positions of the channels to read, or `None` for all
+        :return: The signal read
+        """
+        t_from, t_to = (None, None) if time_slice is None else time_slice
+        first = self.__row_index(t_from, 0)
+        end = max(first, self.__row_index(t_to, self.shape[0]))
+        channels = None
+        channel_names = self.annotations["channel_names"]
+        source_ids = self.annotations["source_ids"]
+        if channel_indexes is not None:
+            channels = numpy.asarray(channel_indexes, dtype=numpy.int64)
+            channel_names = channel_names[channels]
+            source_ids = [source_ids[channel] for channel in channels]
+        signal = AnalogSignal(
+            self.__load_rows(slice(first, end), channels),
+            units=self.units,
+            t_start=self.t_start + first * self.sampling_period,
+            sampling_rate=self.sampling_rate,
+            name=self.name,
+            source_population=self.annotations["source_population"],
+            source_ids=source_ids,
+            channel_names=channel_names)
+        return signal
+
+    def time_slice(self, t_start: Quantity | float | None,
+                   t_stop: Quantity | float | None) -> AnalogSignal:
+        """
+        Read the signal between two times.
+
+        :param t_start: The time to read from
+        :param t_stop: The time to read up to
+        :return: The signal read
+        """
+        return self.load(time_slice=(t_start, t_stop))
+
+
+class LazySpikeTrain(BaseNeo):
+    """
+    Stands in for a :py:class:`~neo.core.SpikeTrain` in a segment, reading
+    the spikes of the neuron only when it is loaded.
+    """
+
+    _parent_objects = ("Segment",)
+    _necessary_attrs = (
+        ("t_start", Quantity, 0), ("t_stop", Quantity, 0))
+    proxy_for = SpikeTrain
+
+    def __init__(
+            self, load_times: LoadTimes, t_start: float, t_stop: float,
+            sampling_rate: Quantity, source_population: str, source_id: int,
+            source_index: int):
+        """
+        :param load_times: Reads the spike times of the neuron
+        :param t_start: The start time of the recording in milliseconds
+        :param t_stop: The end time of the recording in milliseconds
+        :param sampling_rate: The rate at which the neuron was recorded
+        :param source_population: The label of the population
+        :param source_id: The ID of the neuron
+        :param source_index: The index of the neuron in the population
+        """
+        super().__init__(
+            source_population=source_population, source_id=source_id,
+            source_index=source_index)
+        self.__load_times = load_times
+        self.t_start = t_start * ms
+        self.t_stop = t_stop * ms
+        self.sampling_rate = sampling_rate
+
+    def load(self, time_slice: TimeSlice | None = None) -> SpikeTrain:
+        """
+        Read the spikes, or those in a time range.
+
+        :param time_slice:
+            The start and stop times to read from and up to, in milliseconds
+            if they have no units; either may be `None` to mean no limit
+        :return: The spikes read
+        """
+        t_start = _quantity_to_ms(self.t_start)
+        t_stop = _quantity_to_ms(self.t_stop)
+        t_from, t_to = (None, None) if time_slice is None else time_slice
+        from_ms = _to_ms(t_from)
+        to_ms = _to_ms(t_to)
+        times = self.__load_times(from_ms, to_ms)
+        if from_ms is not None:
+            t_start = max(t_start, from_ms)
+        if to_ms is not None:
+            t_stop = min(t_stop, to_ms)
+        return SpikeTrain(
+            times=times,
+            t_start=t_start,
+            t_stop=max(t_start, t_stop),
+            units=ms,
+            dtype=float64,
+            sampling_rate=self.sampling_rate,
+            source_population=self.annotations["source_population"],
+            source_id=self.annotations["source_id"],
+            source_index=self.annotations["source_index"])
+
+    def time_slice(self, t_start: Quantity | float | None,
+                   t_stop: Quantity | float | None) -> SpikeTrain:
+        """
+        Read the spikes between two times.
+
+        :param t_start: The time to read from
+        :param t_stop: The time to read up to
+        :return: The spikes read
+        """
+        return self.load(time_slice=(t_start, t_stop))
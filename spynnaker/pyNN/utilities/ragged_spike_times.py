@@ -0,0 +1,184 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import overload
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+
+class RaggedSpikeTimes(Sequence[NDArray]):
+    """
+    The spike times of a number of neurons, held as a single flat array of
+    times and an array of offsets into it (as in a CSR sparse matrix), so
+    that the times of neuron `i` are `times[offsets[i]:offsets[i + 1]]`.
+
+    This behaves as a sequence of arrays, one per neuron, but allows the
+    times of all neurons to be processed in a single pass.
+    """
+    __slots__ = (
+        "__offsets",
+        "__times")
+
+    def __init__(self, times: ArrayLike, offsets: ArrayLike):
+        """
+        :param times: The spike times of all the neurons, neuron by neuron
+        :param offsets:
+            The index into the times of the first spike time of each neuron,
+            followed by the total number of spike times
+        :raises \
+            ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+            If the offsets don't match the times
+        """
+        # Don't ravel 1D times, which might be a strided view of a file
+        self.__times = numpy.asarray(times)
+        if self.__times.ndim != 1:
+            self.__times = self.__times.reshape(-1)
+        self.__offsets = numpy.asarray(offsets, dtype=numpy.int64).ravel()
+        if (not len(self.__offsets) or self.__offsets[0] != 0 or
+                self.__offsets[-1] != len(self.__times) or
+                numpy.any(numpy.diff(self.__offsets) < 0)):
+            raise ConfigurationException(
+                "The offsets of ragged spike times must start at 0, never "
+                "decrease and end at the number of spike times")
+
+    @classmethod
+    def from_lists(
+            cls, spike_times: Sequence[ArrayLike] | NDArray | RaggedSpikeTimes
+            ) -> RaggedSpikeTimes:
+        """
+        Make ragged spike times from a list of lists of spike times.
+
+        :param spike_times:
+            The spike times of each neuron, as lists, as the rows of an
+            array, or as ragged spike times already
+        :return: The same spike times held as ragged spike times
+        """
+        if isinstance(spike_times, RaggedSpikeTimes):
+            return spike_times
+        arrays = [numpy.asarray(times).ravel() for times in spike_times]
+        lengths = numpy.fromiter(
+            (len(times) for times in arrays), dtype=numpy.int64,
+            count=len(arrays))
+        offsets = numpy.concatenate(([0], numpy.cumsum(lengths)))
+        non_empty = [times for times in arrays if len(times)]
+        if non_empty:
+            return cls(numpy.concatenate(non_empty), offsets)
+        return cls(numpy.zeros(0), offsets)
+
+    @property
+    def times(self) -> NDArray:
+        """
+        The spike times of all the neurons, neuron by neuron.
+        """
+        return self.__times
+
+    @property
+    def offsets(self) -> NDArray[numpy.int64]:
+        """
+        The index into :py:attr:`times` of the first spike time of each
+        neuron, followed by the total number of spike times.
+        """
+        return self.__offsets
+
+    @property
+    def neuron_ids(self) -> NDArray[numpy.int64]:
+        """
+        The ID of the neuron of each of the :py:attr:`times`.
+        """
+        return numpy.repeat(
+            numpy.arange(len(self)), numpy.diff(self.__offsets))
+
+    def with_times(self, times: ArrayLike) -> RaggedSpikeTimes:
+        """
+        Make ragged spike times with the same shape but different values,
+        e.g. the times converted to time steps.
+
+        :param times: The new times, one for each of the :py:attr:`times`
+        :return: The new ragged spike times
+        """
+        return RaggedSpikeTimes(times, self.__offsets)
+
+    def select(
+            self, ids: slice | NDArray | Sequence[int]) -> RaggedSpikeTimes:
+        """
+        Get the spike times of some of the neurons.
+
+        The times of a run of neurons, such as those of a contiguous slice,
+        are a view of these times rather than a copy; other neurons have
+        their times gathered into a new array.
+
+        :param ids: The IDs of the neurons to get the spike times of
+        :return: The spike times of those neurons, in the order given
+        """
+        if isinstance(ids, slice):
+            start, stop, step = ids.indices(len(self))
+            if step == 1:
+                return self.__select_run(start, max(start, stop))
+            neuron_ids = numpy.arange(start, stop, step)
+        else:
+            neuron_ids = numpy.arange(len(self))[ids]
+        if len(neuron_ids) and numpy.array_equal(
+                neuron_ids, numpy.arange(
+                    neuron_ids[0], neuron_ids[0] + len(neuron_ids))):
+            return self.__select_run(
+                int(neuron_ids[0]), int(neuron_ids[-1]) + 1)
+        starts = self.__offsets[neuron_ids]
+        lengths = self.__offsets[neuron_ids + 1] - starts
+        offsets = numpy.concatenate(([0], numpy.cumsum(lengths)))
+        indices = (numpy.arange(offsets[-1]) -
+                   numpy.repeat(offsets[:-1] - starts, lengths))
+        return RaggedSpikeTimes(self.__times[indices], offsets)
+
+    def __select_run(self, start: int, stop: int) -> RaggedSpikeTimes:
+        """
+        Get the spike times of a run of neurons as a view of these times.
+
+        :param start: The ID of the first neuron of the run
+        :param stop: The ID after the last neuron of the run
+        :return: The spike times of the neurons in the run
+        """
+        offsets = self.__offsets[start:stop + 1]
+        return RaggedSpikeTimes(
+            self.__times[offsets[0]:offsets[-1]], offsets - offsets[0])
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> NDArray:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice | NDArray) -> RaggedSpikeTimes:
+        ...
+
+    def __getitem__(
+            self, index: int | slice | NDArray) -> NDArray | RaggedSpikeTimes:
+        if isinstance(index, (int, numpy.integer)):
+            neuron_id = range(len(self))[index]
+            return self.__times[
+                self.__offsets[neuron_id]:self.__offsets[neuron_id + 1]]
+        return self.select(index)
+
+    def __iter__(self) -> Iterator[NDArray]:
+        return iter(numpy.split(self.__times, self.__offsets[1:-1]))
+
+    def __repr__(self) -> str:
+        return f"RaggedSpikeTimes({self.__times!r}, {self.__offsets!r})"
@@ -190,9 +190,9 @@ class Struct:
             # Get the values and convert to the correct data type
             n_values = stop - start
             if isinstance(value, RandomDistribution):
-                r_vals = value.next(n_values)
-                data[name][data_pos:data_pos + n_values] = [
-                    convert_to(v, data_type) for v in r_vals]
+                r_vals = numpy.asarray(value.next(n_values)).reshape(-1)
+                data[name][data_pos:data_pos + n_values] = convert_to(
+                    r_vals, data_type)
             else:
                 data[name][data_pos:data_pos + n_values] = convert_to(
                     value, data_type)
@@ -22,12 +22,13 @@ import math
 import os
 from collections.abc import Sized
 from math import isnan
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, cast, overload
 
 import neo
 import numpy
 from neo.io.baseio import BaseIO  # type: ignore[import]
 from numpy import float64, floating, uint32
+from numpy.lib.format import MAGIC_PREFIX
 from numpy.typing import NDArray
 from pyNN.random import AbstractRNG, RandomDistribution
 from scipy.stats import binom
@@ -44,6 +45,7 @@ from spinn_front_end_common.utilities.constants import (
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 from spynnaker.pyNN.utilities.constants import WRITE_BANDWIDTH_BYTES_PER_SECOND
+from spynnaker.pyNN.utilities.ragged_spike_times import RaggedSpikeTimes
 from spynnaker.pyNN.utilities.random_stats import (
     RandomStatsBinomialImpl,
     RandomStatsExponentialClippedImpl,
@@ -131,18 +133,67 @@ def convert_param_to_numpy(
     return numpy.array(param, dtype=float64)
 
 
+@overload
 def convert_to(value: float, data_type: DataType) -> uint32:
+    ...
+
+
+@overload
+def convert_to(value: NDArray, data_type: DataType) -> NDArray:
+    ...
+
+
+def convert_to(
+        value: float | NDArray, data_type: DataType) -> uint32 | NDArray:
     """
-    Convert a value to a given data type.
+    Convert a value, or a numpy array of values, to a given data type.
 
-    :param value: The value to convert
+    :param value: The value or values to convert
     :param data_type: The data type to convert to
     :return: The converted data as a numpy data type
+    :raises ValueError: If any value is out of range of the data type
     """
+    if isinstance(value, numpy.ndarray):
+        return _convert_array_to(value, data_type)
     return numpy.round(data_type.encode_as_int(value)).astype(
         data_type.struct_encoding)
 
 
+def _convert_array_to(values: NDArray, data_type: DataType) -> NDArray:
+    """
+    Convert a whole array to a given data type in one go.
+
+    Gives the same results as :py:meth:`convert_to` on each value, except
+    that 32-bit or smaller fixed point values are scaled as floats, so may
+    round the other way when exactly half way between two values.
+
+    :param values: The values to convert
+    :param data_type: The data type to convert to
+    :return: The converted data as a numpy array
+    :raises ValueError: If any value is out of range of the data type
+    """
+    encoding = numpy.dtype(data_type.struct_encoding)
+    if data_type.scale != 1:
+        if data_type.size > 4:
+            # Too many bits to scale as a float, so do it exactly
+            return numpy.array(
+                [data_type.encode_as_int(value) for value in values.tolist()],
+                dtype=encoding)
+        # NaN is not in range either
+        in_range = (values >= float(data_type.min)) & (
+            values <= float(data_type.max))
+        if not numpy.all(in_range):
+            value = values[~in_range].flat[0]
+            raise ValueError(
+                f"value {value:f} cannot be converted to "
+                f"{data_type.__doc__}: out of range")
+        return numpy.round(values * float(data_type.scale)).astype(encoding)
+    if encoding.kind in "iu" and values.dtype.kind == "f":
+        # Truncate towards zero, as int() does
+        values = numpy.trunc(values)
+    return numpy.round(values).astype(encoding)
+
+
 def read_in_data_from_file(
         file_path: str, min_atom: int, max_atom: int,
         min_time: float, max_time: float, extra: bool = False) -> NDArray:
@@ -235,6 +286,138 @@ def read_spikes_from_file(
     return numpy.array(data)
 
 
+#: The number of spikes to look at in one go when scanning mapped spike files
+SPIKE_FILE_CHUNK_SIZE = 1 << 22
+
+
+def _map_uint32_file(file_path: str) -> NDArray[numpy.uint32]:
+    """
+    Memory-map a file of 32-bit unsigned integers, either a numpy ``.npy``
+    file or a raw file of little-endian values.
+
+    :param file_path: The file to map
+    :return: The values, which are only read from the file when used
+    :raises \
+        ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+        If a numpy file doesn't hold 32-bit unsigned integers
+    """
+    with open(file_path, "rb") as f:
+        is_numpy = f.read(len(MAGIC_PREFIX)) == MAGIC_PREFIX
+    if not is_numpy:
+        return numpy.memmap(file_path, dtype="<u4", mode="r")
+    values = numpy.load(file_path, mmap_mode="r")
+    if values.dtype != numpy.uint32:
+        raise ConfigurationException(
+            f"{file_path} holds {values.dtype} values, not uint32")
+    return values
+
+
+def map_spikes_from_binary_file(
+        spike_file: str, n_neurons: int,
+        offsets_file: str | None = None) -> RaggedSpikeTimes:
+    """
+    Memory-map the spikes of a number of neurons from binary files, so that
+    the spikes are only read from the files as they are needed.
+
+    If `offsets_file` is `None`, the spike file holds pairs of neuron ID and
+    time step, sorted by neuron ID and then time step; spikes of neurons
+    with IDs of `n_neurons` or more are ignored.  Otherwise the spike file
+    holds the time steps of the spikes of each neuron in turn, in order, and
+    the offsets file holds the index of the first spike of each neuron
+    followed by the total number of spikes.
+
+    The files may be numpy ``.npy`` files or raw files of little-endian
+    32-bit unsigned integers.
+
+    :param spike_file: The file of spikes
+    :param n_neurons: The number of neurons to get the spikes of
+    :param offsets_file: The file of offsets of each neuron, if any
+    :return: The time steps of the spikes of each neuron
+    :raises \
+        ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+        If the files are not laid out as described
+    """
+    values = _map_uint32_file(spike_file)
+    if offsets_file is not None:
+        file_offsets = numpy.asarray(_map_uint32_file(offsets_file))
+        if file_offsets.shape != (n_neurons + 1, ):
+            raise ConfigurationException(
+                f"{offsets_file} must hold {n_neurons + 1} offsets")
+        offsets = file_offsets.astype(numpy.int64)
+        spikes = RaggedSpikeTimes(values, offsets)
+        _check_time_steps_sorted(values, offsets, spike_file)
+        return spikes
+
+    if values.size % 2:
+        raise ConfigurationException(
+            f"{spike_file} must hold pairs of neuron ID and time step, but "
+            f"holds an odd number ({values.size}) of values")
+    events = values.reshape(-1, 2)
+    neuron_ids = events[:, 0]
+
+    # Count the spikes of each neuron a chunk at a time, checking the
+    # order, so that the whole file is never held in memory
+    counts = numpy.zeros(n_neurons + 1, dtype=numpy.int64)
+    last_id = 0
+    for start in range(0, len(neuron_ids), SPIKE_FILE_CHUNK_SIZE):
+        chunk = neuron_ids[start:start + SPIKE_FILE_CHUNK_SIZE]
+        if chunk[0] < last_id or numpy.any(chunk[1:] < chunk[:-1]):
+            raise ConfigurationException(
+                f"The spikes in {spike_file} are not sorted by neuron ID")
+        last_id = chunk[-1]
+        counts += numpy.bincount(
+            numpy.minimum(chunk, n_neurons), minlength=n_neurons + 1)
+    offsets = numpy.concatenate(([0], numpy.cumsum(counts[:n_neurons])))
+    time_steps = events[:offsets[-1], 1]
+    _check_time_steps_sorted(time_steps, offsets, spike_file)
+    return RaggedSpikeTimes(time_steps, offsets)
+
+
+def _check_time_steps_sorted(
+        time_steps: NDArray[numpy.uint32], offsets: NDArray[numpy.int64],
+        spike_file: str) -> None:
+    """
+    Check that the time steps of each neuron are in order, a chunk at a
+    time so that the whole file is never held in memory.
+
+    :param time_steps: The time steps of the spikes of each neuron in turn
+    :param offsets: The index of the first spike of each neuron
+    :param spike_file: The file the time steps are mapped from
+    :raises \
+        ~spinn_front_end_common.utilities.exceptions.ConfigurationException:
+        If the time steps of a neuron are not in order
+    """
+    for start in range(1, len(time_steps), SPIKE_FILE_CHUNK_SIZE):
+        chunk = time_steps[start - 1:start + SPIKE_FILE_CHUNK_SIZE]
+        # The time steps may only go back at the first spike of a neuron
+        earlier = numpy.flatnonzero(chunk[1:] < chunk[:-1]) + start
+        if not numpy.all(numpy.isin(earlier, offsets)):
+            raise ConfigurationException(
+                f"The time steps of each neuron in {spike_file} are not "
+                "in order")
+
+
+def most_common_time_step(time_steps: NDArray) -> tuple[int, int]:
+    """
+    Find the most common of some spike time steps, a chunk at a time so
+    that memory-mapped time steps are never all held in memory.
+
+    :param time_steps: The spike time steps
+    :return: The most common time step and the number of times it appears
+    """
+    counts = numpy.zeros(0, dtype=numpy.int64)
+    for start in range(0, len(time_steps), SPIKE_FILE_CHUNK_SIZE):
+        chunk_counts = numpy.bincount(
+            time_steps[start:start + SPIKE_FILE_CHUNK_SIZE])
+        if len(chunk_counts) > len(counts):
+            counts = numpy.pad(counts, (0, len(chunk_counts) - len(counts)))
+        counts[:len(chunk_counts)] += chunk_counts
+    if not len(counts):
+        return 0, 0
+    most = int(numpy.argmax(counts))
+    return most, int(counts[most])
+
+
 def get_probable_maximum_selected(
         n_total_trials: int, n_trials: int, selection_prob: float,
         chance: float = (1.0 / 100.0)) -> int:
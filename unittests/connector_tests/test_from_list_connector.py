@@ -248,3 +248,41 @@ def __get_n_connections(pairs: NDArray, pre_slice: Slice,
     conns = conns[(conns[:, 1] >= post_slice.lo_atom) &
                   (conns[:, 1] <= post_slice.hi_atom)]
     return len(conns)
+
+
+def test_n_connections_maximum() -> None:
+    unittest_setup()
+    n_sources = 100
+    n_targets = 100
+    n_connections = 5000
+    post_neurons_per_core = 7
+    sources = numpy.random.randint(0, n_sources, n_connections)
+    targets = numpy.random.randint(0, n_targets, n_connections)
+    delays = numpy.random.randint(1, 10, n_connections)
+    connection_list = numpy.column_stack(
+        (sources, targets, numpy.ones(n_connections), delays))
+    connector = FromListConnector(connection_list)
+    synapse_info = SynapseInformation(
+        connector=MockConnector(),
+        pre_population=MockPopulation(n_sources, "Pre"),
+        post_population=MockPopulation(n_targets, "Post"),
+        prepop_is_view=False, postpop_is_view=False,
+        synapse_dynamics=MockSynapseDynamics(1, 1), synapse_type=1,
+        receptor_type="bacon", synapse_type_from_dynamics=False,
+        weights=1.0, delays=1.0)
+
+    def max_row(mask: NDArray) -> int:
+        pairs = zip(sources[mask], targets[mask] // post_neurons_per_core)
+        counts: dict[tuple[int, int], int] = {}
+        for pair in pairs:
+            counts[pair] = counts.get(pair, 0) + 1
+        return max(counts.values())
+
+    all_mask = numpy.ones(n_connections, dtype=bool)
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        post_neurons_per_core, synapse_info) == max_row(all_mask)
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        post_neurons_per_core, synapse_info, 3, 5) == max_row(
+            (delays >= 3) & (delays <= 5))
+    assert connector.get_n_connections_to_post_vertex_maximum(
+        synapse_info) == numpy.max(numpy.bincount(targets))
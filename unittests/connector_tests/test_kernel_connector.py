@@ -0,0 +1,104 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from numpy.typing import NDArray
+
+from pacman.model.graphs.common.slice import Slice
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    KernelConnector,
+)
+
+from unittests.mocks import MockConnector, MockPopulation, MockSynapseDynamics
+
+
+def kernel_pairs_by_neuron(
+        shape_pre: tuple[int, int], shape_post: tuple[int, int],
+        shape_kernel: tuple[int, int], weights: NDArray,
+        pre_step: tuple[int, int], pre_start: tuple[int, int],
+        post_step: tuple[int, int], post_start: tuple[int, int],
+        post_slice: Slice) -> list[tuple[int, int, float]]:
+    """
+    Enumerate every pre- and post-neuron pair, as KernelConnector used to.
+    """
+    pairs = []
+    hh, hw = shape_kernel[0] // 2, shape_kernel[1] // 2
+    for pre_idx in range(shape_pre[0] * shape_pre[1]):
+        pre_r, pre_c = divmod(pre_idx, shape_pre[1])
+        if ((pre_r - pre_start[0]) % pre_step[0] or
+                (pre_c - pre_start[1]) % pre_step[1]):
+            continue
+        for post_idx in range(post_slice.lo_atom, post_slice.hi_atom + 1):
+            post_r, post_c = divmod(post_idx, shape_post[1])
+            pac_r = post_start[0] + post_r * post_step[0]
+            pac_c = post_start[1] + post_c * post_step[1]
+            pap_r = ((pac_r - pre_start[0] - 1) // pre_step[0]) + 1
+            pap_c = ((pac_c - pre_start[1] - 1) // pre_step[1]) + 1
+            kr = hh - (pap_r - pre_r)
+            kc = hw - (pap_c - pre_c)
+            if 0 <= kr < shape_kernel[0] and 0 <= kc < shape_kernel[1]:
+                pairs.append((pre_idx, post_idx, weights[kr, kc]))
+    return pairs
+
+
+@pytest.mark.parametrize(
+    "shape_pre, shape_post, shape_kernel, pre_step, pre_start, post_step, "
+    "post_start, post_slice", [
+        ((8, 6), (8, 6), (3, 3), (1, 1), (0, 0), (1, 1), (0, 0),
+         Slice(0, 47)),
+        ((16, 8), (8, 4), (3, 3), (1, 1), (0, 0), (2, 2), (0, 0),
+         Slice(5, 20)),
+        ((9, 7), (5, 4), (4, 2), (2, 1), (1, 0), (1, 2), (0, 1),
+         Slice(3, 19)),
+        ((5, 5), (5, 5), (5, 5), (3, 2), (2, 1), (1, 1), (1, 1),
+         Slice(0, 24)),
+    ])
+def test_create_synaptic_block(
+        shape_pre: tuple[int, int], shape_post: tuple[int, int],
+        shape_kernel: tuple[int, int], pre_step: tuple[int, int],
+        pre_start: tuple[int, int], post_step: tuple[int, int],
+        post_start: tuple[int, int], post_slice: Slice) -> None:
+    unittest_setup()
+    weights = numpy.arange(
+        shape_kernel[0] * shape_kernel[1], dtype=float).reshape(shape_kernel)
+    connector = KernelConnector(
+        shape_pre, shape_post, shape_kernel, weight_kernel=weights,
+        delay_kernel=numpy.full(shape_kernel, 2.0),
+        pre_sample_steps_in_post=pre_step, pre_start_coords_in_post=pre_start,
+        post_sample_steps_in_pre=post_step,
+        post_start_coords_in_pre=post_start)
+    n_pre = shape_pre[0] * shape_pre[1]
+    n_post = shape_post[0] * shape_post[1]
+    synapse_info = SynapseInformation(
+        connector=MockConnector(),
+        pre_population=MockPopulation(n_pre, "Pre"),
+        post_population=MockPopulation(n_post, "Post"),
+        prepop_is_view=False, postpop_is_view=False,
+        synapse_dynamics=MockSynapseDynamics(1, 1), synapse_type=0,
+        receptor_type="excitatory", synapse_type_from_dynamics=False,
+        weights=1.0, delays=1.0)
+
+    block = connector.create_synaptic_block(
+        [post_slice], post_slice, 0, synapse_info)
+    expected = kernel_pairs_by_neuron(
+        shape_pre, shape_post, shape_kernel, weights, pre_step, pre_start,
+        post_step, post_start, post_slice)
+    assert len(expected) > 0
+    assert list(zip(block["source"].tolist(), block["target"].tolist(),
+                    block["weight"].tolist())) == expected
+    assert numpy.all(block["delay"] == 2.0)
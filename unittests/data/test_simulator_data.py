@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import pyNN.spiNNaker as sim
 
@@ -142,6 +143,17 @@ class TestSimulatorData(unittest.TestCase):
         with self.assertRaises(TypeError):
             writer.add_projection("bacon")  # type: ignore[arg-type]
 
+    def test_host_synapse_pool(self) -> None:
+        writer = SpynnakerDataWriter.setup()
+        self.assertIsNone(SpynnakerDataView.get_host_synapse_pool())
+        with ThreadPoolExecutor(2) as pool:
+            writer.set_host_synapse_pool(pool)
+            self.assertIs(pool, SpynnakerDataView.get_host_synapse_pool())
+        writer.set_host_synapse_pool(None)
+        self.assertIsNone(SpynnakerDataView.get_host_synapse_pool())
+        with self.assertRaises(TypeError):
+            writer.set_host_synapse_pool("bacon")  # type: ignore[arg-type]
+
     def test_sim_name(self) -> None:
         self.assertEqual(SpynnakerDataView.get_sim_name(), sim.name())
         self.assertIn("sPyNNaker", SpynnakerDataView.get_sim_name())
@@ -0,0 +1,50 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from time import perf_counter
+
+import pyNN.spiNNaker as sim
+
+from spynnaker.pyNN.models.neuron.synapse_io import _get_row_data
+
+from unittests.model_tests.neuron.test_synapse_io import (
+    get_row_data_by_row,
+    make_row_data_inputs,
+)
+
+# Not a unittest as it is only of interest when changing how rows are packed.
+# Usage: python manual_row_packing_benchmark.py [n_rows [n_connections]]
+n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+n_connections = int(sys.argv[2]) if len(sys.argv) > 2 else 10 * n_rows
+weight_scales = [32.0, 32.0]
+
+sim.setup()
+for plastic in (False, True):
+    dynamics, connections, max_n_synapses, max_n_words = \
+        make_row_data_inputs(plastic, n_rows, n_connections)
+    start = perf_counter()
+    expected = get_row_data_by_row(
+        connections, n_rows, 2, dynamics, max_n_synapses, max_n_words,
+        256, weight_scales)
+    by_row = perf_counter() - start
+    start = perf_counter()
+    row_data = _get_row_data(
+        connections, connections["source"], n_rows, 2, dynamics,
+        max_n_synapses, max_n_words, 256, weight_scales)
+    in_block = perf_counter() - start
+    assert row_data.tobytes() == expected.tobytes()
+    print(f"{type(dynamics).__name__}: {n_rows} rows, {n_connections} "
+          f"connections: by row {by_row:.3f}s, in block {in_block:.3f}s")
+sim.end()
@@ -0,0 +1,63 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.synapse_dynamics.\
+    synapse_dynamics_structural_common import _post_to_pre_table
+
+# Each field of a padding entry is 0xFFFF, cut down to fit the field
+_PAD = 0xFFFFFFFF
+
+
+def _entry(pop: int, subpop: int, source: int) -> int:
+    return pop | (subpop << 8) | (source << 16)
+
+
+class TestSynapseDynamicsStructuralCommon(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_post_to_pre_table(self) -> None:
+        conn_data = numpy.array([
+            [0, 1, 5], [1, 0, 7], [0, 0, 2], [1, 2, 300], [0, 1, 9]])
+        # The last connection targets an atom outside of the slice
+        targets = numpy.array([2, 0, 2, 1, 5], dtype="uint32")
+        table = _post_to_pre_table(conn_data, targets, 4, 3)
+        self.assertEqual(numpy.uint32, table.dtype)
+        self.assertSequenceEqual([
+            _PAD, _PAD, _entry(1, 0, 7),
+            _PAD, _PAD, _entry(1, 2, 300),
+            _PAD, _entry(0, 1, 5), _entry(0, 0, 2),
+            _PAD, _PAD, _PAD], table.tolist())
+
+    def test_post_to_pre_table_empty(self) -> None:
+        table = _post_to_pre_table(
+            numpy.zeros((0, 3), dtype="int64"),
+            numpy.zeros(0, dtype="uint32"), 2, 2)
+        self.assertSequenceEqual([_PAD] * 4, table.tolist())
+
+    def test_post_to_pre_table_too_many(self) -> None:
+        conn_data = numpy.array([[0, 0, 1], [0, 0, 2], [0, 0, 3]])
+        targets = numpy.array([1, 1, 1], dtype="uint32")
+        with self.assertRaises(ValueError):
+            _post_to_pre_table(conn_data, targets, 2, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,9 +13,10 @@
 # limitations under the License.
 
 import math
-from typing import Any
+from typing import Any, cast
 
 import numpy
+from numpy.typing import NDArray
 import pytest
 
 from spynnaker.pyNN.config_setup import unittest_setup
@@ -179,3 +180,71 @@ def test_connection_holder_matrix_multiple_items() -> None:
         [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30)],
         NUMPY_CONNECTORS_DTYPE)
     connection_holder.add_connections(connections)
+
+
+@pytest.mark.parametrize("multiple_synapses, expected", [
+    ("last", 0.5), ("first", 1), ("sum", 3.5), ("min", 0.5), ("max", 2)])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_connection_holder_multiple_synapses(
+        multiple_synapses: str, expected: float, sparse: bool) -> None:
+    unittest_setup()
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight"], as_list=False, n_pre_atoms=2,
+        n_post_atoms=2, sparse=sparse, multiple_synapses=multiple_synapses)
+    connections = numpy.array(
+        [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30), (1, 0, 5, 1),
+         (0, 0, 0.5, 5)], NUMPY_CONNECTORS_DTYPE)
+    connection_holder.add_connections(connections[:2])
+    connection_holder.add_connections(connections[2:])
+
+    if sparse:
+        matrix = connection_holder.tocsr()
+        assert matrix.nnz == 3
+        assert matrix[1, 1] == 0
+    else:
+        matrix = numpy.asarray(connection_holder)
+        assert math.isnan(matrix[1, 1])
+    assert matrix[0, 0] == expected
+    assert matrix[0, 1] == 3
+    assert matrix[1, 0] == 5
+
+
+def test_connection_holder_structured() -> None:
+    unittest_setup()
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["source", "target", "weight", "test"],
+        as_list=True, n_pre_atoms=2, n_post_atoms=2,
+        fixed_values=[("test", 100)], structured=True)
+    connections = numpy.array(
+        [(1, 0, 1, 10), (0, 1, 2, 20), (0, 0, 3, 30)],
+        NUMPY_CONNECTORS_DTYPE)
+    connection_holder.add_connections(connections)
+    data = numpy.asarray(connection_holder)
+    assert data.dtype.names == ("source", "target", "weight", "test")
+    assert list(data["source"]) == [0, 0, 1]
+    assert list(data["target"]) == [0, 1, 0]
+    assert list(data["weight"]) == [3, 2, 1]
+    assert list(data["test"]) == [100, 100, 100]
+    assert data.dtype["test"] == numpy.float64
+
+    # The array is held by the holder, so only a copy on request
+    assert connection_holder.__array__(copy=False) is data
+    assert not numpy.shares_memory(
+        connection_holder.__array__(copy=True), data)
+    with pytest.raises(ValueError):
+        connection_holder.__array__(dtype=numpy.float32, copy=False)
+    list_holder = ConnectionHolder(
+        data_items_to_return=["source", "target", "weight"], as_list=True,
+        n_pre_atoms=2, n_post_atoms=2)
+    list_holder.add_connections(connections)
+    with pytest.raises(ValueError):
+        list_holder.__array__(copy=False)
+
+    single_holder = ConnectionHolder(
+        data_items_to_return=["weight"], as_list=True, n_pre_atoms=2,
+        n_post_atoms=2, structured=True)
+    single_holder.add_connections(connections)
+    # Slicing is passed on to the column held by the holder
+    column = cast(NDArray, single_holder)[:]
+    assert isinstance(column, numpy.ndarray)
+    assert list(column) == [3, 2, 1]
@@ -0,0 +1,60 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
+    .formation import DistanceDependentFormation
+
+
+def _largest_squared_distance(formation: DistanceDependentFormation,
+                              grid: tuple[int, int]) -> float:
+    # Compare every pair of neurons as the grid is laid out in the C code
+    largest = 0.0
+    for row in range(grid[0] ** 2):
+        for column in range(grid[1] ** 2):
+            if grid[0] > 1:
+                pre = (row // grid[0], row % grid[1])
+                post = (column // grid[0], column % grid[1])
+            else:
+                pre = (0, row % grid[1])
+                post = (0, column % grid[1])
+            largest = max(largest, float(formation.distance(
+                pre, post, metric='euclidian') ** 2))
+    return largest
+
+
+def test_distance_probabilities() -> None:
+    unittest_setup()
+    for grid in [(1, 1), (1, 5), (3, 3), (4, 8), (5, 3), (16, 16)]:
+        formation = DistanceDependentFormation(grid, 0.5, 4.0)
+        probabilities = (0.5 * numpy.exp(
+            -numpy.arange(_largest_squared_distance(formation, grid) + 1) /
+            (2 * 4.0 ** 2)) * 0xFFFF).astype("uint16")
+        probabilities = probabilities[probabilities > 0]
+        lut = formation.generate_distance_probability_array(0.5, 4.0)
+        assert len(lut) == len(probabilities) + len(probabilities) % 2
+        assert numpy.array_equal(lut[:len(probabilities)], probabilities)
+
+
+def test_distance_probabilities_shared() -> None:
+    unittest_setup()
+    first = DistanceDependentFormation((8, 8), 0.25, 2.0)
+    second = DistanceDependentFormation((8, 8), 0.5, 3.0, 0.25, 2.0)
+    assert (first.generate_distance_probability_array(0.25, 2.0) is
+            second.generate_distance_probability_array(0.25, 2.0))
+    assert (first.generate_distance_probability_array(0.25, 2.0) is not
+            first.generate_distance_probability_array(0.25, 3.0))
@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
 
+import numpy
 import pyNN.spiNNaker as sim
 from testfixtures import LogCapture  # type: ignore[import]
 
+from pacman.model.graphs.common import Slice
+
 from spynnaker.pyNN.models.spike_source import (
     SpikeSourceArray,
     SpikeSourceArrayVertex,
+    SpikeSourceFromBinaryFile,
 )
+from spynnaker.pyNN.utilities.ragged_spike_times import RaggedSpikeTimes
 
 
 class TestSpikeSourceArrayVertex(unittest.TestCase):
@@ -110,3 +117,88 @@ class TestSpikeSourceArrayVertex(unittest.TestCase):
                     self.assertIn("109", msg)
                     found = True
             self.assertTrue(found)
+
+    def test_ragged(self) -> None:
+        spike_times = RaggedSpikeTimes(
+            [1, 2, 15] + [15] * 110 + [4], [0, 2, 113, 113, 114])
+        with LogCapture() as lc:
+            v = SpikeSourceArrayVertex(
+                n_neurons=4, spike_times=spike_times,
+                label="test", max_atoms_per_core=10, model=SpikeSourceArray(),
+                splitter=None, n_colour_bits=None)
+            found = False
+            for record in lc.records:
+                msg = str(record.msg)
+                if "too many spikes" in msg:
+                    self.assertIn("111", msg)
+                    found = True
+            self.assertTrue(found)
+        send_buffer_times = v.send_buffer_times
+        assert isinstance(send_buffer_times, RaggedSpikeTimes)
+        self.assertSequenceEqual([1, 2], list(send_buffer_times[0]))
+        self.assertSequenceEqual([], list(send_buffer_times[2]))
+        self.assertSequenceEqual([4], list(send_buffer_times[3]))
+
+    def test_ragged_send_buffer_times(self) -> None:
+        v = SpikeSourceArrayVertex(
+            n_neurons=4, spike_times=[[1, 2], [3], [], [4, 5, 6]],
+            label="test", max_atoms_per_core=10, model=SpikeSourceArray(),
+            splitter=None, n_colour_bits=None)
+        self.assertIs(type(v.send_buffer_times), RaggedSpikeTimes)
+        vertex_slice = Slice(1, 3)
+        machine_vertex = v.create_machine_vertex(
+            vertex_slice, v.get_sdram_used_by_atoms(vertex_slice))
+        send_buffer_times = machine_vertex.send_buffer_times
+        assert isinstance(send_buffer_times, RaggedSpikeTimes)
+        self.assertSequenceEqual([3], list(send_buffer_times[0]))
+        self.assertSequenceEqual([], list(send_buffer_times[1]))
+        self.assertSequenceEqual([4, 5, 6], list(send_buffer_times[2]))
+        vertex_slice = Slice(2, 2)
+        self.assertIsNone(v.create_machine_vertex(
+            vertex_slice, v.get_sdram_used_by_atoms(vertex_slice)
+            ).send_buffer_times)
+
+        v.set_parameter_values("spike_times", [[7], [8], [9], [10]])
+        self.assertIs(type(v.send_buffer_times), RaggedSpikeTimes)
+
+        # The ticks of each neuron are put in order
+        v.set_parameter_values("spike_times", [[9, 7], [8], [], [6, 4, 5]])
+        send_buffer_times = v.send_buffer_times
+        assert isinstance(send_buffer_times, RaggedSpikeTimes)
+        self.assertSequenceEqual([7, 9], list(send_buffer_times[0]))
+        self.assertSequenceEqual([4, 5, 6], list(send_buffer_times[3]))
+
+    def test_binary_file_send_buffer(self) -> None:
+        events = numpy.array(
+            [[0, 3], [0, 7], [2, 1], [3, 4], [3, 5], [5, 9]], dtype="<u4")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            spike_file = os.path.join(tmp_dir, "spikes.npy")
+            numpy.save(spike_file, events)
+            v = SpikeSourceFromBinaryFile(spike_file).create_vertex(
+                6, "test", n_colour_bits=0)
+            self.assertIs(type(v.send_buffer_times), RaggedSpikeTimes)
+            vertex_slice = Slice(2, 5)
+            machine_vertex = v.create_machine_vertex(
+                vertex_slice, v.get_sdram_used_by_atoms(vertex_slice))
+            mapped = v.send_buffer_times
+            assert isinstance(mapped, RaggedSpikeTimes)
+            self.assertIsInstance(mapped.times, numpy.memmap)
+            send_buffer_times = machine_vertex.send_buffer_times
+            assert isinstance(send_buffer_times, RaggedSpikeTimes)
+            # The machine vertex uses the mapped file rather than a copy
+            self.assertTrue(
+                numpy.shares_memory(send_buffer_times.times, mapped.times))
+            self.assertSequenceEqual([0, 1, 3, 3, 4],
+                                     list(send_buffer_times.offsets))
+
+            machine_vertex._fill_send_buffer()
+            send_buffer = machine_vertex._send_buffer
+            assert send_buffer is not None
+            sent = []
+            while send_buffer.is_next_timestamp:
+                timestamp = send_buffer.next_timestamp
+                sent.append((timestamp, send_buffer.next_key()))
+            # Keys are relative to the slice, so neuron 2 has key 0
+            self.assertEqual([(1, 0), (4, 1), (5, 1), (9, 3)], sent)
+            # Let go of the mapped file so that it can be deleted
+            del v, machine_vertex, send_buffer, mapped, send_buffer_times
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+import numpy
+
+from spinn_utilities.ranged import RangedList
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.models.spike_source. \
+    spike_source_poisson_machine_vertex import (
+        _expander_rates,
+        _read_rate_records,
+        _set_rates,
+        _u3232_to_uint64,
+    )
+
+
+def _rates_region(rates: list[list[int]]) -> numpy.ndarray:
+    words: list[int] = []
+    for atom_rates in rates:
+        words.extend([len(atom_rates), 0])
+        for rate in atom_rates:
+            words.extend([rate, 1, 2, 3, 4, 5])
+    # The region is sized for the worst case so there are spare words
+    words.extend([0] * 12)
+    return numpy.array(words, dtype=numpy.uint32)
+
+
+def test_read_rate_records() -> None:
+    unittest_setup()
+    rates = [[10], [20, 30], [], [40, 50, 60]]
+    words = _rates_region(rates)
+    for expected in ([1, 2, 0, 3], [1, 1, 1, 1]):
+        n_rates, rate_words = _read_rate_records(
+            words, numpy.array(expected))
+        assert list(n_rates) == [1, 2, 0, 3]
+        assert list(rate_words) == [10, 20, 30, 40, 50, 60]
+
+
+def test_set_rates() -> None:
+    unittest_setup()
+    rates: RangedList[numpy.ndarray] = RangedList(
+        8, numpy.array([1.0]), use_list_as_value=True)
+    ids = numpy.arange(1, 7)
+    n_rates = numpy.array([1, 1, 1, 2, 2, 1])
+    values = numpy.array([5.0, 5.0, 6.0, 7.0, 8.0, 7.0, 8.0, 6.0])
+    _set_rates(rates, ids, n_rates, values)
+    assert [list(rates[i]) for i in range(8)] == [
+        [1.0], [5.0], [5.0], [6.0], [7.0, 8.0], [7.0, 8.0], [6.0], [1.0]]
+    assert len(list(rates.iter_ranges())) == 6
+
+
+def _concatenated_expander_rates(
+        rate_changed: bool,
+        ranges: list[tuple[int, int, dict[str, Any]]]) -> numpy.ndarray:
+    # The expander region built by concatenating the words of each range
+    data_items: list[Any] = [[int(rate_changed)], [len(ranges)]]
+    for start, stop, item in ranges:
+        items = numpy.dstack(
+            (_u3232_to_uint64(item['rates']),
+             _u3232_to_uint64(item['starts']),
+             _u3232_to_uint64(item['durations'])))[0]
+        data_items.extend([[stop - start], [len(items)], [0],
+                           numpy.ravel(items).view(numpy.uint32)])
+    return numpy.concatenate(data_items).astype(numpy.uint32)
+
+
+def test_expander_rates() -> None:
+    unittest_setup()
+    ranges: list[tuple[int, int, dict[str, Any]]] = [
+        (0, 3, {"rates": numpy.array([10.0]), "starts": numpy.array([0.0]),
+                "durations": numpy.array([4294967295.0])}),
+        (3, 4, {"rates": numpy.array([1.5, 2.25, 0.0]),
+                "starts": numpy.array([0.0, 100.0, 250.5]),
+                "durations": numpy.array([100.0, 150.5, 1000.0])}),
+        (4, 7, {"rates": numpy.array([]), "starts": numpy.array([]),
+                "durations": numpy.array([])}),
+        (7, 9, {"rates": numpy.array([7.0, 0.125]),
+                "starts": numpy.array([5.0, 6.0]),
+                "durations": numpy.array([1.0, 2.0])})]
+    for rate_changed in (False, True):
+        assert numpy.array_equal(
+            _expander_rates(rate_changed, ranges),
+            _concatenated_expander_rates(rate_changed, ranges))
+    assert list(_expander_rates(True, [])) == [1, 0]
@@ -15,14 +15,20 @@
 from collections.abc import Callable
 from typing import Any
 
+import numpy
 import pyNN.spiNNaker as sim
 import pytest
+from numpy import uint32
+from numpy.typing import NDArray
 
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge,
     SynapseInformation,
 )
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector,
+)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
     TimingDependenceSpikePair,
 )
@@ -30,11 +36,23 @@ from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
     WeightDependenceAdditive,
 )
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractPlasticSynapseDynamics,
+    AbstractSDRAMSynapseDynamics,
+    AbstractStaticSynapseDynamics,
     AbstractSynapseDynamics,
     SynapseDynamicsStatic,
     SynapseDynamicsSTDP,
 )
-from spynnaker.pyNN.models.neuron.synapse_io import _get_allowed_row_length
+from spynnaker.pyNN.models.neuron.synapse_dynamics.types import (
+    ConnectionsArray,
+)
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    _N_HEADER_WORDS,
+    _get_allowed_row_length,
+    _get_row_data,
+    _read_plastic_data,
+    _read_static_data,
+)
 
 from unittests.mocks import (
     MockApvVertex,
@@ -92,3 +110,131 @@ def test_get_allowed_row_length(
     else:
         actual_size = _get_allowed_row_length(size, dynamics, in_edge, size)
         assert actual_size == max_size
+
+
+def get_row_data_by_row(
+        connections: ConnectionsArray, n_rows: int, n_synapse_types: int,
+        dynamics: AbstractSDRAMSynapseDynamics, max_row_n_synapses: int,
+        max_row_n_words: int, max_atoms_per_core: int,
+        weight_scales: list[float]) -> numpy.ndarray:
+    """
+    The original row-by-row joining of synaptic rows, kept as a reference
+    for the output of :py:func:`_get_row_data`.
+    """
+    row_indices = connections["source"]
+    # Each of these is either an array with a row per row or a list of rows
+    ff_rows: NDArray[uint32] | list[NDArray[uint32]]
+    fp_data: NDArray[uint32] | list[NDArray[uint32]]
+    pp_data: NDArray[uint32] | list[NDArray[uint32]]
+    if isinstance(dynamics, AbstractStaticSynapseDynamics):
+        ff_rows, ff_size = dynamics.get_static_synaptic_data(
+            connections, row_indices, n_rows, n_synapse_types,
+            max_row_n_synapses, max_atoms_per_core, weight_scales)
+        fp_data = numpy.zeros((n_rows, 0), dtype=uint32)
+        pp_data = numpy.zeros((n_rows, 0), dtype=uint32)
+        fp_size = numpy.zeros((n_rows, 1), dtype=uint32)
+        pp_size = numpy.zeros((n_rows, 1), dtype=uint32)
+    else:
+        assert isinstance(dynamics, AbstractPlasticSynapseDynamics)
+        ff_rows = [numpy.zeros(0, dtype=uint32) for _ in range(n_rows)]
+        ff_size = numpy.zeros((n_rows, 1), dtype=uint32)
+        fp_data, pp_data, fp_size, pp_size = \
+            dynamics.get_plastic_synaptic_data(
+                connections, row_indices, n_rows, n_synapse_types,
+                max_row_n_synapses, max_atoms_per_core, weight_scales)
+    row_lengths = [
+        pp_data[i].size + fp_data[i].size + ff_rows[i].size
+        for i in range(n_rows)]
+    padding = [
+        numpy.zeros(max_row_n_words - row_length, dtype=uint32)
+        for row_length in row_lengths]
+    rows = [numpy.concatenate(items) for items in zip(
+        pp_size, pp_data, ff_size, fp_size, ff_rows, fp_data, padding)]
+    return numpy.concatenate(rows)
+
+
+def make_row_data_inputs(
+        plastic: bool, n_rows: int, n_connections: int,
+        seed: int = 42) -> tuple[
+            AbstractSDRAMSynapseDynamics, ConnectionsArray, int, int]:
+    """
+    Make some random connections to turn into rows.
+
+    :return: The dynamics, the connections, the maximum number of synapses
+        in a row and the maximum number of words in a row
+    """
+    dynamics: AbstractSDRAMSynapseDynamics
+    if plastic:
+        dynamics = SynapseDynamicsSTDP(
+            TimingDependenceSpikePair(), WeightDependenceAdditive())
+    else:
+        dynamics = SynapseDynamicsStatic()
+    rng = numpy.random.default_rng(seed)
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.integers(0, n_rows, n_connections)
+    connections["target"] = rng.integers(0, 256, n_connections)
+    connections["weight"] = rng.uniform(0.0, 2.0, n_connections)
+    connections["delay"] = rng.integers(1, 16, n_connections)
+    connections["synapse_type"] = rng.integers(0, 2, n_connections)
+    # Rows are sized for at least one synapse, as a plastic row can't be
+    # made for no synapses
+    max_n_synapses = max(1, int(numpy.bincount(
+        connections["source"], minlength=n_rows).max()))
+    if isinstance(dynamics, AbstractStaticSynapseDynamics):
+        max_n_words = dynamics.get_n_words_for_static_connections(
+            max_n_synapses)
+    else:
+        assert isinstance(dynamics, AbstractPlasticSynapseDynamics)
+        max_n_words = dynamics.get_n_words_for_plastic_connections(
+            max_n_synapses)
+    return dynamics, connections, max_n_synapses, max_n_words
+
+
+@pytest.mark.parametrize("plastic", [False, True])
+@pytest.mark.parametrize("n_rows,n_connections", [
+    (1, 0), (1, 10), (50, 400), (300, 100)])
+def test_get_row_data(
+        plastic: bool, n_rows: int, n_connections: int) -> None:
+    sim.setup()
+    dynamics, connections, max_n_synapses, max_n_words = \
+        make_row_data_inputs(plastic, n_rows, n_connections)
+    weight_scales = [32.0, 32.0]
+    expected = get_row_data_by_row(
+        connections, n_rows, 2, dynamics, max_n_synapses, max_n_words,
+        256, weight_scales)
+    row_data = _get_row_data(
+        connections, connections["source"], n_rows, 2, dynamics,
+        max_n_synapses, max_n_words, 256, weight_scales)
+    assert row_data.dtype == uint32
+    assert row_data.tobytes() == expected.tobytes()
+
+
+@pytest.mark.parametrize("plastic", [False, True])
+@pytest.mark.parametrize("n_rows,n_connections", [
+    (1, 0), (1, 10), (50, 400), (300, 100)])
+def test_read_row_data(
+        plastic: bool, n_rows: int, n_connections: int) -> None:
+    sim.setup()
+    dynamics, connections, max_n_synapses, max_n_words = \
+        make_row_data_inputs(plastic, n_rows, n_connections)
+    weight_scales = [32.0, 32.0]
+    row_data = _get_row_data(
+        connections, connections["source"], n_rows, 2, dynamics,
+        max_n_synapses, max_n_words, 256, weight_scales).reshape(
+            n_rows, max_n_words + _N_HEADER_WORDS)
+    if isinstance(dynamics, AbstractStaticSynapseDynamics):
+        read = _read_static_data(
+            dynamics, n_rows, 2, row_data, False, 16, 256, weight_scales)
+    else:
+        assert isinstance(dynamics, AbstractPlasticSynapseDynamics)
+        read = _read_plastic_data(
+            dynamics, n_rows, 2, row_data, False, 16, 256, weight_scales)
+
+    # Rows come back in source order, with each row in the original order
+    expected = connections[numpy.argsort(
+        connections["source"], kind="stable")]
+    assert numpy.array_equal(read["source"], expected["source"])
+    assert numpy.array_equal(read["target"], expected["target"])
+    assert numpy.allclose(read["weight"], expected["weight"], atol=1 / 32)
+    assert numpy.array_equal(read["delay"], expected["delay"])
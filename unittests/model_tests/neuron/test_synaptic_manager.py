@@ -15,6 +15,7 @@ import shutil
 import struct
 import unittest
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import mkdtemp
 from typing import Any, BinaryIO
 
@@ -128,8 +129,22 @@ def say_false(*args: Any, **kwargs: Any) -> bool:
 
 @parameterized.expand(MANY_BOARD_TYPES)
 def test_write_data_spec(_: str, ver_num: str) -> None:
+    check_write_data_spec(ver_num, 1)
+
+
+def test_write_data_spec_threads() -> None:
+    check_write_data_spec(str(Spin1Gen.FIVE.value), 4)
+
+
+def test_write_data_spec_shared_threads() -> None:
+    check_write_data_spec(str(Spin1Gen.FIVE.value), 4, shared_pool=True)
+
+
+def check_write_data_spec(
+        ver_num: str, n_threads: int, shared_pool: bool = False) -> None:
     unittest_setup()
     set_config("Machine", "version", ver_num)
+    set_config("Simulation", "n_host_synapse_threads", str(n_threads))
     writer = SpynnakerDataWriter.mock()
     # UGLY but the mock transceiver NEED generate_on_machine to be False
     AbstractGenerateConnectorOnMachine.\
@@ -185,10 +200,13 @@ def test_write_data_spec(_: str, ver_num: str) -> None:
         weight_scales=[32, 32], all_syn_block_sz=10000)
     synaptic_matrices.generate_data()
 
-    with DsSqlliteDatabase() as ds_db:
+    with DsSqlliteDatabase() as ds_db, ThreadPoolExecutor(n_threads) as pool:
+        if shared_pool:
+            writer.set_host_synapse_pool(pool)
         spec = DataSpecificationGenerator(0, 0, 3, post_vertex, ds_db)
         synaptic_matrices.write_synaptic_data(
             spec, post_vertex_slice, SynapseRegionReferences())
+        writer.set_host_synapse_pool(None)
 
     writer.set_transceiver(_MockTransceiverinOut())
     load_application_data_specs()
@@ -245,6 +263,32 @@ def test_write_data_spec(_: str, ver_num: str) -> None:
         shutil.rmtree(report_folder, ignore_errors=True)
 
 
+def test_ring_buffer_shifts_cached() -> None:
+    unittest_setup()
+    SpynnakerDataWriter.mock()
+    pre_pop = p.Population(10, p.IF_curr_exp(), label="Pre")
+    post_pop = p.Population(10, p.IF_curr_exp(), label="Post")
+    p.Projection(pre_pop, post_pop, p.AllToAllConnector(),
+                 p.StaticSynapse(weight=1.5, delay=1.0))
+    post_vertex = post_pop._vertex
+    shifts = post_vertex.get_ring_buffer_shifts()
+    max_weights = post_vertex.get_max_weights()
+
+    # Repeated calls use the stored weights
+    max_weights[0] = 1000.0
+    assert post_vertex.get_ring_buffer_shifts() == shifts
+
+    # Adding a projection with bigger weights must change the shifts
+    p.Projection(pre_pop, post_pop, p.AllToAllConnector(),
+                 p.StaticSynapse(weight=100.0, delay=1.0))
+    assert post_vertex.get_ring_buffer_shifts()[0] > shifts[0]
+
+    # As must a change in how many spikes are expected
+    shifts = post_vertex.get_ring_buffer_shifts()
+    post_vertex.spikes_per_second = 10000.0
+    assert post_vertex.get_ring_buffer_shifts()[0] > shifts[0]
+
+
 def test_set_synapse_dynamics() -> None:
     raise unittest.SkipTest("needs fixing")
     unittest_setup()
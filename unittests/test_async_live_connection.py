@@ -0,0 +1,262 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import socket
+import struct
+import time
+from collections.abc import Awaitable, Callable
+from threading import Thread
+from typing import Any
+
+import numpy
+import pytest
+
+from spinnman.connections.udp_packet_connections import EIEIOConnection
+from spinnman.constants import SCP_SCAMP_PORT
+from spinnman.messages.eieio import read_eieio_data_message
+from spinnman.messages.eieio.data_messages import (
+    EIEIODataMessage,
+    KeyDataElement,
+    KeyPayloadDataElement,
+)
+
+from spinn_front_end_common.utilities.connections import LiveEventConnection
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections import (
+    AsyncLiveConnection,
+    SpikeBatch,
+    SpynnakerLiveSpikesConnection,
+    SpynnakerPoissonControlConnection,
+)
+from spynnaker.pyNN.connections.batched_live_event_connection import (
+    _MAX_SEND_BEFORE_PAUSE,
+    _PAUSE_SECONDS,
+)
+
+# The bytes before the EIEIO message in a packet sent to a board: two bytes
+# of padding then the SDP header
+_SDP_PREFIX_BYTES = 10
+
+
+class _UDPBoard:
+    """
+    A stand-in for a live connection which receives UDP packets, each
+    holding a time step followed by atom IDs, and calls callbacks from its
+    own threads as the real connections do.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.receive_callbacks: list[Callable[[str, int, list[int]], None]]
+        self.receive_callbacks = []
+        self.start_callbacks: list[Callable[[str, Any], None]] = []
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.thread = Thread(target=self.__run, daemon=True)
+        self.thread.start()
+
+    def add_receive_callback(
+            self, label: str,
+            callback: Callable[[str, int, list[int]], None],
+            translate_key: bool = True) -> None:
+        assert label == self.label
+        assert translate_key
+        self.receive_callbacks.append(callback)
+
+    def add_start_resume_callback(
+            self, label: str, callback: Callable[[str, Any], None]) -> None:
+        self.start_callbacks.append(callback)
+
+    def add_pause_stop_callback(
+            self, label: str, callback: Callable[[str, Any], None]) -> None:
+        pass
+
+    def start(self) -> None:
+        for callback in self.start_callbacks:
+            Thread(target=callback, args=(self.label, self)).start()
+
+    def close(self) -> None:
+        self.socket.close()
+
+    def __run(self) -> None:
+        while True:
+            try:
+                data = self.socket.recv(1024)
+            except OSError:
+                return
+            time, *ids = struct.unpack(f"<{len(data) // 4}I", data)
+            for callback in self.receive_callbacks:
+                callback(self.label, time, ids)
+
+
+async def _receive_from_board() -> list[SpikeBatch]:
+    board = _UDPBoard("pop")
+    connection = AsyncLiveConnection(board)  # type: ignore[arg-type]
+    started = asyncio.Event()
+
+    async def on_start(label: str, conn: AsyncLiveConnection) -> None:
+        assert label == "pop"
+        assert conn is connection
+        started.set()
+
+    connection.add_start_resume_hook("pop", on_start)
+    batches = connection.receive("pop")
+    board.start()
+    await asyncio.wait_for(started.wait(), 5)
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.sendto(struct.pack("<3I", 1, 3, 5), board.socket.getsockname())
+    sender.sendto(struct.pack("<2I", 2, 7), board.socket.getsockname())
+    sender.close()
+    received = [await asyncio.wait_for(anext(batches), 5) for _ in range(2)]
+
+    connection.close()
+    received.extend([batch async for batch in batches])
+    return received
+
+
+def test_receive_batches() -> None:
+    unittest_setup()
+    received = asyncio.run(_receive_from_board())
+    assert [(batch.label, batch.time, batch.ids.tolist())
+            for batch in received] == [("pop", 1, [3, 5]), ("pop", 2, [7])]
+
+
+def _listen_as_board() -> socket.socket:
+    """
+    Listen where live connections send to a board at 127.0.0.1.
+    """
+    board = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        board.bind(("127.0.0.1", SCP_SCAMP_PORT))
+    except OSError:
+        board.close()
+        pytest.skip(f"UDP port {SCP_SCAMP_PORT} is in use")
+    board.settimeout(5)
+    return board
+
+
+def _send_to_local_board(
+        connection: LiveEventConnection, label: str,
+        atom_id_to_key: dict[int, int]) -> None:
+    """
+    Set up a connection to send to a board at 127.0.0.1, as reading the
+    database of a run would for a real board.
+    """
+    connection._atom_id_to_key[label] = atom_id_to_key
+    getattr(connection, "_LiveEventConnection__send_address_details")[
+        label] = (0, 0, 1, "127.0.0.1")
+    setattr(connection, "_LiveEventConnection__sender_connection",
+            EIEIOConnection())
+
+
+def _receive_messages(
+        board: socket.socket, n_messages: int) -> list[EIEIODataMessage]:
+    return [read_eieio_data_message(board.recv(1024), _SDP_PREFIX_BYTES)
+            for _ in range(n_messages)]
+
+
+async def _time_send(send: Callable[[], Awaitable[None]]) -> tuple[
+        float, int]:
+    """
+    Time a send, counting how often another task gets to run meanwhile.
+    """
+    n_ticks = 0
+    sending = True
+
+    async def tick() -> None:
+        nonlocal n_ticks
+        while sending:
+            n_ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    start = time.monotonic()
+    await send()
+    elapsed = time.monotonic() - start
+    sending = False
+    await ticker
+    return elapsed, n_ticks
+
+
+def test_send_spikes_async() -> None:
+    unittest_setup()
+    board = _listen_as_board()
+    connection = SpynnakerLiveSpikesConnection(
+        send_labels=["pop"], local_port=None)
+    try:
+        _send_to_local_board(connection, "pop", {})
+        neuron_ids = numpy.arange(1000) % 300
+
+        async def send() -> None:
+            wrapper = AsyncLiveConnection(connection)
+            assert wrapper.connection is connection
+            await connection.send_spikes_async("pop", neuron_ids)
+
+        elapsed, n_ticks = asyncio.run(_time_send(send))
+        messages = _receive_messages(board, 8)
+    finally:
+        connection.close()
+        board.close()
+
+    # 127 16-bit keys fit in a packet, and the send pauses once after the
+    # first few packets, letting other tasks run while it does
+    assert _MAX_SEND_BEFORE_PAUSE < 8 <= 2 * _MAX_SEND_BEFORE_PAUSE
+    assert [m.eieio_header.count for m in messages] == [127] * 7 + [111]
+    keys = []
+    for message in messages:
+        while message.is_next_element:
+            element = message.next_element
+            assert isinstance(element, KeyDataElement)
+            keys.append(element.key)
+    assert keys == neuron_ids.tolist()
+    assert elapsed >= _PAUSE_SECONDS
+    assert n_ticks > 1
+
+
+def test_set_rates_async() -> None:
+    unittest_setup()
+    board = _listen_as_board()
+    connection = SpynnakerPoissonControlConnection(
+        poisson_labels=["pop"], local_port=None)
+    try:
+        _send_to_local_board(
+            connection, "pop_control", {i: 0x1000 + i for i in range(200)})
+        neuron_ids = numpy.arange(200)
+        rates = neuron_ids / 4.0
+
+        elapsed, n_ticks = asyncio.run(_time_send(
+            lambda: connection.set_rates_async("pop", neuron_ids, rates)))
+        messages = _receive_messages(board, 7)
+    finally:
+        connection.close()
+        board.close()
+
+    # 31 keys with payloads fit in a packet, and the send pauses once
+    assert [m.eieio_header.count for m in messages] == [31] * 6 + [14]
+    keys = []
+    payloads = []
+    for message in messages:
+        while message.is_next_element:
+            element = message.next_element
+            assert isinstance(element, KeyPayloadDataElement)
+            keys.append(element.key)
+            payloads.append(element.payload)
+    assert keys == (neuron_ids + 0x1000).tolist()
+    # The rates are sent as unsigned 16.16 fixed point
+    assert payloads == (rates * 65536).astype(int).tolist()
+    assert elapsed >= _PAUSE_SECONDS
+    assert n_ticks > 1
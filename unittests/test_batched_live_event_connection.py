@@ -0,0 +1,77 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections.batched_live_event_connection import (
+    BatchedLiveEventConnection,
+    pack_events,
+)
+
+
+@pytest.mark.parametrize("eieio_type, n_per_packet", [
+    (EIEIOType.KEY_16_BIT, 127), (EIEIOType.KEY_32_BIT, 63)])
+def test_pack_keys(eieio_type: EIEIOType, n_per_packet: int) -> None:
+    unittest_setup()
+    keys = numpy.arange(300)
+    messages = pack_events(eieio_type, keys)
+    counts = [m.eieio_header.count for m in messages]
+    assert counts[:-1] == [n_per_packet] * (len(messages) - 1)
+    assert sum(counts) == 300
+    for i, message in enumerate(messages):
+        expected = EIEIODataMessage.create(eieio_type)
+        for key in keys[i * n_per_packet:(i + 1) * n_per_packet]:
+            expected.add_key(int(key))
+        assert message.bytestring == expected.bytestring
+
+
+def test_pack_keys_and_payloads() -> None:
+    unittest_setup()
+    keys = numpy.arange(40) + 0x10000
+    payloads = numpy.arange(40) * 7
+    messages = pack_events(EIEIOType.KEY_PAYLOAD_32_BIT, keys, payloads)
+    assert [m.eieio_header.count for m in messages] == [31, 9]
+    expected = EIEIODataMessage.create(EIEIOType.KEY_PAYLOAD_32_BIT)
+    for key, payload in zip(keys[31:], payloads[31:]):
+        expected.add_key_and_payload(int(key), int(payload))
+    assert messages[1].bytestring == expected.bytestring
+
+
+def test_pack_out_of_range() -> None:
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        pack_events(EIEIOType.KEY_16_BIT, numpy.array([1, 0x10000]))
+    assert pack_events(EIEIOType.KEY_32_BIT, numpy.array([], dtype=int)) == []
+
+
+def test_atom_ids_to_keys() -> None:
+    unittest_setup()
+    connection = BatchedLiveEventConnection(
+        None, send_labels=["pop"], local_port=None)
+    try:
+        connection._atom_id_to_key["pop"] = {0: 10, 2: 12, 3: 13}
+        assert list(connection._atom_ids_to_keys(
+            "pop", [3, 0, 2, 0])) == [13, 10, 12, 10]
+        for bad_ids in ([0, 1], [4], [-1], [2, -4]):
+            with pytest.raises(KeyError):
+                connection._atom_ids_to_keys("pop", bad_ids)
+    finally:
+        connection.close()
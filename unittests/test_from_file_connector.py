@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import tempfile
 
 import numpy
@@ -108,3 +109,38 @@ def test_connector(
         [post_slice], post_slice, 1, synapse_info)
     assert numpy.array_equal(block["weight"], numpy.array(expected_weights))
     assert numpy.array_equal(block["delay"], numpy.array(expected_delays))
+
+
+def test_binary_connector() -> None:
+    sim.setup()
+    clist = numpy.array([(0, 0, 0.5, 1), (1, 2, 1.5, 2), (2, 1, 2.5, 3)])
+    binary = numpy.empty(len(clist), dtype=[
+        (name, "<f8") for name in ["i", "j", "weight", "delay"]])
+    for i, name in enumerate(binary.dtype.names or ()):
+        binary[name] = clist[:, i]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        name = os.path.join(tmp_dir, "connections.npy")
+        numpy.save(name, binary)
+
+        connector = FromFileConnector(name)
+        assert isinstance(connector.conn_list, numpy.memmap)
+        assert numpy.array_equal(connector.conn_list, clist)
+        assert connector.column_names == ["weight", "delay"]
+
+        pre_slice = Slice(0, 9)
+        pre_pop = MockPopulation(10, "Pre", MockAppVertex(10, [pre_slice]))
+        post_slice = Slice(0, 9)
+        synapse_info = SynapseInformation(
+            connector=connector, pre_population=pre_pop,
+            post_population=MockPopulation(10, "Post"),
+            prepop_is_view=False, postpop_is_view=False,
+            synapse_dynamics=MockSynapseDynamics(1, 1),
+            synapse_type=0, receptor_type="",
+            synapse_type_from_dynamics=False, weights=5, delays=1)
+        block = connector.create_synaptic_block(
+            [post_slice], post_slice, 1, synapse_info)
+        # Let go of the memory-mapped file before it is removed
+        del connector, synapse_info
+    block.sort(order="source")
+    assert numpy.array_equal(block["weight"], [0.5, 1.5, 2.5])
+    assert numpy.array_equal(block["delay"], [1, 2, 3])
@@ -16,7 +16,9 @@ import csv
 import os
 
 import numpy
+from neo import Block, Segment
 from numpy.typing import NDArray
+from quantities import Hz
 
 from spinnaker_testbase import BaseTestCase
 
@@ -172,6 +174,29 @@ class TestCSV(BaseTestCase):
         v = neo.segments[0].filter(name='v')[0].magnitude
         self.assertEqual(0, len(v))
 
+    def test_insert_spike_data(self) -> None:
+        block = Block(name="pop_1", first_id=10)
+        segment = Segment()
+        block.segments.append(segment)
+        segment.block = block
+        spikes = numpy.array(
+            [[3, 1.0], [1, 2.0], [3, 0.5], [1, 4.0], [7, 3.0], [3, 6.0]])
+        # pylint: disable=protected-access
+        NeoCsv()._insert_spike_data(
+            [4, 3, 1], segment, spikes, 0.0, 10.0, 1000 * Hz)
+        self.assertEqual(
+            [4, 3, 1], [st.annotations["source_index"]
+                        for st in segment.spiketrains])
+        self.assertEqual(
+            [14, 13, 11], [st.annotations["source_id"]
+                           for st in segment.spiketrains])
+        self.assertEqual([], list(segment.spiketrains[0].magnitude))
+        self.assertEqual(
+            [1.0, 0.5, 6.0], list(segment.spiketrains[1].magnitude))
+        self.assertEqual([2.0, 4.0], list(segment.spiketrains[2].magnitude))
+        for spiketrain in segment.spiketrains:
+            self.assertIs(segment, spiketrain.segment)
+
     def test_rewiring(self) -> None:
         my_dir = os.path.dirname(os.path.abspath(__file__))
         my_buffer = os.path.join(my_dir, "rewiring_data.sqlite3")
@@ -15,10 +15,13 @@
 import csv
 import os
 import pickle
+import shutil
+import tempfile
 
 import numpy
 import pytest
 from numpy.typing import NDArray
+from quantities import ms
 
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
@@ -189,6 +192,74 @@ class TestDataPopulation(BaseTestCase):
         assert 2.2222222222222223 == pop.mean_spike_count()
         assert 2.6666666666666665 == view.mean_spike_count()
 
+    def test_iter_spikes(self) -> None:
+        my_dir = os.path.dirname(os.path.abspath(__file__))
+        my_buffer = os.path.join(my_dir, "all_data.sqlite3")
+        with NeoBufferDatabase(my_buffer) as db:
+            spikes = db.spinnaker_get_data("pop_1", "spikes")
+            blocks = list(db.iter_spikes("pop_1"))
+            view_blocks = list(db.iter_spikes("pop_1", [1, 2, 3]))
+
+        streamed = numpy.column_stack((
+            numpy.concatenate([ids for ids, _ in blocks]),
+            numpy.concatenate([times for _, times in blocks])))
+        streamed = streamed[numpy.lexsort(streamed.T[::-1])]
+        assert numpy.array_equal(spikes, streamed)
+
+        view_ids = numpy.concatenate([ids for ids, _ in view_blocks])
+        assert sorted(view_ids) == sorted(
+            spikes[numpy.isin(spikes[:, 0], [1, 2, 3]), 0])
+
+    def test_lazy_block(self) -> None:
+        my_dir = os.path.dirname(os.path.abspath(__file__))
+        my_buffer = os.path.join(my_dir, "all_data.sqlite3")
+        with NeoBufferDatabase(my_buffer) as db:
+            block = db.get_full_block(
+                "pop_1", ["spikes", "v"], None, None, lazy=True)
+
+        segment = block.segments[0]
+        assert N_NEURONS == len(segment.spiketrains)
+        spikes = numpy.array([
+            [train.annotations["source_index"], time]
+            for train in segment.spiketrains
+            for time in train.load().magnitude])
+        assert numpy.array_equal(spikes, self.spikes_expected)
+
+        lazy_v = segment.filter(name='v')[0]
+        self.assertEqual((35, N_NEURONS), lazy_v.shape)
+        v = lazy_v.load()
+        assert numpy.array_equal(v.magnitude, self.v_expected)
+
+        part = lazy_v.load(time_slice=(v.times[5], v.times[10]),
+                           channel_indexes=[1, 3])
+        assert numpy.array_equal(part.magnitude, self.v_expected[5:10, [1, 3]])
+        assert part.t_start == v.times[5]
+        assert list(part.annotations["channel_names"]) == [1, 3]
+
+        train = segment.spiketrains[1].time_slice(v.times[5], v.times[20])
+        target = [t for [n, t] in self.spikes_expected
+                  if n == 1 and v.times[5] <= t * ms <= v.times[20]]
+        assert list(train.magnitude) == target
+
+    def test_lazy_spikes_read_once(self) -> None:
+        my_dir = os.path.dirname(os.path.abspath(__file__))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            my_buffer = os.path.join(tmp_dir, "all_data.sqlite3")
+            shutil.copy(os.path.join(my_dir, "all_data.sqlite3"), my_buffer)
+            with NeoBufferDatabase(my_buffer) as db:
+                block = db.get_full_block(
+                    "pop_1", ["spikes"], None, None, lazy=True)
+            segment = block.segments[0]
+            segment.spiketrains[0].load()
+            # The rest of the trains must not need the database
+            os.remove(my_buffer)
+
+        spikes = numpy.array([
+            [train.annotations["source_index"], time]
+            for train in segment.spiketrains
+            for time in train.load().magnitude])
+        assert numpy.array_equal(spikes, self.spikes_expected)
+
     def test_write(self) -> None:
         my_dir = os.path.dirname(os.path.abspath(__file__))
         my_buffer = os.path.join(my_dir, "all_data.sqlite3")
@@ -243,6 +314,25 @@ class TestDataPopulation(BaseTestCase):
             # Only one type of data at a time is supported
             pop.spinnaker_get_data(["v", "spikes"])  # type: ignore[arg-type]
 
+    def test_matrix_region_files(self) -> None:
+        my_dir = os.path.dirname(os.path.abspath(__file__))
+        my_buffer = os.path.join(my_dir, "all_data.sqlite3")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            region_buffer = os.path.join(tmp_dir, "region_files.sqlite3")
+            shutil.copyfile(my_buffer, region_buffer)
+            with NeoBufferDatabase(region_buffer, False) as db:
+                db.write_matrix_region_files()
+            assert os.path.isdir(
+                os.path.join(tmp_dir, "region_files_regions"))
+            with NeoBufferDatabase(region_buffer) as db:
+                pop = db.get_population("pop_1")
+
+            v = pop.spinnaker_get_data("v", as_matrix=True)
+            assert numpy.array_equal(v, self.v_expected)
+            view = pop[4, 2]
+            v = view.spinnaker_get_data("v", as_matrix=True)
+            assert numpy.array_equal(v, self.v_expected[:, [4, 2]])
+
     def test_spinnaker_get_data_view(self) -> None:
         my_dir = os.path.dirname(os.path.abspath(__file__))
         my_buffer = os.path.join(my_dir, "view_data.sqlite3")
@@ -314,6 +404,13 @@ class TestDataPopulation(BaseTestCase):
 
         assert numpy.array_equal(packets,  packets_expected)
 
+    def test_array_to_ranges(self) -> None:
+        for ids in [[], [3], [0, 1, 2, 3], [1, 3, 4, 5, 9, 2, 1, 0]]:
+            data = NeoBufferDatabase.array_to_ranges(ids)
+            assert list(NeoBufferDatabase.ranges_to_array(data)) == ids
+        data = NeoBufferDatabase.array_to_ranges(range(1000))
+        assert len(data) == 8
+
     def test_bad_view(self) -> None:
         my_dir = os.path.dirname(os.path.abspath(__file__))
         my_buffer = os.path.join(my_dir, "all_data.sqlite3")
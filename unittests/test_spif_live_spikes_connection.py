@@ -0,0 +1,45 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.connections.spif_live_spikes_connection import _KeyLookup
+
+
+@pytest.mark.parametrize("key_step", [1, 1000])
+def test_key_lookup(key_step: int) -> None:
+    unittest_setup()
+    # Two labels, with keys interleaved and not in order
+    keys = numpy.array([7, 3, 5, 4, 6], dtype=numpy.uint32) * key_step
+    atom_ids = numpy.array([0, 1, 2, 0, 1], dtype=numpy.uint32)
+    label_ids = numpy.array([0, 0, 0, 1, 1], dtype=numpy.uint32)
+    lookup = _KeyLookup(keys, atom_ids, label_ids)
+
+    received = numpy.array(
+        [5, 2, 7, 6, 9, 3, 0], dtype=numpy.uint32) * key_step
+    found, found_atoms, found_labels = lookup.lookup(received)
+    assert list(found) == [True, False, True, True, False, True, False]
+    assert list(found_atoms) == [2, 0, 1, 1]
+    assert list(found_labels) == [0, 0, 1, 0]
+
+
+def test_key_lookup_empty() -> None:
+    unittest_setup()
+    empty = numpy.zeros(0, dtype=numpy.uint32)
+    lookup = _KeyLookup(empty, empty, empty)
+    found, found_atoms, _ = lookup.lookup(numpy.array([1, 2], numpy.uint32))
+    assert not found.any()
+    assert len(found_atoms) == 0
@@ -174,3 +174,32 @@ class TestFromFileConnector(BaseTestCase):
         self.check_other_connect(
             aslist, ver_num, header=None, w_index=2, d_index=3,
             sources=sources, destinations=destinations)
+
+    @parameterized.expand(MANY_BOARD_TYPES)
+    def test_save_npy(self, _: str, ver_num: str) -> None:
+        as_list = [
+            (0, 0, 0.5, 10),
+            (3, 0, 0.25, 11),
+            (2, 3, 1.5, 12),
+            (5, 1, 2.0, 13),
+        ]
+        sim.setup(1.0)
+        set_config("Machine", "version", ver_num)
+        pop1 = sim.Population(6, sim.IF_curr_exp(), label="pop1")
+        pop2 = sim.Population(8, sim.IF_curr_exp(), label="pop2")
+        projection = sim.Projection(
+            pop1, pop2, sim.FromListConnector(
+                as_list, column_names=["weight", "delay"]))
+        sim.run(0)
+        saved = list(projection.get(["weight", "delay"], "list"))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            name = os.path.join(tmp_dir, "connections.npy")
+            projection.save(["weight", "delay"], name, format="npy")
+            connector = sim.FromFileConnector(name)
+            self.assertEqual(["weight", "delay"], connector.column_names)
+            loaded = numpy.array(connector.conn_list)
+            del connector
+        sim.end()
+        self.assertEqual(
+            sorted(tuple(row) for row in saved),
+            sorted(tuple(row) for row in loaded.tolist()))
@@ -0,0 +1,68 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from time import perf_counter
+
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+
+from spinn_utilities.ranged import RangeDictionary
+
+from pacman.model.graphs.common import Slice
+
+from spinn_front_end_common.interface.ds import DataType
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.struct import Struct
+from spynnaker.pyNN.utilities.utility_calls import convert_to
+
+# Not a unittest as it is only of interest when changing how parameters are
+# converted.
+# Usage: python manual_struct_benchmark.py [n_neurons]
+n_neurons = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+unittest_setup()
+struct = Struct([(DataType.S1615, "v"), (DataType.S1615, "tau_m"),
+                 (DataType.UINT32, "refract")])
+ranges: RangeDictionary = RangeDictionary(n_neurons, {
+    "v": RandomDistribution(
+        "uniform", (-70.0, -50.0), rng=NumpyRNG(seed=42)),
+    "tau_m": RandomDistribution(
+        "normal_clipped", mu=20.0, sigma=5.0, low=1.0, high=100.0,
+        rng=NumpyRNG(seed=43)),
+    "refract": 20})
+values = {key: ranges[key] for key in ("v", "tau_m", "refract")}
+vertex_slice = Slice(0, n_neurons - 1)
+
+start = perf_counter()
+data = struct.get_data(values, vertex_slice)
+in_bulk = perf_counter() - start
+
+# The same values converted one at a time, as they used to be
+v = RandomDistribution(
+    "uniform", (-70.0, -50.0), rng=NumpyRNG(seed=42)).next(n_neurons)
+tau_m = RandomDistribution(
+    "normal_clipped", mu=20.0, sigma=5.0, low=1.0, high=100.0,
+    rng=NumpyRNG(seed=43)).next(n_neurons)
+start = perf_counter()
+expected = numpy.zeros(n_neurons, dtype=struct.numpy_dtype)
+expected["v"] = [convert_to(value, DataType.S1615) for value in v]
+expected["tau_m"] = [convert_to(value, DataType.S1615) for value in tau_m]
+expected["refract"] = convert_to(20, DataType.UINT32)
+by_value = perf_counter() - start
+
+assert numpy.array_equal(data, expected.view(numpy.uint32))
+print(f"{n_neurons} neurons: by value {by_value:.3f}s, "
+      f"in bulk {in_bulk:.3f}s")
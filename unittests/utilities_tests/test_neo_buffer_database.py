@@ -0,0 +1,128 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+
+import numpy
+import pytest
+
+from spinnman.messages.eieio import EIEIOPrefix, EIEIOType
+from spinnman.messages.eieio.data_messages import (
+    EIEIODataHeader,
+    EIEIODataMessage,
+)
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.neo_buffer_database import (
+    _decode_eieio_spikes,
+    _decode_multi_spikes,
+    _decode_spike_rows,
+    _find_set_bits,
+)
+
+
+def _record(time_step: int, message: EIEIODataMessage) -> bytes:
+    data = message.bytestring
+    return struct.pack("<II", len(data), time_step) + data
+
+
+def test_decode_eieio_spikes() -> None:
+    unittest_setup()
+    short_keys = EIEIODataMessage.create(EIEIOType.KEY_16_BIT)
+    for key in [5, 0xFFFF, 7]:
+        short_keys.add_key(key)
+    full_keys = EIEIODataMessage.create(EIEIOType.KEY_32_BIT)
+    for key in [0x10000, 0xFEDCBA98]:
+        full_keys.add_key(key)
+    prefixed = EIEIODataMessage(EIEIODataHeader(
+        EIEIOType.KEY_32_BIT, prefix=3,
+        prefix_type=EIEIOPrefix.LOWER_HALF_WORD))
+    prefixed.add_key(0x12345678)
+    empty = EIEIODataMessage.create(EIEIOType.KEY_16_BIT)
+    spike_data = (_record(3, short_keys) + _record(4, full_keys) +
+                  _record(4, empty) + _record(9, prefixed))
+
+    keys, time_steps, n_bytes = _decode_eieio_spikes(spike_data)
+    assert list(keys) == [5, 0xFFFF, 7, 0x10000, 0xFEDCBA98, 0x12345678]
+    assert list(time_steps) == [3, 3, 3, 4, 4, 9]
+    assert n_bytes == len(spike_data)
+
+    # A packet cut short is left for when the rest of it has been read
+    keys, time_steps, n_bytes = _decode_eieio_spikes(
+        spike_data + _record(10, short_keys)[:-1])
+    assert list(time_steps) == [3, 3, 3, 4, 4, 9]
+    assert n_bytes == len(spike_data)
+
+    keys, time_steps, n_bytes = _decode_eieio_spikes(b"")
+    assert len(keys) == 0 and len(time_steps) == 0 and n_bytes == 0
+
+
+def test_decode_eieio_payloads() -> None:
+    unittest_setup()
+    message = EIEIODataMessage.create(EIEIOType.KEY_PAYLOAD_32_BIT)
+    message.add_key_and_payload(1, 2)
+    with pytest.raises(ValueError):
+        _decode_eieio_spikes(_record(1, message))
+
+
+def test_find_set_bits() -> None:
+    # 40 neurons over 2 words per row; bits beyond the 40th are padding
+    words = numpy.zeros((3, 2), dtype=numpy.uint32)
+    words[0, 0] = (1 << 0) | (1 << 31)
+    words[1, 1] = (1 << 7) | (1 << 8) | (1 << 31)
+    words[2, 0] = 1 << 5
+    words[2, 1] = 1 << 2
+    rows, indices = _find_set_bits(words, 40)
+    assert list(rows) == [0, 0, 1, 2, 2]
+    assert list(indices) == [0, 31, 39, 5, 34]
+
+    rows, indices = _find_set_bits(numpy.zeros((0, 2), numpy.uint32), 40)
+    assert len(rows) == 0 and len(indices) == 0
+
+
+def test_decode_spike_rows() -> None:
+    # 40 neurons, so a timestamp and 2 words per row
+    words = numpy.array(
+        [[3, 1 << 4, 0], [5, 0, 0], [6, 1, 1 << 7 | 1 << 31]],
+        dtype="<u4")
+    spike_data = words.tobytes()
+    indices, time_steps, n_bytes = _decode_spike_rows(spike_data, 40)
+    assert list(indices) == [4, 0, 39]
+    assert list(time_steps) == [3, 6, 6]
+    assert n_bytes == len(spike_data)
+
+    indices, time_steps, n_bytes = _decode_spike_rows(spike_data[:-1], 40)
+    assert list(indices) == [4]
+    assert list(time_steps) == [3]
+    assert n_bytes == 2 * 3 * 4
+
+
+def test_decode_multi_spikes() -> None:
+    # 40 neurons, so 2 words per block
+    spike_data = (
+        struct.pack("<IIII", 3, 1, 1 << 4, 1 << 7) +
+        struct.pack("<II", 4, 0) +
+        struct.pack("<IIIIII", 6, 2, 1, 0, 1, 1 << 31))
+    indices, time_steps, n_bytes = _decode_multi_spikes(spike_data, 40)
+    assert list(indices) == [4, 39, 0, 0]
+    assert list(time_steps) == [3, 3, 6, 6]
+    assert n_bytes == len(spike_data)
+
+    indices, time_steps, n_bytes = _decode_multi_spikes(spike_data[:-4], 40)
+    assert list(indices) == [4, 39]
+    assert list(time_steps) == [3, 3]
+    assert n_bytes == 16 + 8
+
+    indices, time_steps, n_bytes = _decode_multi_spikes(b"", 40)
+    assert len(indices) == 0 and len(time_steps) == 0 and n_bytes == 0
@@ -0,0 +1,62 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.utilities.ragged_spike_times import RaggedSpikeTimes
+
+
+def test_from_lists() -> None:
+    unittest_setup()
+    lists = [[1, 2], [], [5], [7, 8, 9]]
+    ragged = RaggedSpikeTimes.from_lists(lists)
+    assert len(ragged) == 4
+    assert list(ragged.offsets) == [0, 2, 2, 3, 6]
+    assert [list(times) for times in ragged] == lists
+    assert list(ragged[-1]) == [7, 8, 9]
+    assert list(ragged.neuron_ids) == [0, 0, 2, 3, 3, 3]
+    assert RaggedSpikeTimes.from_lists(ragged) is ragged
+
+
+def test_select() -> None:
+    unittest_setup()
+    ragged = RaggedSpikeTimes([1, 2, 5, 7, 8, 9], [0, 2, 2, 3, 6])
+    assert [list(times) for times in ragged[numpy.array([3, 0, 1])]] == [
+        [7, 8, 9], [1, 2], []]
+    assert [list(times) for times in ragged[1:3]] == [[], [5]]
+    assert [list(times) for times in ragged[::2]] == [[1, 2], [5]]
+    assert len(ragged[3:1]) == 0
+
+    # A run of neurons is a view of the times, rebased to start at 0
+    run = ragged.select(slice(2, 4))
+    assert numpy.shares_memory(run.times, ragged.times)
+    assert list(run.offsets) == [0, 1, 4]
+    run = ragged.select(numpy.array([1, 2, 3]))
+    assert numpy.shares_memory(run.times, ragged.times)
+    assert not numpy.shares_memory(
+        ragged.select(numpy.array([3, 0])).times, ragged.times)
+    ticks = ragged.with_times(ragged.times * 10)
+    assert list(ticks[3]) == [70, 80, 90]
+
+
+def test_bad_offsets() -> None:
+    unittest_setup()
+    with pytest.raises(ConfigurationException):
+        RaggedSpikeTimes([1, 2, 3], [0, 2])
+    with pytest.raises(ConfigurationException):
+        RaggedSpikeTimes([1, 2, 3], [0, 2, 1, 3])
@@ -14,10 +14,15 @@
 
 import os
 import shutil
+import tempfile
 import unittest
 
+import numpy
 from pyNN.random import RandomDistribution
 
+from spinn_front_end_common.interface.ds import DataType
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
 from spynnaker.pyNN.config_setup import unittest_setup
 from spynnaker.pyNN.utilities import utility_calls
 
@@ -58,6 +63,88 @@ class TestUtilityCalls(unittest.TestCase):
         self.assertTrue(hasattr(multi_value, "__iter__"))
         self.assertEqual(len(multi_value), 10)
 
+    def test_convert_to_array(self) -> None:
+        values = numpy.array([-65.5, -0.1, 0.0, 0.3, 12.25, 1000.001])
+        for data_type in [DataType.S1615, DataType.S3231, DataType.INT32,
+                          DataType.FLOAT_32]:
+            converted = utility_calls.convert_to(values, data_type)
+            self.assertEqual(converted.dtype,
+                             numpy.dtype(data_type.struct_encoding))
+            for value, array_value in zip(values, converted):
+                self.assertEqual(
+                    utility_calls.convert_to(float(value), data_type),
+                    array_value)
+        with self.assertRaises(ValueError):
+            utility_calls.convert_to(values, DataType.U1616)
+
+    def test_convert_to_array_range(self) -> None:
+        values = numpy.array([-1.0, -0.5, -2 ** -15, 0.0, 0.999969482421875])
+        for data_type in [DataType.S015, DataType.S1615, DataType.S87]:
+            converted = utility_calls.convert_to(values, data_type)
+            self.assertEqual(
+                [int(utility_calls.convert_to(float(value), data_type))
+                 for value in values], converted.tolist())
+        self.assertEqual(
+            [0, 32768, 65535],
+            utility_calls.convert_to(
+                numpy.array([0.0, 0.5, 0.99998]), DataType.U016).tolist())
+        for data_type, value in [
+                (DataType.S015, -1.5), (DataType.S015, 1.0),
+                (DataType.U1616, -0.5), (DataType.U032, 1.0),
+                (DataType.S1615, 65536.0), (DataType.S1615, float("nan"))]:
+            with self.assertRaises(ValueError):
+                utility_calls.convert_to(numpy.array([0.0, value]), data_type)
+
+    def test_map_spikes_from_binary_file(self) -> None:
+        events = numpy.array(
+            [[0, 3], [0, 7], [2, 1], [3, 4], [3, 5], [5, 9]], dtype="<u4")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            raw_file = os.path.join(tmp_dir, "spikes.bin")
+            events.tofile(raw_file)
+            npy_file = os.path.join(tmp_dir, "spikes.npy")
+            numpy.save(npy_file, events)
+            for spike_file in [raw_file, npy_file]:
+                spikes = utility_calls.map_spikes_from_binary_file(
+                    spike_file, 4)
+                self.assertEqual(
+                    [list(times) for times in spikes],
+                    [[3, 7], [], [1], [4, 5]])
+
+            times_file = os.path.join(tmp_dir, "times.npy")
+            numpy.save(times_file, events[:, 1].copy())
+            offsets_file = os.path.join(tmp_dir, "offsets.bin")
+            numpy.array([0, 2, 2, 3, 5, 5, 6], dtype="<u4").tofile(
+                offsets_file)
+            spikes = utility_calls.map_spikes_from_binary_file(
+                times_file, 6, offsets_file)
+            self.assertEqual(
+                [list(times) for times in spikes],
+                [[3, 7], [], [1], [4, 5], [], [9]])
+            with self.assertRaises(ConfigurationException):
+                utility_calls.map_spikes_from_binary_file(
+                    times_file, 5, offsets_file)
+
+            events[[0, 2]] = events[[2, 0]]
+            events.tofile(raw_file)
+            with self.assertRaises(ConfigurationException):
+                utility_calls.map_spikes_from_binary_file(raw_file, 4)
+
+            # Time steps out of order within a neuron
+            events[[0, 2]] = events[[2, 0]]
+            events[[0, 1]] = events[[1, 0]]
+            events.tofile(raw_file)
+            with self.assertRaises(ConfigurationException):
+                utility_calls.map_spikes_from_binary_file(raw_file, 4)
+            numpy.save(times_file, events[:, 1].copy())
+            with self.assertRaises(ConfigurationException):
+                utility_calls.map_spikes_from_binary_file(
+                    times_file, 6, offsets_file)
+
+            # Half a pair
+            events.ravel()[:-1].tofile(raw_file)
+            with self.assertRaises(ConfigurationException):
+                utility_calls.map_spikes_from_binary_file(raw_file, 4)
+
 
 if __name__ == '__main__':
     unittest.main()